@@ -0,0 +1,104 @@
+"""Benchmark catalog YAML parsing against a synthetic 10k-entry catalog.
+
+Compares the pure-Python SafeLoader, libyaml's CSafeLoader, and the pooled
+streaming parser used by ``mintd data list``.
+
+Usage:
+    python benchmarks/bench_catalog_parse.py [--entries 10000] [--workers N]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from mintd.registry import iter_catalog_summaries, summarize_catalog_entry
+
+
+def make_catalog(catalog_dir: Path, entries: int) -> None:
+    """Write ``entries`` realistic catalog files into ``catalog_dir``."""
+    catalog_dir.mkdir(parents=True, exist_ok=True)
+    for i in range(entries):
+        name = f"synthetic-product-{i:05d}"
+        entry = {
+            "schema_version": "1.0",
+            "mint": {"version": "0.1.0", "commit_hash": "abc1234"},
+            "project": {
+                "name": name,
+                "type": "data",
+                "full_name": f"data_{name}",
+                "created_at": "2025-01-01T00:00:00Z",
+                "created_by": "bench",
+            },
+            "metadata": {
+                "description": f"Synthetic data product number {i} for parser benchmarks",
+                "tags": ["synthetic", f"group-{i % 50}"],
+                "data_dependencies": [],
+            },
+            "ownership": {"team": "lab", "maintainers": ["bench"]},
+            "access_control": {"teams": [{"name": "admins", "permission": "admin"}]},
+            "storage": {
+                "provider": "s3",
+                "bucket": "lab-data",
+                "prefix": f"lab/lab/{name}/",
+                "dvc": {"remote_name": f"data_{name}", "remote_url": f"s3://lab-data/lab/{name}/"},
+            },
+            "repository": {"github_url": f"https://github.com/org/data_{name}", "default_branch": "main"},
+            "status": {"state": "active", "last_updated": "2025-01-01T00:00:00Z"},
+        }
+        with open(catalog_dir / f"data_{name}.yaml", "w") as f:
+            yaml.dump(entry, f, default_flow_style=False, sort_keys=False)
+
+
+def sequential(catalog_dir: Path, loader) -> int:
+    """Parse every file one after another with the given loader."""
+    count = 0
+    for path in sorted(catalog_dir.glob("*.yaml")):
+        with open(path) as f:
+            summarize_catalog_entry(path.stem, yaml.load(f, Loader=loader))
+        count += 1
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="mintd-bench-") as tmp:
+        catalog_dir = Path(tmp) / "catalog" / "data"
+        print(f"Generating {args.entries} catalog entries...")
+        make_catalog(catalog_dir, args.entries)
+
+        results = []
+
+        start = time.perf_counter()
+        sequential(catalog_dir, yaml.SafeLoader)
+        results.append(("SafeLoader, sequential", time.perf_counter() - start, None))
+
+        if hasattr(yaml, "CSafeLoader"):
+            start = time.perf_counter()
+            sequential(catalog_dir, yaml.CSafeLoader)
+            results.append(("CSafeLoader, sequential", time.perf_counter() - start, None))
+        else:
+            print("libyaml not available; skipping CSafeLoader run")
+
+        start = time.perf_counter()
+        first = None
+        for _ in iter_catalog_summaries(catalog_dir, max_workers=args.workers):
+            if first is None:
+                first = time.perf_counter() - start
+        results.append(("iter_catalog_summaries (pooled)", time.perf_counter() - start, first))
+
+    baseline = results[0][1]
+    print(f"\n{'method':<34}{'total (s)':>10}{'first (ms)':>12}{'speedup':>9}")
+    for label, total, first in results:
+        first_ms = f"{first * 1000:.1f}" if first is not None else "-"
+        print(f"{label:<34}{total:>10.2f}{first_ms:>12}{baseline / total:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
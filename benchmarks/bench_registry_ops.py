@@ -0,0 +1,86 @@
+"""Time registry operations end to end against offline local registries.
+
+For each catalog size a local bare registry is generated (see
+``tests/registry_harness.py``) and the common ``LocalRegistry`` operations
+are timed with a fake ``gh`` on PATH, so no network access is needed.
+
+Usage:
+    python benchmarks/bench_registry_ops.py [--sizes 100,1000,10000,50000] [--status-batch 50]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from click.testing import CliRunner
+
+from mintd.cli import main as cli_main
+from mintd.registry import save_pending_registration
+from tests.registry_harness import RegistryHarness, synthetic_metadata
+
+
+def timed(fn):
+    """Run ``fn`` and return the elapsed seconds."""
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def run_size(entries: int, status_batch: int) -> dict:
+    """Build a registry with ``entries`` products and time each operation."""
+    with tempfile.TemporaryDirectory(prefix="mintd-bench-registry-") as tmp:
+        start = time.perf_counter()
+        harness = RegistryHarness(Path(tmp), entries=entries)
+        timings = {"build": time.perf_counter() - start}
+
+        with harness.activate():
+            registry = harness.registry()
+            cached = harness.registry(cache_ttl=300)
+            product = f"data_synthetic-product-{entries // 2:05d}"
+            names = [f"synthetic-product-{i:05d}" for i in range(min(status_batch, entries))]
+
+            timings["query"] = timed(lambda: registry.query_data_product(product))
+            cached.query_data_product(product)
+            timings["query (cached)"] = timed(lambda: cached.query_data_product(product))
+            timings["list"] = timed(registry.list_data_products)
+            timings["status (first)"] = timed(lambda: registry.check_registration_statuses(names))
+            timings["status (mirror)"] = timed(lambda: registry.check_registration_statuses(names))
+            timings["search (index build)"] = timed(lambda: registry.search_data_products("product 42"))
+            timings["search"] = timed(lambda: registry.search_data_products("product 42"))
+            timings["impact"] = timed(lambda: registry.impact("data_synthetic-product-00000"))
+            timings["validate"] = timed(registry.validate_catalog)
+            timings["validate (cached)"] = timed(registry.validate_catalog)
+            timings["register"] = timed(lambda: registry.register_project(synthetic_metadata("bench_new")))
+
+            save_pending_registration(Path(tmp), synthetic_metadata("bench_queued"))
+            timings["sync"] = timed(lambda: CliRunner().invoke(cli_main, ["registry", "sync"]))
+
+        return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100,1000,10000,50000",
+                        help="Comma-separated catalog sizes")
+    parser.add_argument("--status-batch", type=int, default=50,
+                        help="Number of projects per status check")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    results = {}
+    for entries in sizes:
+        print(f"Benchmarking {entries} entries...", flush=True)
+        results[entries] = run_size(entries, args.status_batch)
+
+    operations = list(results[sizes[0]])
+    print(f"\n{'operation (s)':<22}" + "".join(f"{size:>10}" for size in sizes))
+    for operation in operations:
+        print(f"{operation:<22}" + "".join(f"{results[size][operation]:>10.2f}" for size in sizes))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ A Python package that automates the creation of standardized project repositorie
 __version__ = "0.1.0"
 
 from .api import create_project
+from .product_stream import open_product_file
 from .manifest import (
     create_manifest,
     load_manifest,
@@ -19,6 +20,7 @@ from .manifest import (
 
 __all__ = [
     "create_project",
+    "open_product_file",
     "create_manifest",
     "load_manifest",
     "save_manifest",
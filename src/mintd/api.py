@@ -17,7 +17,10 @@ class ProjectResult:
     full_name: str
     project_type: str
     path: Path
+    # Pull request URL; set only when registration ran synchronously
     registration_url: Optional[str] = None
+    # True when registration was queued for the background worker
+    registration_queued: bool = False
 
 
 def create_project(
@@ -186,16 +189,16 @@ def create_project(
         _update_metadata_with_dvc_info(project_path, dvc_info)
 
     # Register project with Data Commons Registry if requested
-    registration_url = None
+    registration_queued = False
     if register_project:
-        registration_url = _register_project(project_path)
+        registration_queued = _register_project(project_path)
 
     return ProjectResult(
         name=name,
         full_name=template.prefix + name,
         project_type=project_type,
         path=project_path,
-        registration_url=registration_url,
+        registration_queued=registration_queued,
     )
 
 
@@ -269,65 +272,50 @@ def _update_metadata_with_dvc_info(project_path: Path, dvc_info: dict) -> None:
         project_path: Path to the project directory
         dvc_info: Dict with remote_name and remote_url
     """
-    import json
-    
+    from .metadata_store import get_metadata_store
+
     metadata_path = project_path / "metadata.json"
     if not metadata_path.exists():
         return
-    
-    try:
-        with open(metadata_path, 'r') as f:
-            metadata = json.load(f)
-        
-        # Ensure storage section exists
-        if "storage" not in metadata:
-            metadata["storage"] = {}
-        
-        # Add/update DVC info
-        metadata["storage"]["dvc"] = {
+
+    def set_dvc_info(metadata: dict) -> None:
+        # Add/update DVC info, creating the storage section if needed
+        metadata.setdefault("storage", {})["dvc"] = {
             "remote_name": dvc_info.get("remote_name", ""),
             "remote_url": dvc_info.get("remote_url", "")
         }
-        
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
-            f.write("\n")  # Trailing newline
-            
+
+    try:
+        get_metadata_store(project_path).update(set_dvc_info)
     except Exception as e:
         print(f"Warning: Could not update metadata.json with DVC info: {e}")
 
 
-def _register_project(project_path: Path) -> Optional[str]:
-    """Register project with Data Commons Registry.
+def _register_project(project_path: Path) -> bool:
+    """Queue the project for registration with the Data Commons Registry.
+
+    The registry clone, push and PR happen in a background
+    ``mintd registry worker`` so project creation does not wait on them.
 
     Args:
         project_path: Path to the created project
 
     Returns:
-        URL of the registration PR, or None if registration failed gracefully
+        True if the registration was queued, False if it could not be
     """
     try:
-        from .registry import get_registry_client, load_project_metadata, save_pending_registration
+        from .registry import load_project_metadata, save_pending_registration, start_registration_worker
 
-        # Load project metadata
         metadata = load_project_metadata(project_path)
-
-        # Create registry client and register
-        client = get_registry_client()
-        pr_url = client.register_project(metadata)
-
-        return pr_url
-
+        save_pending_registration(project_path, metadata)
     except Exception as e:
         # Registration is not critical - don't fail project creation
-        # Save registration request for later retry
-        try:
-            from .registry import load_project_metadata, save_pending_registration
-            metadata = load_project_metadata(project_path)
-            save_pending_registration(project_path, metadata)
-        except Exception:
-            pass
-
-        # Return None to indicate registration didn't happen
-        # The CLI will show appropriate messaging
-        return None
\ No newline at end of file
+        print(f"Warning: Could not queue registration: {e}")
+        return False
+
+    try:
+        start_registration_worker()
+    except Exception:
+        # The registration stays queued for 'mintd registry worker' or 'mintd registry sync'
+        pass
+    return True
\ No newline at end of file
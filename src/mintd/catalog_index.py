@@ -0,0 +1,167 @@
+"""Searchable index over registry catalog entries.
+
+The index holds the product summaries of one registry commit together with
+trigram posting lists over product names, descriptions and tags, and the
+catalog's data-dependency graph. It is built once per registry HEAD, stored
+as JSON beside the registry lookup cache, and answers ``mintd data search``
+queries, "did you mean" suggestions and dependency queries without
+re-reading the catalog.
+"""
+
+import re
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional
+
+# Bumped whenever the on-disk index layout changes
+INDEX_VERSION = 3
+
+# Name prefixes shared by every product of a type; they carry no signal
+_TYPE_PREFIX = re.compile(r"^(data_|prj_|infra_)")
+
+# Minimum name similarity for a product to be offered as a suggestion
+SUGGESTION_THRESHOLD = 0.3
+
+
+def _normalize(text: str) -> str:
+    """Lower-case ``text`` and collapse separators to single spaces."""
+    return " ".join(re.split(r"[\s_\-./]+", str(text).lower())).strip()
+
+
+def trigrams(text: str) -> List[str]:
+    """Return the distinct trigrams of ``text``, padded so short words still match.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        Sorted list of trigrams
+    """
+    grams = set()
+    for word in _normalize(text).split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return sorted(grams)
+
+
+def _name_key(name: str) -> str:
+    """Part of a product name used for matching (type prefix removed)."""
+    return _TYPE_PREFIX.sub("", name)
+
+
+def build_catalog_index(summaries: Iterable[Dict[str, Any]],
+                        dependency_graph: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Build a catalog index from product summaries.
+
+    Args:
+        summaries: Product summaries (see ``registry.summarize_catalog_entry``)
+        dependency_graph: Precomputed dependency graph to store with the index
+            (see ``dependency_graph.build_dependency_graph``)
+
+    Returns:
+        JSON-serializable index with the entries, their trigram postings and
+        the dependency graph
+    """
+    entries = []
+    name_postings = defaultdict(list)
+    text_postings = defaultdict(list)
+    name_sizes = []
+
+    for entry_id, summary in enumerate(summaries):
+        entries.append(summary)
+
+        name_grams = trigrams(_name_key(summary.get("name", "")))
+        name_sizes.append(len(name_grams))
+        for gram in name_grams:
+            name_postings[gram].append(entry_id)
+
+        text = " ".join([str(summary.get("description") or "")] +
+                        [str(tag) for tag in summary.get("tags") or []])
+        for gram in trigrams(text):
+            text_postings[gram].append(entry_id)
+
+    return {
+        "version": INDEX_VERSION,
+        "entries": entries,
+        "name_sizes": name_sizes,
+        "name_trigrams": dict(name_postings),
+        "text_trigrams": dict(text_postings),
+        "dependencies": dependency_graph or {"forward": {}, "reverse": {}, "paths": {}},
+    }
+
+
+def _name_scores(index: Dict[str, Any], query_grams: List[str]) -> Dict[int, float]:
+    """Dice similarity between the query and every product name sharing a trigram."""
+    shared = defaultdict(int)
+    for gram in query_grams:
+        for entry_id in index["name_trigrams"].get(gram, ()):
+            shared[entry_id] += 1
+
+    sizes = index["name_sizes"]
+    return {
+        entry_id: 2.0 * count / (len(query_grams) + sizes[entry_id])
+        for entry_id, count in shared.items()
+    }
+
+
+def search_catalog_index(index: Dict[str, Any], query: str, limit: int = 10) -> List[Dict[str, Any]]:
+    """Rank catalog entries against a free-text query.
+
+    Name similarity dominates; matches in descriptions and tags add a
+    smaller boost, and a query contained verbatim in a name ranks first.
+
+    Args:
+        index: Index from ``build_catalog_index``
+        query: Search text
+        limit: Maximum number of results
+
+    Returns:
+        Matching product summaries, best first, each with a ``score`` key
+    """
+    query_grams = trigrams(query)
+    if not query_grams:
+        return []
+
+    scores = _name_scores(index, query_grams)
+
+    text_hits = defaultdict(int)
+    for gram in query_grams:
+        for entry_id in index["text_trigrams"].get(gram, ()):
+            text_hits[entry_id] += 1
+    for entry_id, count in text_hits.items():
+        scores[entry_id] = scores.get(entry_id, 0.0) + 0.5 * count / len(query_grams)
+
+    needle = _normalize(query)
+    entries = index["entries"]
+    for entry_id in scores:
+        if needle and needle in _normalize(entries[entry_id].get("name", "")):
+            scores[entry_id] += 1.0
+
+    ranked = sorted(scores.items(), key=lambda item: (-item[1], entries[item[0]].get("name", "")))
+    return [dict(entries[entry_id], score=round(score, 3)) for entry_id, score in ranked[:limit]]
+
+
+def suggest_names(index: Dict[str, Any], name: str, limit: int = 5,
+                  threshold: Optional[float] = None) -> List[str]:
+    """Return product names similar to ``name``, most similar first.
+
+    Args:
+        index: Index from ``build_catalog_index``
+        name: Product name that was not found
+        limit: Maximum number of suggestions
+        threshold: Minimum name similarity (default: SUGGESTION_THRESHOLD)
+
+    Returns:
+        List of product names
+    """
+    query_grams = trigrams(_name_key(name))
+    if not query_grams:
+        return []
+
+    threshold = SUGGESTION_THRESHOLD if threshold is None else threshold
+    entries = index["entries"]
+    ranked = sorted(
+        ((score, entries[entry_id]["name"]) for entry_id, score in _name_scores(index, query_grams).items()
+         if score >= threshold),
+        key=lambda item: (-item[0], item[1])
+    )
+    return [entry_name for _, entry_name in ranked[:limit]]
@@ -0,0 +1,235 @@
+"""Schema validation for registry catalog entries.
+
+The catalog schema is written in a small subset of JSON Schema (``type``,
+``required``, ``properties``, ``items``, ``minItems``, ``enum``, ``const``,
+``pattern`` and ``contains``) and compiled once into nested closures, so
+validating an entry does no schema interpretation. Worker processes compile
+it once on import and then validate any number of entries.
+"""
+
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import yaml
+
+# Catalogs smaller than this are validated inline; process startup would dominate.
+PARALLEL_VALIDATE_THRESHOLD = 256
+
+CATALOG_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "required": ["project", "metadata", "ownership", "access_control", "status"],
+    "properties": {
+        "schema_version": {"type": "string"},
+        "project": {
+            "type": "object",
+            "required": ["name", "type", "full_name"],
+            "properties": {
+                "name": {"type": "string", "pattern": r"^[A-Za-z0-9][A-Za-z0-9_.-]*$"},
+                "type": {"enum": ["data", "project", "infra"]},
+                "full_name": {"type": "string", "pattern": r"^(data_|prj_|infra_)"},
+                "created_at": {"type": "string"},
+                "created_by": {"type": "string"},
+            },
+        },
+        "metadata": {
+            "type": "object",
+            "properties": {
+                "description": {"type": "string"},
+                "tags": {"type": "array", "items": {"type": "string"}},
+                "data_dependencies": {"type": "array", "items": {"type": "object"}},
+            },
+        },
+        "ownership": {"type": "object"},
+        "access_control": {
+            "type": "object",
+            "required": ["teams"],
+            "properties": {
+                "teams": {
+                    "type": "array",
+                    "minItems": 1,
+                    "items": {
+                        "type": "object",
+                        "required": ["name", "permission"],
+                        "properties": {
+                            "name": {"type": "string"},
+                            "permission": {"enum": ["read", "write", "admin"]},
+                        },
+                    },
+                    "contains": {"required": ["permission"], "properties": {"permission": {"const": "admin"}}},
+                },
+            },
+        },
+        "status": {
+            "type": "object",
+            "properties": {"state": {"type": "string"}},
+        },
+        "storage": {"type": "object"},
+        "repository": {
+            "type": "object",
+            "properties": {"github_url": {"type": "string"}},
+        },
+    },
+}
+
+_TYPES: Dict[str, Tuple[type, ...]] = {
+    "object": (dict,),
+    "array": (list,),
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+}
+
+Validator = Callable[[Any, str], List[str]]
+
+
+def compile_schema(schema: Dict[str, Any]) -> Validator:
+    """Compile a schema into a validator function.
+
+    Args:
+        schema: Schema in the supported JSON Schema subset
+
+    Returns:
+        Function ``(instance, path) -> errors`` returning human-readable
+        error messages (an empty list when the instance is valid)
+    """
+    checks: List[Validator] = []
+
+    if "type" in schema:
+        expected = _TYPES[schema["type"]]
+        type_name = schema["type"]
+
+        def check_type(value: Any, path: str) -> List[str]:
+            if isinstance(value, bool) and bool not in expected:
+                return [f"{path}: expected {type_name}, got boolean"]
+            if not isinstance(value, expected):
+                return [f"{path}: expected {type_name}, got {type(value).__name__}"]
+            return []
+        checks.append(check_type)
+
+    if "enum" in schema:
+        allowed = schema["enum"]
+        checks.append(lambda value, path: [] if value in allowed else
+                      [f"{path}: {value!r} is not one of {allowed}"])
+
+    if "const" in schema:
+        const = schema["const"]
+        checks.append(lambda value, path: [] if value == const else [f"{path}: expected {const!r}"])
+
+    if "pattern" in schema:
+        regex = re.compile(schema["pattern"])
+        checks.append(lambda value, path: [] if not isinstance(value, str) or regex.search(value) else
+                      [f"{path}: {value!r} does not match {regex.pattern}"])
+
+    if "required" in schema:
+        required = schema["required"]
+        checks.append(lambda value, path: [] if not isinstance(value, dict) else
+                      [f"{path}: missing required field '{field}'" for field in required if field not in value])
+
+    if "properties" in schema:
+        properties = {name: compile_schema(sub) for name, sub in schema["properties"].items()}
+
+        def check_properties(value: Any, path: str) -> List[str]:
+            if not isinstance(value, dict):
+                return []
+            errors = []
+            for name, validate in properties.items():
+                if name in value:
+                    errors.extend(validate(value[name], f"{path}.{name}"))
+            return errors
+        checks.append(check_properties)
+
+    if "minItems" in schema:
+        min_items = schema["minItems"]
+        checks.append(lambda value, path: [] if not isinstance(value, list) or len(value) >= min_items else
+                      [f"{path}: must contain at least {min_items} item(s)"])
+
+    if "items" in schema:
+        validate_item = compile_schema(schema["items"])
+
+        def check_items(value: Any, path: str) -> List[str]:
+            if not isinstance(value, list):
+                return []
+            errors = []
+            for i, item in enumerate(value):
+                errors.extend(validate_item(item, f"{path}[{i}]"))
+            return errors
+        checks.append(check_items)
+
+    if "contains" in schema:
+        validate_contained = compile_schema(schema["contains"])
+        description = json.dumps(schema["contains"])
+
+        def check_contains(value: Any, path: str) -> List[str]:
+            if not isinstance(value, list) or not value:
+                return []
+            if any(not validate_contained(item, path) for item in value):
+                return []
+            return [f"{path}: no item matches {description}"]
+        checks.append(check_contains)
+
+    def validate(value: Any, path: str = "$") -> List[str]:
+        errors: List[str] = []
+        for check in checks:
+            errors.extend(check(value, path))
+        return errors
+
+    return validate
+
+
+# Compiled once per process (including each pool worker, on import)
+_VALIDATE_ENTRY = compile_schema(CATALOG_SCHEMA)
+
+# Changes whenever the schema does, invalidating cached validation results
+SCHEMA_FINGERPRINT = hashlib.sha1(json.dumps(CATALOG_SCHEMA, sort_keys=True).encode()).hexdigest()
+
+
+def validate_catalog_entry(entry: Any) -> List[str]:
+    """Validate a parsed catalog entry against ``CATALOG_SCHEMA``.
+
+    Returns:
+        List of error messages (empty if the entry is valid)
+    """
+    return _VALIDATE_ENTRY(entry, "$")
+
+
+def _validate_blob(item: Tuple[str, bytes]) -> Tuple[str, Dict[str, Any]]:
+    """Parse and validate one ``(blob_sha, yaml bytes)`` pair.
+
+    Module-level so it can be shipped to worker processes.
+    """
+    blob_sha, data = item
+    try:
+        entry = yaml.load(data, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    except yaml.YAMLError as e:
+        return blob_sha, {"errors": [f"$: invalid YAML: {str(e).splitlines()[0]}"], "type": None}
+
+    project = entry.get("project") if isinstance(entry, dict) else None
+    project_type = project.get("type") if isinstance(project, dict) else None
+    return blob_sha, {"errors": validate_catalog_entry(entry), "type": project_type}
+
+
+def validate_catalog_blobs(blobs: Iterable[Tuple[str, bytes]],
+                           max_workers: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+    """Validate many catalog blobs, across a process pool when there are enough.
+
+    Args:
+        blobs: ``(blob_sha, yaml bytes)`` pairs
+        max_workers: Worker process count (default: CPU count; 1 disables the pool)
+
+    Returns:
+        Dictionary mapping blob SHA to ``{"errors": [...], "type": project type}``
+    """
+    items = [item for item in blobs]
+    workers = max_workers or os.cpu_count() or 1
+
+    if len(items) < PARALLEL_VALIDATE_THRESHOLD or workers <= 1:
+        return dict(_validate_blob(item) for item in items)
+
+    chunksize = max(1, len(items) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return dict(pool.map(_validate_blob, items, chunksize=chunksize))
@@ -8,6 +8,13 @@ from rich.console import Console
 console = Console()
 
 
+def _print_registration(result) -> None:
+    """Tell the user a created project's registration was queued."""
+    if result.registration_queued:
+        console.print("   Registration queued; submitting in the background "
+                      "(see 'mintd registry worker --list')", style="dim")
+
+
 @click.group()
 @click.version_option(version="1.0.0")
 def main():
@@ -92,8 +99,7 @@ def data(name: str, path: str, lang: str, no_git: bool, no_dvc: bool, bucket: st
             console.print(f"✅ Created: {result.full_name}", style="green")
             console.print(f"   Location: {result.path}", style="dim")
 
-            if register and result.registration_url:
-                console.print(f"   Registration PR: {result.registration_url}", style="dim")
+            _print_registration(result)
         except Exception as e:
             console.print(f"❌ Error: {e}", style="red")
             raise click.Abort()
@@ -132,8 +138,7 @@ def project(name: str, path: str, lang: str, no_git: bool, no_dvc: bool, bucket:
             console.print(f"✅ Created: {result.full_name}", style="green")
             console.print(f"   Location: {result.path}", style="dim")
 
-            if register and result.registration_url:
-                console.print(f"   Registration PR: {result.registration_url}", style="dim")
+            _print_registration(result)
         except Exception as e:
             console.print(f"❌ Error: {e}", style="red")
             raise click.Abort()
@@ -172,8 +177,7 @@ def infra(name: str, path: str, lang: str, no_git: bool, no_dvc: bool, bucket: s
             console.print(f"✅ Created: {result.full_name}", style="green")
             console.print(f"   Location: {result.path}", style="dim")
 
-            if register and result.registration_url:
-                console.print(f"   Registration PR: {result.registration_url}", style="dim")
+            _print_registration(result)
         except Exception as e:
             console.print(f"❌ Error: {e}", style="red")
             raise click.Abort()
@@ -281,8 +285,7 @@ def custom(template_name: str, name: str, path: str, lang: str, no_git: bool, no
             console.print(f"✅ Created: {result.full_name}", style="green")
             console.print(f"   Location: {result.path}", style="dim")
 
-            if register and result.registration_url:
-                console.print(f"   Registration PR: {result.registration_url}", style="dim")
+            _print_registration(result)
         except Exception as e:
             console.print(f"❌ Error: {e}", style="red")
             raise click.Abort()
@@ -342,8 +345,8 @@ def update():
 @click.option("--mirror-url", help="Mirror repository URL for external collaboration")
 def metadata(path, sensitivity, mirror_url):
     """Update metadata.json to latest schema with new fields."""
-    import json
-    
+    from .metadata_store import get_metadata_store
+
     project_path = Path(path) if path else Path.cwd()
     metadata_path = project_path / "metadata.json"
     
@@ -353,9 +356,9 @@ def metadata(path, sensitivity, mirror_url):
         raise click.Abort()
     
     # Load existing metadata to get current values for prompts
+    store = get_metadata_store(project_path)
     try:
-        with open(metadata_path, 'r') as f:
-            metadata_data = json.load(f)
+        metadata_data = store.read()
     except Exception as e:
         console.print(f"❌ Failed to read metadata.json: {e}", style="red")
         raise click.Abort()
@@ -379,25 +382,23 @@ def metadata(path, sensitivity, mirror_url):
             default=current_mirror_url
         )
     
-    # Now do the update inside the status spinner
+    # Now do the update inside the status spinner, re-reading the file under
+    # the metadata lock so changes made while prompting are kept
     with console.status("Updating metadata.json..."):
         try:
-            # Update metadata with new fields
-            if "storage" not in metadata_data:
-                metadata_data["storage"] = {}
-            metadata_data["storage"]["sensitivity"] = sensitivity
-
-            if mirror_url.strip():
-                if "repository" not in metadata_data:
-                    metadata_data["repository"] = {}
-                if "mirror" not in metadata_data["repository"]:
-                    metadata_data["repository"]["mirror"] = {}
-                metadata_data["repository"]["mirror"]["url"] = mirror_url.strip()
-                metadata_data["repository"]["mirror"]["purpose"] = "external_collaboration"
-
-            # Write updated metadata
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata_data, f, indent=2)
+            with store.edit() as metadata_data:
+                # Update metadata with new fields
+                if "storage" not in metadata_data:
+                    metadata_data["storage"] = {}
+                metadata_data["storage"]["sensitivity"] = sensitivity
+
+                if mirror_url.strip():
+                    if "repository" not in metadata_data:
+                        metadata_data["repository"] = {}
+                    if "mirror" not in metadata_data["repository"]:
+                        metadata_data["repository"]["mirror"] = {}
+                    metadata_data["repository"]["mirror"]["url"] = mirror_url.strip()
+                    metadata_data["repository"]["mirror"]["purpose"] = "external_collaboration"
 
         except Exception as e:
             console.print(f"❌ Failed to update metadata: {e}", style="red")
@@ -534,8 +535,7 @@ def utils(path):
 
     with console.status("Updating utility scripts..."):
         try:
-            from .registry import load_project_metadata
-            import json
+            from .metadata_store import get_metadata_store
 
             # Load existing metadata to get project info
             metadata_path = project_path / "metadata.json"
@@ -543,8 +543,8 @@ def utils(path):
                 console.print("❌ metadata.json not found. Are you in a mintd project directory?", style="red")
                 raise click.Abort()
 
-            with open(metadata_path, 'r') as f:
-                metadata = json.load(f)
+            store = get_metadata_store(project_path)
+            metadata = store.read()
 
             # Extract project info
             project_name = metadata["project"]["name"]
@@ -556,14 +556,12 @@ def utils(path):
             mint_info = BaseTemplate._get_mint_info()
 
             # Update metadata with new mint version
-            metadata["mint"] = {
-                "version": mint_info["mint_version"],
-                "commit_hash": mint_info["mint_hash"]
-            }
-
-            # Write updated metadata
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            def set_mint_version(data):
+                data["mint"] = {
+                    "version": mint_info["mint_version"],
+                    "commit_hash": mint_info["mint_hash"]
+                }
+            store.update(set_mint_version)
 
             console.print(f"✅ Updated mintd version in metadata.json to {mint_info['mint_version']}")
 
@@ -687,8 +685,16 @@ def show():
 @registry.command()
 @click.option("--path", "-p", type=click.Path(exists=True, path_type=Path),
               help="Path to project directory (defaults to current directory)")
-def register(path):
+@click.option("--recursive", "-r", "root", type=click.Path(exists=True, file_okay=False, path_type=Path),
+              help="Register every unregistered mintd project found under this directory in one PR")
+@click.option("--workers", type=int, default=None, help="Validation processes for --recursive (default: CPU count)")
+@click.option("--dry-run", is_flag=True, help="With --recursive, report what would be registered without submitting")
+def register(path, root, workers, dry_run):
     """Register a project with the Data Commons Registry."""
+    if root is not None:
+        _register_recursive(root, workers, dry_run)
+        return
+
     project_path = Path(path) if path else Path.cwd()
 
     with console.status("Registering project with Data Commons Registry..."):
@@ -737,29 +743,87 @@ def register(path):
                     pass
 
 
+def _register_recursive(root: Path, workers, dry_run: bool) -> None:
+    """Discover, validate and bulk-register the mintd projects under ``root``."""
+    from rich.table import Table
+    from .registry import discover_local_projects, get_registry_client, prepare_registrations
+
+    projects = discover_local_projects(root)
+    if not projects:
+        console.print(f"No mintd projects found under {root}")
+        return
+
+    with console.status(f"Validating {len(projects)} projects..."):
+        prepared = prepare_registrations(projects, max_workers=workers)
+
+    try:
+        client = get_registry_client()
+        valid_names = [p["name"] for p in prepared if not p["errors"]]
+        with console.status("Checking registry..."):
+            statuses = client.check_registration_statuses(valid_names) if valid_names else {}
+    except Exception as e:
+        console.print(f"❌ Could not check registration status: {e}", style="red")
+        raise click.Abort()
+
+    table = Table(title=f"mintd projects under {root}")
+    table.add_column("Project", style="cyan")
+    table.add_column("Path")
+    table.add_column("Result")
+    to_register = []
+    counts = {"registered": 0, "pending": 0, "invalid": 0}
+    for item in prepared:
+        status = statuses.get(item["name"], {})
+        if item["errors"]:
+            counts["invalid"] += 1
+            result = f"[red]invalid: {item['errors'][0]}[/red]"
+        elif status.get("registered"):
+            counts["registered"] += 1
+            result = "[green]registered[/green]"
+        elif status.get("pending_pr"):
+            counts["pending"] += 1
+            result = f"[yellow]pending[/yellow] {status['pending_pr']}"
+        else:
+            to_register.append(item)
+            result = "to register" if dry_run else "submitting"
+        table.add_row(item["name"] or "?", item["path"], result)
+    console.print(table)
+
+    console.print(f"📊 {len(prepared)} projects: {counts['registered']} registered, {counts['pending']} pending, "
+                  f"{counts['invalid']} invalid, {len(to_register)} to register")
+    if dry_run or not to_register:
+        return
+
+    try:
+        pr_url = client.register_projects(to_register)
+    except Exception as e:
+        console.print(f"❌ Bulk registration failed: {e}", style="red")
+        raise click.Abort()
+    console.print(f"✅ Registration PR for {len(to_register)} projects: {pr_url}")
+
+
 @registry.command()
-@click.argument("project_name")
-def status(project_name):
-    """Check registration status of a project."""
-    with console.status(f"Checking registration status for '{project_name}'..."):
+@click.argument("project_names", nargs=-1)
+@click.option("--all-local", is_flag=True, help="Check every mintd project found under --root")
+@click.option("--root", type=click.Path(exists=True, file_okay=False, path_type=Path), default=".",
+              help="Directory searched by --all-local (default: current directory)")
+def status(project_names, all_local, root):
+    """Check registration status of one or more projects."""
+    names = [name for name in project_names]
+    if all_local:
+        from .registry import discover_local_projects
+        names.extend(metadata["project"]["name"] for _, metadata in discover_local_projects(root))
+    names = sorted(set(names), key=names.index)
+
+    if not names:
+        console.print("❌ Give at least one project name, or use --all-local", style="red")
+        raise click.Abort()
+
+    with console.status(f"Checking registration status for {len(names)} project(s)..."):
         try:
             from .registry import get_registry_client
 
             client = get_registry_client()
-            status_info = client.check_registration_status(project_name)
-
-            if status_info.get("registered"):
-                console.print(f"✅ Project '{project_name}' is registered")
-                console.print(f"   Type: {status_info['type']}")
-                console.print(f"   Full Name: {status_info['full_name']}")
-                console.print(f"   Registry URL: {status_info['url']}")
-            elif status_info.get("pending_pr"):
-                console.print(f"⏳ Project '{project_name}' has a pending registration PR")
-                console.print(f"   PR: {status_info['pending_pr']}")
-                console.print(f"   Title: {status_info['pr_title']}")
-            else:
-                console.print(f"❌ Project '{project_name}' is not registered")
-                console.print("   Run 'mintd register --path /path/to/project' to register it.")
+            statuses = client.check_registration_statuses(names)
 
         except Exception as e:
             error_msg = str(e)
@@ -768,6 +832,221 @@ def status(project_name):
                 console.print("   or configure registry.url in ~/.mintd/config.yaml")
             else:
                 console.print(f"❌ Status check failed: {e}")
+            return
+
+    if len(names) == 1:
+        project_name = names[0]
+        status_info = statuses[project_name]
+        if status_info.get("registered"):
+            console.print(f"✅ Project '{project_name}' is registered")
+            console.print(f"   Type: {status_info['type']}")
+            console.print(f"   Full Name: {status_info['full_name']}")
+            console.print(f"   Registry URL: {status_info['url']}")
+        elif status_info.get("pending_pr"):
+            console.print(f"⏳ Project '{project_name}' has a pending registration PR")
+            console.print(f"   PR: {status_info['pending_pr']}")
+            console.print(f"   Title: {status_info['pr_title']}")
+        else:
+            console.print(f"❌ Project '{project_name}' is not registered")
+            console.print("   Run 'mintd register --path /path/to/project' to register it.")
+        return
+
+    from rich.table import Table
+
+    table = Table(title="Registration Status")
+    table.add_column("Project", style="cyan")
+    table.add_column("Status")
+    table.add_column("Details", style="dim")
+
+    counts = {"registered": 0, "pending": 0, "not registered": 0}
+    for project_name in names:
+        status_info = statuses[project_name]
+        if status_info.get("registered"):
+            counts["registered"] += 1
+            table.add_row(project_name, "[green]registered[/green]", status_info["full_name"])
+        elif status_info.get("pending_pr"):
+            counts["pending"] += 1
+            table.add_row(project_name, "[yellow]pending[/yellow]", status_info["pending_pr"])
+        else:
+            counts["not registered"] += 1
+            table.add_row(project_name, "[red]not registered[/red]", "")
+
+    console.print(table)
+    console.print(", ".join(f"{count} {label}" for label, count in counts.items()))
+
+
+@registry.command()
+@click.option("--since", required=True, help="Registry commit SHA last processed")
+@click.option("--until", default=None, help="Commit to compare against (default: registry HEAD)")
+@click.option("--json", "as_json", is_flag=True, help="Print changes (with entries) as JSON")
+def changes(since, until, as_json):
+    """Show catalog entries added, modified or removed since a registry commit."""
+    import json
+    from .registry import get_registry_client
+
+    try:
+        client = get_registry_client()
+        delta = client.catalog_changes(since, until=until, include_entries=as_json)
+    except Exception as e:
+        console.print(f"❌ Could not compute registry changes: {e}", style="red")
+        raise click.Abort()
+
+    if as_json:
+        click.echo(json.dumps(delta, indent=2, default=str))
+        return
+
+    markers = {"added": ("+", "green"), "modified": ("~", "yellow"), "removed": ("-", "red")}
+    for kind, (marker, style) in markers.items():
+        for item in delta[kind]:
+            console.print(f"{marker} {item['type']:<8} {item['name']}", style=style)
+
+    total = sum(len(delta[kind]) for kind in markers)
+    if not total:
+        console.print("✅ No catalog changes.")
+    console.print(f"📍 {delta['from'][:12]}..{delta['to'][:12]}: {len(delta['added'])} added, "
+                  f"{len(delta['modified'])} modified, {len(delta['removed'])} removed")
+    console.print(f"   Next sync: mintd registry changes --since {delta['to']}", soft_wrap=True)
+
+
+@registry.command()
+@click.option("--ref", default=None, help="Registry commit or branch to validate (default: HEAD)")
+@click.option("--workers", type=int, default=None, help="Validation processes (default: CPU count)")
+@click.option("--show-valid", is_flag=True, help="List valid entries as well")
+def validate(ref, workers, show_valid):
+    """Validate every catalog entry in the registry against the catalog schema."""
+    import time
+    from .registry import get_registry_client
+
+    start = time.perf_counter()
+    try:
+        client = get_registry_client()
+        results = client.validate_catalog(ref=ref, max_workers=workers)
+    except Exception as e:
+        console.print(f"❌ Validation failed to run: {e}", style="red")
+        raise click.Abort()
+    elapsed = time.perf_counter() - start
+
+    invalid = {path: errors for path, errors in results.items() if errors}
+    for path, errors in results.items():
+        if errors:
+            console.print(f"❌ {path}", style="red")
+            for error in errors:
+                console.print(f"   {error}")
+        elif show_valid:
+            console.print(f"✅ {path}")
+
+    console.print(f"\n📊 {len(results)} entries checked in {elapsed:.2f}s: "
+                  f"{len(results) - len(invalid)} valid, {len(invalid)} invalid")
+    if invalid:
+        raise click.Abort()
+
+
+@registry.command()
+@click.argument("product_name")
+@click.option("--transitive", "-t", is_flag=True, help="Include indirect dependents")
+def dependents(product_name, transitive):
+    """List catalog entries that depend on a data product."""
+    from .registry import get_registry_client
+
+    try:
+        client = get_registry_client()
+        results = client.dependents(product_name, transitive=transitive)
+    except Exception as e:
+        console.print(f"❌ Dependency lookup failed: {e}", style="red")
+        raise click.Abort()
+
+    if not results:
+        console.print(f"No catalog entries depend on {product_name}.")
+        return
+
+    for item in results:
+        via = f"  (via {item['via']})" if item["depth"] > 1 else ""
+        console.print(f"  {'  ' * (item['depth'] - 1)}{item['name']}{via}")
+    console.print(f"\n📊 {len(results)} dependent(s) of {product_name}")
+
+
+@registry.command()
+@click.argument("product_name")
+def impact(product_name):
+    """Show everything affected by a new release of a data product."""
+    from .registry import get_registry_client
+
+    try:
+        client = get_registry_client()
+        report = client.impact(product_name)
+    except Exception as e:
+        console.print(f"❌ Impact analysis failed: {e}", style="red")
+        raise click.Abort()
+
+    affected = report["dependents"]
+    if not affected:
+        console.print(f"✅ Nothing in the catalog depends on {product_name}.")
+        return
+
+    console.print(f"💥 Releasing {product_name} affects {len(affected)} catalog entries:")
+    for depth in sorted({item["depth"] for item in affected}):
+        names = [item["name"] for item in affected if item["depth"] == depth]
+        label = "direct" if depth == 1 else f"{depth} hops"
+        console.print(f"\n  {label} ({len(names)}):")
+        for name in names:
+            console.print(f"    {name}")
+    console.print(f"\n📊 {len(report['projects'])} project(s) to rerun")
+
+
+@registry.group()
+def snapshot():
+    """Export or import offline catalog snapshots."""
+
+
+@snapshot.command("export")
+@click.argument("output", required=False, type=click.Path(path_type=Path))
+def snapshot_export(output):
+    """Write the catalog and its index to a single compressed bundle."""
+    from .registry import get_registry_client
+
+    try:
+        client = get_registry_client()
+        with console.status("Exporting registry snapshot..."):
+            manifest = client.export_snapshot(output)
+    except Exception as e:
+        console.print(f"❌ Snapshot export failed: {e}", style="red")
+        raise click.Abort()
+
+    output = Path(manifest["path"])
+    size_mb = output.stat().st_size / (1024 * 1024)
+    console.print(f"✅ Wrote {output} ({manifest['entries']} catalog files, {size_mb:.1f} MB)")
+    console.print(f"   Registry commit: {manifest['sha']}", soft_wrap=True)
+    console.print(f"   Load it with: mintd registry snapshot import {output}", soft_wrap=True)
+
+
+@snapshot.command("import")
+@click.argument("bundle", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+def snapshot_import(bundle):
+    """Serve registry reads from a snapshot bundle, without network access."""
+    from .registry_snapshot import import_snapshot_bundle
+
+    try:
+        manifest = import_snapshot_bundle(bundle)
+    except (OSError, ValueError) as e:
+        console.print(f"❌ Snapshot import failed: {e}", style="red")
+        raise click.Abort()
+
+    console.print(f"✅ Imported registry snapshot of {manifest.get('registry_url', 'unknown registry')}", soft_wrap=True)
+    console.print(f"   Commit {manifest['sha'][:12]}, taken {manifest['created_at']}, "
+                  f"{manifest['entries']} catalog files")
+    console.print("   Registry lookups now read from this snapshot. "
+                  "Run 'mintd registry snapshot clear' to go back online.")
+
+
+@snapshot.command("clear")
+def snapshot_clear():
+    """Remove the imported snapshot so registry reads go online again."""
+    from .registry_snapshot import clear_snapshot
+
+    if clear_snapshot():
+        console.print("✅ Registry snapshot removed.")
+    else:
+        console.print("No registry snapshot is imported.")
 
 
 @registry.command()
@@ -782,10 +1061,19 @@ def update(project_name, description, add_tag, remove_tag):
     console.print("   For now, updates must be made directly in the registry repository.")
 
 
+def _print_registration_result(job, pr_url, error):
+    """Report one finished queued registration."""
+    if error:
+        console.print(f"❌ Failed to register {job['full_name']}: {error}")
+    else:
+        console.print(f"✅ Registered {job['full_name']}: {pr_url}")
+
+
 @registry.command()
-def sync():
-    """Process pending registrations that were saved for offline mode."""
-    from .registry import get_pending_registrations, RegistryClient, clear_pending_registration
+@click.option("--workers", type=int, default=4, show_default=True, help="Registrations submitted at once")
+def sync(workers):
+    """Process pending registrations now, including any still backing off."""
+    from .registry import get_pending_registrations, process_pending_registrations
 
     pending = get_pending_registrations()
 
@@ -794,30 +1082,56 @@ def sync():
         return
 
     console.print(f"Found {len(pending)} pending registration(s). Processing...")
+    counts = process_pending_registrations(max_workers=workers, force=True,
+                                           on_result=_print_registration_result)
 
-    successful = 0
-    failed = 0
+    console.print(f"\n📊 Summary: {counts['submitted']} successful, {counts['failed']} failed")
+    if counts["failed"] > 0:
+        console.print("Failed registrations remain in queue and will be retried with backoff.")
 
-    for item in pending:
-        project_name = item["metadata"]["project"]["full_name"]
-        console.print(f"Processing: {project_name}")
 
-        try:
-            from .registry import get_registry_client
-            client = get_registry_client()
-            pr_url = client.register_project(item["metadata"])
+@registry.command()
+@click.option("--workers", type=int, default=4, show_default=True, help="Registrations submitted at once")
+@click.option("--watch", is_flag=True, help="Keep running until the queue is empty, waiting out retry backoff")
+@click.option("--list", "show_queue", is_flag=True, help="Show the queue instead of processing it")
+def worker(workers, watch, show_queue):
+    """Submit queued registrations that are due, several at a time."""
+    import time
+    from datetime import datetime
+    from .registry import get_pending_registrations, process_pending_registrations
+
+    if show_queue:
+        from rich.table import Table
+
+        pending = get_pending_registrations()
+        if not pending:
+            console.print("✅ Registration queue is empty.")
+            return
+        table = Table(title="Queued Registrations")
+        table.add_column("Project", style="cyan")
+        table.add_column("Attempts", justify="right")
+        table.add_column("Next attempt")
+        table.add_column("Last error", style="red")
+        for job in pending:
+            due = datetime.fromtimestamp(job["next_attempt_at"]).strftime("%Y-%m-%d %H:%M:%S")
+            table.add_row(job["full_name"], str(job["attempts"]), due, job["last_error"] or "")
+        console.print(table)
+        return
 
-            console.print(f"✅ Registered: {pr_url}")
-            clear_pending_registration(project_name)
-            successful += 1
+    totals = {"submitted": 0, "failed": 0}
+    while True:
+        counts = process_pending_registrations(max_workers=workers, on_result=_print_registration_result)
+        totals = {key: totals[key] + counts[key] for key in totals}
 
-        except Exception as e:
-            console.print(f"❌ Failed to register {project_name}: {e}")
-            failed += 1
+        pending = get_pending_registrations()
+        if not watch or not pending:
+            break
+        wait = max(1.0, min(job["next_attempt_at"] for job in pending) - time.time())
+        console.print(f"⏳ {len(pending)} registration(s) waiting; next attempt in {wait:.0f}s")
+        time.sleep(wait)
 
-    console.print(f"\n📊 Summary: {successful} successful, {failed} failed")
-    if failed > 0:
-        console.print("Failed registrations remain in queue. Try again later.")
+    console.print(f"📊 {totals['submitted']} submitted, {totals['failed']} failed, "
+                  f"{len(pending)} still queued")
 
 
 @config.command()
@@ -871,8 +1185,16 @@ def data():
 @click.option("--destination", "-d", help="Local destination directory")
 @click.option("--stage", help="Pipeline stage to pull (e.g., final, clean)")
 @click.option("--path", help="Specific path to pull from the product")
-def pull(product_name, destination, stage, path):
-    """Pull/download data from a registered data product."""
+@click.option("--jobs", "-j", type=click.IntRange(min=1), help="Parallel download jobs (default: DVC's default)")
+@click.option("--include", multiple=True, help="Only pull files matching this glob, e.g. 'year=2023/*' (repeatable)")
+@click.option("--exclude", multiple=True, help="Skip files matching this glob (repeatable)")
+def pull(product_name, destination, stage, path, jobs, include, exclude):
+    """Pull/download data from a registered data product.
+
+    --include and --exclude patterns are relative to the stage (or --path)
+    directory and are matched against its DVC listing, so only matching
+    files are downloaded.
+    """
     from pathlib import Path
     from .data_import import pull_data_product
 
@@ -885,7 +1207,10 @@ def pull(product_name, destination, stage, path):
             product_name=product_name,
             destination=destination,
             stage=stage,
-            path=path
+            path=path,
+            jobs=jobs,
+            include=[*include],
+            exclude=[*exclude]
         )
 
         if not success:
@@ -896,57 +1221,277 @@ def pull(product_name, destination, stage, path):
         raise click.Abort()
 
 
-@data.command(name="import")
+@data.command(name="open")
 @click.argument("product_name")
+@click.argument("path")
+@click.option("--rev", help="Git revision of the product (default: its default branch)")
+@click.option("--output", "-o", type=click.Path(dir_okay=False, path_type=Path),
+              help="Write the file here instead of to standard output")
+def open_(product_name, path, rev, output):
+    """Stream one file of a data product from its DVC remote, without pulling the product.
+
+    PATH is relative to the product repository, e.g. data/final/claims.csv.
+    Reads go through the local block cache (~/.mintd/cache/blocks), so
+    opening the same file again is served from disk.
+    """
+    import shutil
+    from .product_stream import open_product_file
+
+    try:
+        with open_product_file(product_name, path, rev=rev) as source:
+            if output:
+                with output.open("wb") as dest:
+                    shutil.copyfileobj(source, dest, 1024 * 1024)
+            else:
+                shutil.copyfileobj(source, click.get_binary_stream("stdout"), 1024 * 1024)
+    except Exception as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
+
+    if output:
+        console.print(f"✅ {path} written to {output}", style="green")
+
+
+@data.command(name="import")
+@click.argument("product_names", nargs=-1)
+@click.option("--requirements", "-r", "requirements_file", type=click.Path(exists=True, dir_okay=False, path_type=Path),
+              help="File listing data products to import, one per line")
 @click.option("--stage", help="Pipeline stage to import (e.g., final, clean)")
 @click.option("--source-path", help="Specific path to import from the product")
 @click.option("--dest", help="Local destination path")
 @click.option("--rev", help="Specific git revision to import from")
+@click.option("--workers", default=4, show_default=True, type=click.IntRange(min=1),
+              help="Products resolved and prepared concurrently")
+@click.option("--jobs", "-j", type=click.IntRange(min=1), help="Parallel download jobs (default: DVC's default)")
+@click.option("--resume", is_flag=True, help="Skip products already imported by an interrupted or failed run")
+@click.option("--include", multiple=True, help="Only download files matching this glob, e.g. 'year=2023/*' (repeatable)")
+@click.option("--exclude", multiple=True, help="Skip files matching this glob (repeatable)")
 @click.option("--project-path", "-p", type=click.Path(exists=True, path_type=Path),
               help="Path to project directory (defaults to current directory)")
-def import_(product_name, stage, source_path, dest, rev, project_path):
-    """Import data product as DVC dependency into current project."""
+def import_(product_names, requirements_file, stage, source_path, dest, rev, workers, jobs, resume, include, exclude,
+            project_path):
+    """Import data product as DVC dependency into current project.
+
+    Several products may be named at once, or listed in a requirements file
+    (one per line, optionally as name@rev followed by --stage, --source-path,
+    --dest, --include or --exclude). They are looked up concurrently, then
+    imported in turn.
+
+    With --include/--exclude the whole directory is still the dependency,
+    but only the matching files are downloaded.
+    """
     from pathlib import Path
-    from .data_import import import_data_product, update_project_metadata, query_data_product
+    from .data_import import ImportSpec, import_data_product, import_data_products, parse_import_requirements
 
     project_path = Path(project_path) if project_path else Path.cwd()
 
+    if stage and source_path:
+        console.print("❌ Cannot specify both --stage and --source-path", style="red")
+        raise click.Abort()
+
     try:
-        if stage and source_path:
-            console.print("❌ Cannot specify both --stage and --source-path", style="red")
-            raise click.Abort()
+        specs = [ImportSpec(product_name=name, stage=stage, path=source_path, dest=dest, rev=rev,
+                            include=[*include], exclude=[*exclude])
+                 for name in product_names]
+        if requirements_file:
+            specs.extend(parse_import_requirements(requirements_file))
+    except Exception as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
 
-        # Import the data
+    if not specs:
+        console.print("❌ Name at least one data product or pass --requirements", style="red")
+        raise click.Abort()
+    if dest and len(specs) > 1:
+        console.print("❌ --dest can only be used when importing a single data product", style="red")
+        raise click.Abort()
+
+    if len(specs) == 1 and not resume:
+        spec = specs[0]
         result = import_data_product(
-            product_name=product_name,
+            product_name=spec.product_name,
             project_path=project_path,
-            stage=stage,
-            path=source_path,
-            dest=dest,
-            repo_rev=rev
+            stage=spec.stage,
+            path=spec.path,
+            dest=spec.dest,
+            repo_rev=spec.rev,
+            include=spec.include,
+            exclude=spec.exclude
         )
-
-        if result.success:
-            # Update metadata with dependency info
-            try:
-                product_info = query_data_product(product_name)
-                update_project_metadata(project_path, result, product_info)
-                console.print("✅ Metadata updated with dependency information", style="green")
-            except Exception as e:
-                console.print(f"⚠️ Import succeeded but metadata update failed: {e}", style="yellow")
-                console.print("You may need to manually update metadata.json", style="yellow")
-        else:
+        if not result.success:
             console.print(f"❌ Import failed: {result.error_message}", style="red")
             raise click.Abort()
+        return
 
+    try:
+        results = import_data_products(specs, project_path, max_workers=workers, jobs=jobs, resume=resume)
     except Exception as e:
         console.print(f"❌ Error: {e}", style="red")
         raise click.Abort()
 
+    failed = [result for result in results if not result.success]
+    console.print(f"\n📦 Imported {len(results) - len(failed)} of {len(results)} data product(s)")
+    if failed:
+        for result in failed:
+            console.print(f"   ❌ {result.product_name}: {result.error_message}", style="red")
+        console.print("Re-run the same command with --resume to skip the products already imported.")
+        raise click.Abort()
+
+
+@data.command(name="sync")
+@click.option("--dry-run", is_flag=True, help="Only report dependencies that changed upstream")
+@click.option("--workers", default=8, show_default=True, type=click.IntRange(min=1),
+              help="Upstream revisions checked concurrently")
+@click.option("--jobs", "-j", type=click.IntRange(min=1), help="Parallel download jobs (default: DVC's default)")
+@click.option("--project-path", "-p", type=click.Path(exists=True, path_type=Path),
+              help="Path to project directory (defaults to current directory)")
+def data_sync(dry_run, workers, jobs, project_path):
+    """Update data dependencies whose source has moved since data.lock was written."""
+    from pathlib import Path
+    from rich.table import Table
+    from .data_import import sync_data_dependencies
+
+    project_path = Path(project_path) if project_path else Path.cwd()
+
+    try:
+        statuses = sync_data_dependencies(project_path, max_workers=workers, jobs=jobs, dry_run=dry_run)
+    except Exception as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
+
+    if not statuses:
+        console.print("No data dependencies in data.lock; import some with 'mintd data import'")
+        return
+
+    styles = {"up-to-date": "green", "outdated": "yellow", "updated": "cyan", "failed": "red"}
+    table = Table(title="Data Dependencies")
+    table.add_column("Product", style="cyan")
+    table.add_column("Local Path")
+    table.add_column("Locked")
+    table.add_column("Upstream")
+    table.add_column("Status")
+    for status in statuses:
+        table.add_row(
+            status["source"] or "",
+            status["local_path"] or "",
+            (status["locked_commit"] or "")[:8],
+            (status["upstream_commit"] or "")[:8],
+            f"[{styles[status['status']]}]{status['status']}[/]"
+        )
+    console.print(table)
+
+    failed = [status for status in statuses if status["status"] == "failed"]
+    for status in failed:
+        console.print(f"   ❌ {status['source']}: {status['error']}", style="red")
+    if failed:
+        raise click.Abort()
+
+
+@data.command()
+@click.option("--workers", default=8, show_default=True, type=click.IntRange(min=1),
+              help="Dependencies checked concurrently")
+@click.option("--json", "as_json", is_flag=True, help="Print the reports as JSON")
+@click.option("--project-path", "-p", type=click.Path(exists=True, path_type=Path),
+              help="Path to project directory (defaults to current directory)")
+def outdated(workers, as_json, project_path):
+    """List imported data dependencies whose source has moved on."""
+    import json
+    from pathlib import Path
+    from rich.table import Table
+    from .data_import import find_outdated_dependencies
+
+    project_path = Path(project_path) if project_path else Path.cwd()
+
+    try:
+        reports = find_outdated_dependencies(project_path, max_workers=workers)
+    except Exception as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
+
+    if as_json:
+        click.echo(json.dumps(reports, indent=2))
+        return
+    if not reports:
+        console.print("No imported data dependencies in metadata.json")
+        return
+
+    styles = {"up-to-date": "green", "moved": "cyan", "stale": "yellow", "unverified": "magenta", "failed": "red"}
+    table = Table(title="Data Dependencies")
+    table.add_column("Product", style="cyan")
+    table.add_column("Local Path")
+    table.add_column("Imported")
+    table.add_column("Upstream")
+    table.add_column("Behind", justify="right")
+    table.add_column("Data")
+    table.add_column("Status")
+    for report in reports:
+        behind = report["commits_behind"]
+        data_changed = {True: "changed", False: "same", None: ""}[report["data_changed"]]
+        table.add_row(
+            report["source"] or "",
+            report["local_path"] or "",
+            (report["locked_commit"] or "")[:8],
+            (report["upstream_commit"] or "")[:8],
+            "" if behind is None else f"{behind} commit{'' if behind == 1 else 's'}",
+            data_changed,
+            f"[{styles[report['status']]}]{report['status']}[/]"
+        )
+    console.print(table)
+
+    for report in reports:
+        if report["status"] == "failed":
+            console.print(f"   ❌ {report['source']}: {report['error']}", style="red")
+        elif report["status"] == "unverified":
+            console.print(f"   ⚠️  {report['source']}: {report['error']}; compared with the last cached copy",
+                          style="yellow")
+    stale = sum(report["status"] == "stale" for report in reports)
+    if stale:
+        console.print(f"{stale} dependenc{'y is' if stale == 1 else 'ies are'} stale; "
+                      "run 'mintd data sync' to update them")
+
+
+@data.command()
+@click.option("--jobs", "-j", type=click.IntRange(min=1), help="Parallel download jobs (default: DVC's default)")
+@click.option("--foreground", is_flag=True, help="Run in this terminal instead of in the background")
+@click.option("--project-path", "-p", type=click.Path(exists=True, path_type=Path),
+              help="Path to project directory (defaults to current directory)")
+def prefetch(jobs, foreground, project_path):
+    """Fetch the data of every dependency into the DVC cache, in the background.
+
+    Start it after checking a project out, so that the first `dvc repro`
+    does not stall on downloads. Dependencies come from data.lock and
+    metadata.json; progress is logged to .mintd/prefetch.log.
+    """
+    from pathlib import Path
+    from .prefetch import finish_prefetch, prefetch_data_dependencies, start_prefetch
+
+    project_path = Path(project_path) if project_path else Path.cwd()
+
+    if not foreground:
+        try:
+            pid, log_path = start_prefetch(project_path, jobs=jobs)
+        except Exception as e:
+            console.print(f"❌ Error: {e}", style="red")
+            raise click.Abort()
+        console.print(f"🚚 Prefetching data dependencies in the background (PID {pid})")
+        console.print(f"   Follow progress with: tail -f {log_path}")
+        return
+
+    try:
+        reports = prefetch_data_dependencies(project_path, jobs=jobs)
+    except Exception as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
+    finally:
+        finish_prefetch(project_path)
+
+    if any(report["status"] == "failed" for report in reports):
+        raise click.Abort()
+
 
 @data.command()
 @click.option("--imported", "-i", is_flag=True, help="Show imported dependencies instead of available products")
-@click.option("--path", "-p", type=click.Path(exists=True, path_type=Path),
+@click.option("--path", "-p", "project_path", type=click.Path(exists=True, path_type=Path),
               help="Path to project directory (defaults to current directory)")
 def list(imported, project_path):
     """List available data products or imported dependencies."""
@@ -962,6 +1507,20 @@ def list(imported, project_path):
         raise click.Abort()
 
 
+@data.command()
+@click.argument("query")
+@click.option("--limit", "-n", default=10, show_default=True, help="Maximum number of results")
+def search(query, limit):
+    """Search data products by name, description and tags."""
+    from .data_import import search_data_products
+
+    try:
+        search_data_products(query, limit=limit)
+    except Exception as e:
+        console.print(f"❌ Error: {e}", style="red")
+        raise click.Abort()
+
+
 @main.group()
 def enclave():
     """Manage enclave data transfers and workspace."""
@@ -973,7 +1532,9 @@ def enclave():
 @click.option("--path", "-p", type=click.Path(exists=True, path_type=Path),
               help="Path to enclave directory (defaults to current directory)")
 @click.option("--no-pull", is_flag=True, help="Add to approved list without pulling data")
-def add(repo_name, path, no_pull):
+@click.option("--include", multiple=True, help="Only pull files matching this glob, e.g. 'year=2023/*' (repeatable)")
+@click.option("--exclude", multiple=True, help="Skip files matching this glob (repeatable)")
+def add(repo_name, path, no_pull, include, exclude):
     """Add a data product to the enclave's approved list and automatically pull the data.
 
     By default, this command will add the product to the approved list and immediately
@@ -1006,11 +1567,16 @@ def add(repo_name, path, no_pull):
 
     if not existing:
         # Add to approved list (basic structure - user can edit details)
-        approved.append({
+        item = {
             'repo': repo_name,
             'registry_entry': f"catalog/data/{repo_name}.yaml",
             'stage': 'final'
-        })
+        }
+        if include:
+            item['include'] = [*include]
+        if exclude:
+            item['exclude'] = [*exclude]
+        approved.append(item)
 
         # Save manifest
         with open(manifest_path, 'w') as f:
@@ -1161,6 +1727,40 @@ def clean(keep, staging_only, path):
         raise click.Abort()
 
 
+@main.command()
+@click.option("--json", "as_json", is_flag=True, help="Print the report as JSON")
+def cache(as_json):
+    """Show shared DVC cache usage and deduplication savings."""
+    import json
+    from rich.table import Table
+    from .dvc_cache import cache_report, format_size
+
+    report = cache_report()
+    if report is None:
+        console.print("ℹ️  No shared DVC cache configured; each project keeps its own .dvc/cache.")
+        console.print("Set dvc_cache.dir in ~/.mintd/config.yaml to share one cache across projects.", style="dim")
+        return
+
+    if as_json:
+        click.echo(json.dumps(report, indent=2))
+        return
+
+    table = Table(title=f"Projects using {report['dir']}")
+    table.add_column("Project", style="cyan")
+    table.add_column("Outputs", justify="right")
+    table.add_column("Tracked", justify="right")
+    for project in report["projects"]:
+        table.add_row(project["path"], str(project["outputs"]), format_size(project["tracked_bytes"]))
+    console.print(table)
+
+    console.print(f"📦 Cache: {report['objects']} objects, {format_size(report['stored_bytes'])} stored "
+                  f"(links: {report['type']})")
+    console.print(f"📊 Tracked by {len(report['projects'])} project(s): {format_size(report['tracked_bytes'])}")
+    if report["tracked_bytes"]:
+        percent = 100 * report["saved_bytes"] / report["tracked_bytes"]
+        console.print(f"💾 Saved by sharing: {format_size(report['saved_bytes'])} ({percent:.0f}%)", style="green")
+
+
 @main.group()
 def manifest():
     """Manage file manifests for change detection."""
@@ -1322,8 +1922,7 @@ def register_custom_commands():
                             console.print(f"✅ Created: {result.full_name}", style="green")
                             console.print(f"   Location: {result.path}", style="dim")
 
-                            if register and result.registration_url:
-                                console.print(f"   Registration PR: {result.registration_url}", style="dim")
+                            _print_registration(result)
                         except Exception as e:
                             console.print(f"❌ Error: {e}", style="red")
                             raise click.Abort()
@@ -164,6 +164,19 @@ def _get_default_config() -> dict:
             "default_branch": "main",
             "admin_team": "infrastructure-admins",
             "researcher_team": "all-researchers",
+            "cache": True,       # Cache catalog lookups on disk
+            "cache_ttl": 300,    # Seconds before re-checking registry HEAD
+            "github_transport": "auto",  # auto, http (REST API) or gh (GitHub CLI)
+        },
+        "dvc_cache": {
+            "dir": "",           # Shared DVC cache for all projects; empty keeps one per project
+            "shared": "group",   # Make cache files group-writable so the lab can share them
+            "type": "reflink,hardlink,symlink",  # Link types tried when checking data out
+        },
+        "block_cache": {
+            "dir": "",           # Blocks of streamed product files; empty uses ~/.mintd/cache/blocks
+            "max_size_gb": 10,   # Least recently used blocks are evicted beyond this
+            "block_size_mb": 8,
         },
         "defaults": {
             "author": "",
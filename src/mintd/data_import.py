@@ -6,24 +6,29 @@ into project/infra repositories with robust error handling and rollback support.
 
 import os
 import json
+import posixpath
 import shutil
-import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple, Callable
-from dataclasses import dataclass, asdict
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Callable
+from dataclasses import dataclass, asdict, field
 
 import yaml
 import git
 from rich.console import Console
 
+from .dvc_adapter import DVCAdapter, DVCError, get_dvc_adapter
+from .dvc_cache import configure_shared_cache
+from .metadata_store import MetadataStoreError, get_metadata_store
+from .data_lock import is_pinned, load_data_lock, read_dvc_import, remote_commit, update_data_lock
 from .registry import get_registry_client, load_project_metadata
 from .config import get_config
 
 console = Console()
 
-
 @dataclass
 class ImportResult:
     """Result of a single import operation."""
@@ -35,6 +40,18 @@ class ImportResult:
     source_commit: Optional[str] = None
 
 
+@dataclass
+class ImportSpec:
+    """One data product to import, as named on the command line or in a requirements file."""
+    product_name: str
+    stage: Optional[str] = None
+    path: Optional[str] = None
+    dest: Optional[str] = None
+    rev: Optional[str] = None
+    include: List[str] = field(default_factory=list)
+    exclude: List[str] = field(default_factory=list)
+
+
 class ImportTransaction:
     """Track import operations for rollback on failure.
 
@@ -188,12 +205,23 @@ def validate_project_directory(project_path: Path) -> None:
         raise DataImportError(f"Invalid project metadata: {e}")
 
 
+def _dvc_url(repo_url: str) -> str:
+    """Convert a GitHub HTTPS URL to SSH, which DVC and git authenticate with."""
+    if repo_url.startswith('https://github.com/'):
+        return repo_url.replace('https://github.com/', 'git@github.com:')
+    return repo_url
+
+
 def run_dvc_import(
     project_path: Path,
     repo_url: str,
     source_path: str,
     dest_path: str,
-    repo_rev: Optional[str] = None
+    repo_rev: Optional[str] = None,
+    download: bool = True,
+    jobs: Optional[int] = None,
+    include: Optional[List[str]] = None,
+    exclude: Optional[List[str]] = None
 ) -> str:
     """Run dvc import command with error handling.
 
@@ -203,6 +231,12 @@ def run_dvc_import(
         source_path: Path in source repo to import
         dest_path: Local destination path
         repo_rev: Specific revision to import from
+        download: Fetch the data now; when False only the .dvc file is
+            written and ``dvc pull`` downloads the data later
+        jobs: Parallel transfer jobs for the download (default: DVC's own default)
+        include: Glob patterns, relative to a directory ``source_path``; only
+            matching files are downloaded (see ``_pull_matching``)
+        exclude: Glob patterns of files not to download
 
     Returns:
         Path to created .dvc file
@@ -210,40 +244,172 @@ def run_dvc_import(
     Raises:
         DVCImportError: If import fails
     """
-    # Convert HTTPS URL to SSH for authentication
-    if repo_url.startswith('https://github.com/'):
-        ssh_url = repo_url.replace('https://github.com/', 'git@github.com:')
+    # Extract .dvc file path from output or construct it
+    # DVC typically creates file.dvc for destination file
+    if dest_path.endswith('/'):
+        # Directory import - dvc creates .dir file
+        dvc_file = f"{dest_path.rstrip('/')}.dvc"
     else:
-        ssh_url = repo_url
+        # File import
+        dvc_file = f"{dest_path}.dvc"
+
+    filtered = bool(include or exclude)
+    try:
+        get_dvc_adapter(project_path).imp(
+            _dvc_url(repo_url), source_path, dest_path.rstrip('/'), rev=repo_rev,
+            no_download=filtered or not download, jobs=jobs
+        )
+        if filtered and download:
+            _pull_matching(project_path, dvc_file, include or [], exclude or [], jobs=jobs)
+    except DVCError as e:
+        raise DVCImportError(f"DVC import failed: {e}")
+
+    return dvc_file
 
-    cmd = ["dvc", "import", ssh_url, source_path, dest_path]
 
-    if repo_rev:
-        cmd.extend(["--rev", repo_rev])
+def _pull_matching(project_path: Path, dvc_file: str, include: List[str], exclude: List[str],
+                   jobs: Optional[int] = None) -> None:
+    """Download just the files of a ``--no-download`` directory import that match glob filters.
 
+    The source directory is listed from its .dir manifest at the locked
+    commit and only the matching files are pulled, replacing whatever an
+    earlier revision left in the output. DVC caches the data of hash-less
+    imports by source path alone, so the source directory's hash is first
+    recorded on the import's dependency; otherwise two products that both
+    export ``data/final`` would be checked out with the same data.
+
+    Raises:
+        DVCError: If the source is not a directory, cannot be listed, or no file matches
+    """
+    dvc = get_dvc_adapter(project_path)
+    imported = read_dvc_import(project_path, dvc_file)
+    url, commit = imported["source_url"], imported["source_commit"]
+    source_path = (imported["source_path"] or "").rstrip('/')
+
+    parent, name = posixpath.split(source_path)
+    entry = next((e for e in dvc.ls(url, parent or ".", rev=commit) if e["path"] == name), None)
+    if not entry or not entry.get("isdir") or not entry.get("md5"):
+        raise DVCError(f"--include/--exclude filter a DVC-tracked directory; {source_path} is not one")
+    _record_source_hash(project_path, dvc_file, entry)
+
+    files = dvc.glob(url, source_path, include, exclude, rev=commit)
+    output = dvc_file[:-len(".dvc")]
+    if (project_path / output).is_dir():
+        shutil.rmtree(project_path / output)
+    dvc.pull([f"{output}/{path}" for path in files], jobs=jobs)
+
+
+@contextmanager
+def _keep_checkout(project_path: Path, dvc_file: str) -> Iterator[None]:
+    """Move an import's checkout aside while the block replaces it.
+
+    ``dvc update --no-download`` and ``_pull_matching`` both clear the
+    output, so the data checked out now is kept next to it until the block
+    succeeds. If the block fails, that data and the .dvc file describing it
+    are put back.
+    """
+    path = project_path / dvc_file
+    current = project_path / dvc_file[:-len(".dvc")]
+    previous = current.with_name(f".{current.name}.previous")
+    stage = path.read_text()
+    if previous.exists():  # left by an interrupted sync, whose checkout may be partial
+        shutil.rmtree(current, ignore_errors=True)
+    elif current.is_dir():
+        current.rename(previous)
     try:
-        result = subprocess.run(
-            cmd,
-            cwd=project_path,
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        yield
+    except BaseException:
+        if previous.exists():
+            shutil.rmtree(current, ignore_errors=True)
+            previous.rename(current)
+        path.write_text(stage)
+        raise
+    shutil.rmtree(previous, ignore_errors=True)
+
+
+def _record_source_hash(project_path: Path, dvc_file: str, entry: Dict[str, Any]) -> None:
+    """Write a source listing entry's hash onto the dependency of an import's .dvc file."""
+    path = project_path / dvc_file
+    with open(path, "r") as f:
+        stage = yaml.safe_load(f)
+    dep = stage["deps"][0]
+    dep["md5"] = entry["md5"]
+    if entry.get("size") is not None:
+        dep["size"] = entry["size"]
+    else:
+        dep.pop("size", None)
+    with open(path, "w") as f:
+        yaml.safe_dump(stage, f, default_flow_style=False, sort_keys=False)
 
-        # Extract .dvc file path from output or construct it
-        # DVC typically creates file.dvc for destination file
-        if dest_path.endswith('/'):
-            # Directory import - dvc creates .dir file
-            dvc_file = f"{dest_path.rstrip('/')}.dvc"
-        else:
-            # File import
-            dvc_file = f"{dest_path}.dvc"
 
-        return dvc_file
+def parse_import_requirements(requirements_file: Path) -> List[ImportSpec]:
+    """Read data products to import from a requirements-style file.
 
-    except subprocess.CalledProcessError as e:
-        error_msg = e.stderr.strip() if e.stderr else str(e)
-        raise DVCImportError(f"DVC import failed: {error_msg}")
+    One product per line; ``#`` starts a comment. A line may pin a revision
+    with ``name@rev`` and take the same options as ``mintd data import``::
+
+        data_cms-provider-data-service
+        data_hospital-claims@v2.1 --stage clean
+        data_census-tracts --source-path data/final/tracts.csv --dest data/raw/tracts.csv
+        data_hospital-claims --include 'year=2023/*' --exclude '*.log'
+
+    Args:
+        requirements_file: Path to the file
+
+    Returns:
+        List of import specs in file order
+
+    Raises:
+        DataImportError: If a line cannot be parsed
+    """
+    import shlex
+
+    options = {"--stage": "stage", "--source-path": "path", "--path": "path", "--dest": "dest", "--rev": "rev"}
+    specs = []
+    with open(requirements_file, "r") as f:
+        for line_number, line in enumerate(f, 1):
+            tokens = shlex.split(line, comments=True)
+            if not tokens:
+                continue
+
+            name, _, rev = tokens[0].partition("@")
+            spec = ImportSpec(product_name=name, rev=rev or None)
+            rest = tokens[1:]
+            while rest:
+                option = rest.pop(0)
+                if option not in (*options, "--include", "--exclude") or not rest:
+                    raise DataImportError(f"{requirements_file}:{line_number}: cannot parse '{line.strip()}'")
+                if option in ("--include", "--exclude"):
+                    getattr(spec, option[2:]).append(rest.pop(0))
+                else:
+                    setattr(spec, options[option], rest.pop(0))
+            if spec.stage and spec.path:
+                raise DataImportError(f"{requirements_file}:{line_number}: cannot specify both --stage and --source-path")
+            specs.append(spec)
+    return specs
+
+
+def _plan_import(product_name: str, stage: Optional[str], path: Optional[str],
+                 dest: Optional[str]) -> Tuple[str, str]:
+    """Work out the source path in the product and the local destination."""
+    if stage and path:
+        raise DataImportError("Cannot specify both --stage and --path")
+    elif not stage and not path:
+        # Default to final stage
+        stage = "final"
+
+    if stage:
+        # Import pipeline stage output
+        source_path = f"data/{stage}/"
+        if not dest:
+            dest = f"data/imports/{product_name.replace('data_', '')}/"
+    else:
+        # Import specific path
+        source_path = path
+        if not dest:
+            # Use same relative path structure
+            dest = path
+    return source_path, dest
 
 
 def update_project_metadata(
@@ -253,6 +419,10 @@ def update_project_metadata(
 ) -> None:
     """Update project metadata.json with data dependency information.
 
+    The change goes through the project's metadata store, so inside
+    ``get_metadata_store(project_path).batch()`` it is queued and written
+    with the rest of the batch.
+
     Args:
         project_path: Project directory
         import_result: Result of the import operation
@@ -261,65 +431,91 @@ def update_project_metadata(
     Raises:
         MetadataUpdateError: If metadata update fails
     """
-    metadata_file = project_path / "metadata.json"
-
-    try:
-        # Read existing metadata
-        with open(metadata_file, 'r') as f:
-            metadata = json.load(f)
-
+    # Create dependency entry
+    dependency = {
+        "source": import_result.product_name,
+        "source_url": product_info.get("repository", {}).get("github_url", ""),
+        "stage": product_info.get("stage", ""),
+        "path": product_info.get("path", ""),
+        "local_path": import_result.local_path,
+        "dvc_file": import_result.dvc_file,
+        "imported_at": datetime.now().isoformat(),
+        "source_commit": import_result.source_commit
+    }
+    for key in ("include", "exclude"):
+        if product_info.get(key):
+            dependency[key] = list(product_info[key])
+
+    def add_dependency(metadata: Dict[str, Any]) -> None:
         # Ensure data_dependencies section exists
-        if "data_dependencies" not in metadata.get("metadata", {}):
-            if "metadata" not in metadata:
-                metadata["metadata"] = {}
-            metadata["metadata"]["data_dependencies"] = []
-
-        # Create dependency entry
-        dependency = {
-            "source": import_result.product_name,
-            "source_url": product_info.get("repository", {}).get("github_url", ""),
-            "stage": product_info.get("stage", ""),
-            "path": product_info.get("path", ""),
-            "local_path": import_result.local_path,
-            "dvc_file": import_result.dvc_file,
-            "imported_at": datetime.now().isoformat(),
-            "source_commit": import_result.source_commit
-        }
+        dependencies = metadata.setdefault("metadata", {}).setdefault("data_dependencies", [])
 
-        # Check if this dependency already exists
-        dependencies = metadata["metadata"]["data_dependencies"]
-        existing_index = None
+        # Replace the entry for the same product and path, if there is one
         for i, dep in enumerate(dependencies):
             if (dep["source"] == import_result.product_name and
                 dep["local_path"] == import_result.local_path):
-                existing_index = i
+                dependencies[i] = dependency
                 break
-
-        if existing_index is not None:
-            # Update existing dependency
-            dependencies[existing_index] = dependency
         else:
-            # Add new dependency
             dependencies.append(dependency)
 
-        # Write updated metadata
-        with open(metadata_file, 'w') as f:
-            json.dump(metadata, f, indent=2)
-
+    try:
+        get_metadata_store(project_path).update(add_dependency)
     except Exception as e:
         raise MetadataUpdateError(f"Failed to update metadata.json: {e}")
 
 
+def _lock_entry(project_path: Path, result: ImportResult, product_info: Dict[str, Any]) -> Dict[str, Any]:
+    """The data.lock entry of a finished import."""
+    entry = {
+        "source": result.product_name,
+        "source_url": product_info.get("repository", {}).get("github_url", ""),
+        "rev": product_info.get("rev"),
+        "stage": product_info.get("stage", ""),
+        "path": product_info.get("path", ""),
+        "local_path": result.local_path,
+        "dvc_file": result.dvc_file,
+        "source_commit": result.source_commit,
+        "dvc_hash": read_dvc_import(project_path, result.dvc_file)["dvc_hash"],
+    }
+    for key in ("include", "exclude"):
+        if product_info.get(key):
+            entry[key] = list(product_info[key])
+    return entry
+
+
+def _update_lock(project_path: Path, entries: List[Dict[str, Any]]) -> None:
+    """Write entries to data.lock, warning rather than failing if it cannot be written."""
+    try:
+        update_data_lock(project_path, entries)
+    except (OSError, yaml.YAMLError) as e:
+        console.print(f"⚠️  Failed to update data.lock: {e}", style="yellow")
+
+
+def _print_dvc_timings(dvc: DVCAdapter, since: int) -> None:
+    timings = dvc.timing_summary(since=since)
+    if timings:
+        console.print("⏱️  DVC: " + ", ".join(
+            f"{operation} {entry['calls']}× {entry['seconds']:.2f}s" for operation, entry in timings.items()
+        ), style="dim")
+
+
 def import_data_product(
     product_name: str,
     project_path: Path,
     stage: Optional[str] = None,
     path: Optional[str] = None,
     dest: Optional[str] = None,
-    repo_rev: Optional[str] = None
+    repo_rev: Optional[str] = None,
+    include: Optional[List[str]] = None,
+    exclude: Optional[List[str]] = None
 ) -> ImportResult:
     """Import a data product as a DVC dependency.
 
+    With ``include`` or ``exclude`` the whole directory is still recorded as
+    the dependency, but only the matching files are downloaded and checked
+    out; ``dvc status`` then reports the output as modified.
+
     Args:
         product_name: Name of the data product to import
         project_path: Path to the project directory
@@ -327,6 +523,8 @@ def import_data_product(
         path: Specific path to import from the product
         dest: Local destination path (default: data/imports/{product_name}/)
         repo_rev: Specific revision to import from
+        include: Glob patterns of files to download, relative to the imported directory
+        exclude: Glob patterns of files not to download
 
     Returns:
         ImportResult with operation details
@@ -345,30 +543,11 @@ def import_data_product(
         product_info = query_data_product(product_name)
 
         # Determine what to import
-        if stage and path:
-            raise DataImportError("Cannot specify both --stage and --path")
-        elif not stage and not path:
-            # Default to final stage
-            stage = "final"
-
-        if stage:
-            # Import pipeline stage output
-            source_path = f"data/{stage}/"
-            if not dest:
-                dest = f"data/imports/{product_name.replace('data_', '')}/"
-        else:
-            # Import specific path
-            source_path = path
-            if not dest:
-                # Use same relative path structure
-                dest = path
-
-        # Ensure destination directory exists
-        dest_path = project_path / dest
-        if dest_path.suffix:  # It's a file
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
-        else:  # It's a directory
-            dest_path.mkdir(parents=True, exist_ok=True)
+        source_path, dest = _plan_import(product_name, stage, path, dest)
+        configure_shared_cache(get_dvc_adapter(project_path))
+
+        # Ensure the destination's parent exists; DVC creates the output itself
+        (project_path / dest.rstrip('/')).parent.mkdir(parents=True, exist_ok=True)
 
         # Run DVC import
         console.print(f"📥 Importing {source_path} from {product_name}...")
@@ -377,18 +556,21 @@ def import_data_product(
             repo_url=product_info["repository"]["github_url"],
             source_path=source_path,
             dest_path=dest,
-            repo_rev=repo_rev
+            repo_rev=repo_rev,
+            include=include,
+            exclude=exclude
         )
 
-        # Get source commit information
-        # This would need to be extracted from the DVC file or git operations
-        source_commit = repo_rev or "HEAD"
+        # The .dvc file records the commit the import resolved to
+        source_commit = read_dvc_import(project_path, dvc_file)["source_commit"] or repo_rev or "HEAD"
 
         # Success
         result.success = True
         result.dvc_file = dvc_file
         result.local_path = dest
         result.source_commit = source_commit
+        product_info = dict(product_info, stage=stage or ("" if path else "final"), path=path or "", rev=repo_rev,
+                            include=include or [], exclude=exclude or [])
 
         console.print(f"✅ Successfully imported {product_name}", style="green")
         console.print(f"   DVC file: {dvc_file}")
@@ -401,6 +583,7 @@ def import_data_product(
         except MetadataUpdateError as e:
             console.print(f"⚠️  Failed to update metadata: {e}", style="yellow")
             # We don't fail the import for metadata update failure, but we log it
+        _update_lock(project_path, [_lock_entry(project_path, result, product_info)])
 
         return result
 
@@ -410,21 +593,433 @@ def import_data_product(
         return result
 
 
+def _discard_import(project_path: Path, result: ImportResult) -> None:
+    """Remove the .dvc file and any partly downloaded output of an import."""
+    if result.dvc_file:
+        (project_path / result.dvc_file).unlink(missing_ok=True)
+    if result.local_path:
+        output = project_path / result.local_path.rstrip('/')
+        if output.is_dir():
+            shutil.rmtree(output)
+        elif output.exists():
+            output.unlink()
+
+
+def import_data_products(
+    specs: List[ImportSpec],
+    project_path: Path,
+    max_workers: int = 4,
+    jobs: Optional[int] = None,
+    resume: bool = False
+) -> List[ImportResult]:
+    """Import many data products into one project.
+
+    Registry lookups run concurrently on a bounded thread pool and share a
+    single registry client, so the registry mirror is synced once. Products
+    are then imported in input order, each as soon as its own lookup is
+    done, with ``dvc import`` downloading in parallel transfers; DVC holds a
+    repository-wide lock per import, so the shared DVC adapter runs them in
+    turn. Each product's metadata.json entry is written before its
+    checkpoint, so a resumed run never skips a product whose dependency
+    was not recorded.
+
+    Imports are not split into ``dvc import --no-download`` and one bulk
+    ``dvc pull``: DVC caches the data of hash-less imports by source path
+    alone, so two products that both export ``data/final`` would be checked
+    out with the same data.
+
+    The run is an ImportTransaction: every product that finishes is
+    checkpointed to ``.mintd/import_state.json``, so with ``resume=True``
+    a re-run after a failure or crash skips those products. Products that
+    fail are rolled back, removing their .dvc file and any partial download.
+
+    Args:
+        specs: Products to import
+        project_path: Path to the project directory
+        max_workers: Concurrent registry lookups
+        jobs: Parallel transfer jobs for each download (default: DVC's own default)
+        resume: Skip products completed by an earlier, unfinished run
+
+    Returns:
+        One ImportResult per spec, in input order
+    """
+    validate_project_directory(project_path)
+
+    transaction = ImportTransaction(project_path)
+    done: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    if resume and transaction.load_state():
+        transaction.failed = []
+        done = {(record["product_name"], record["local_path"]): record for record in transaction.completed
+                if record.get("dvc_file") and (project_path / record["dvc_file"]).exists()}
+        transaction.completed = list(done.values())
+
+    results: List[Optional[ImportResult]] = [None] * len(specs)
+    pending: List[Tuple[int, ImportSpec]] = []
+    for position, spec in enumerate(specs):
+        try:
+            _, dest = _plan_import(spec.product_name, spec.stage, spec.path, spec.dest)
+        except DataImportError:
+            dest = None
+        record = done.get((spec.product_name, dest))
+        if record:
+            results[position] = ImportResult(**record)
+            console.print(f"⏭️  {spec.product_name} already imported, skipping")
+        else:
+            pending.append((position, spec))
+
+    client = get_registry_client() if pending else None
+    dvc = get_dvc_adapter(project_path)
+    first_timing = len(dvc.timings)
+    if pending:
+        configure_shared_cache(dvc)
+
+    def lookup(spec: ImportSpec) -> Dict[str, Any]:
+        try:
+            return client.query_data_product(spec.product_name)
+        except Exception as e:
+            raise RegistryError(f"Failed to query registry for '{spec.product_name}': {e}")
+
+    def finish(result: ImportResult, product_info: Dict[str, Any]) -> None:
+        try:
+            update_project_metadata(project_path, result, product_info)
+        except MetadataUpdateError as e:
+            console.print(f"⚠️  Failed to update metadata for {result.product_name}: {e}", style="yellow")
+        _update_lock(project_path, [_lock_entry(project_path, result, product_info)])
+        transaction.add_success(result)
+        transaction.save_state()
+        console.print(f"✅ Successfully imported {result.product_name}", style="green")
+
+    imported: List[ImportResult] = []
+    lookups = []
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending) or 1))) as pool:
+            lookups = [pool.submit(lookup, spec) for _, spec in pending]
+            for (_, spec), future in zip(pending, lookups):
+                result = ImportResult(product_name=spec.product_name, success=False)
+                imported.append(result)
+                try:
+                    source_path, dest = _plan_import(spec.product_name, spec.stage, spec.path, spec.dest)
+                    product_info = future.result()
+                    output = project_path / dest.rstrip('/')
+                    output.parent.mkdir(parents=True, exist_ok=True)
+                    result.local_path = dest
+                    if not output.exists():
+                        # Only what this run creates is removed if the import fails or is interrupted
+                        result.dvc_file = f"{dest.rstrip('/')}.dvc"
+                        transaction.add_rollback_action(
+                            lambda result=result: result.success or _discard_import(project_path, result)
+                        )
+                    console.print(f"📥 Importing {source_path} from {spec.product_name}...")
+                    result.dvc_file = run_dvc_import(
+                        project_path=project_path,
+                        repo_url=product_info["repository"]["github_url"],
+                        source_path=source_path,
+                        dest_path=dest,
+                        repo_rev=spec.rev,
+                        jobs=jobs,
+                        include=spec.include,
+                        exclude=spec.exclude
+                    )
+                    result.source_commit = (read_dvc_import(project_path, result.dvc_file)["source_commit"]
+                                            or spec.rev or "HEAD")
+                    result.success = True
+                except Exception as e:
+                    result.error_message = str(e)
+                    console.print(f"❌ Failed to import {spec.product_name}: {e}", style="red")
+                    continue
+                finish(result, dict(product_info, stage=spec.stage or ("" if spec.path else "final"),
+                                    path=spec.path or "", rev=spec.rev,
+                                    include=spec.include, exclude=spec.exclude))
+    except BaseException:
+        transaction.save_state()
+        transaction.rollback()
+        raise
+
+    for (position, _), result in zip(pending, imported):
+        results[position] = result
+        if not result.success:
+            transaction.add_failure(result)
+
+    if transaction.failed:
+        transaction.rollback()
+        transaction.save_state()
+    else:
+        transaction.cleanup_state()
+
+    _print_dvc_timings(dvc, first_timing)
+    return results
+
+
+def sync_data_dependencies(
+    project_path: Path,
+    max_workers: int = 8,
+    jobs: Optional[int] = None,
+    dry_run: bool = False
+) -> List[Dict[str, Any]]:
+    """Bring the data dependencies in data.lock up to date with their sources.
+
+    Each dependency's upstream revision is resolved with ``git ls-remote``
+    against the repository its .dvc file imports from, on a bounded thread
+    pool, and compared with the locked commit. Dependencies pinned to a
+    commit SHA are never checked. Only those that moved are updated with
+    ``dvc update``, after which data.lock and metadata.json record their new
+    commit and hash. Dependencies imported with ``include``/``exclude``
+    filters are updated without downloading and then re-pull just their
+    matching files.
+
+    Args:
+        project_path: Path to the project directory
+        max_workers: Upstream revisions resolved concurrently
+        jobs: Parallel download jobs for the update (default: DVC's own default)
+        dry_run: Only report which dependencies are outdated
+
+    Returns:
+        One status per lock entry with ``source``, ``local_path``,
+        ``locked_commit``, ``upstream_commit``, ``status`` ("up-to-date",
+        "outdated", "updated" or "failed") and ``error``
+    """
+    validate_project_directory(project_path)
+    entries = load_data_lock(project_path)
+    statuses = [{
+        "source": entry.get("source"),
+        "local_path": entry.get("local_path"),
+        "locked_commit": entry.get("source_commit"),
+        "upstream_commit": None,
+        "status": "up-to-date",
+        "error": None,
+    } for entry in entries]
+
+    def check(entry: Dict[str, Any], status: Dict[str, Any]) -> None:
+        try:
+            rev = entry.get("rev")
+            if is_pinned(rev):
+                # The locked commit is the full SHA of an abbreviated pin
+                locked = entry.get("source_commit") or ""
+                status["upstream_commit"] = locked if locked.startswith(rev) else rev
+                if status["upstream_commit"] != locked:
+                    status["status"] = "outdated"
+                return
+            dvc_file = entry.get("dvc_file")
+            if not dvc_file or not (project_path / dvc_file).exists():
+                raise DataImportError(f"{dvc_file or 'its .dvc file'} is missing; import it again")
+            url = read_dvc_import(project_path, dvc_file)["source_url"] or _dvc_url(entry.get("source_url") or "")
+            status["upstream_commit"] = remote_commit(url, entry.get("rev"))
+            if status["upstream_commit"] != entry.get("source_commit"):
+                status["status"] = "outdated"
+        except Exception as e:
+            status["status"], status["error"] = "failed", str(e)
+
+    if entries:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(entries)))) as pool:
+            for future in [pool.submit(check, entry, status) for entry, status in zip(entries, statuses)]:
+                future.result()
+
+    outdated = [(entry, status) for entry, status in zip(entries, statuses) if status["status"] == "outdated"]
+    if dry_run or not outdated:
+        return statuses
+
+    dvc = get_dvc_adapter(project_path)
+    first_timing = len(dvc.timings)
+    console.print(f"📥 Updating {len(outdated)} data dependenc{'y' if len(outdated) == 1 else 'ies'}...")
+    whole = [(entry, status) for entry, status in outdated if not (entry.get("include") or entry.get("exclude"))]
+    try:
+        if whole:
+            dvc.update([entry["dvc_file"] for entry, _ in whole], jobs=jobs)
+        for _, status in whole:
+            status["status"] = "updated"
+    except DVCError:
+        # Update one at a time to find out which dependencies failed
+        for entry, status in whole:
+            try:
+                dvc.update([entry["dvc_file"]], jobs=jobs)
+                status["status"] = "updated"
+            except DVCError as e:
+                status["status"], status["error"] = "failed", str(e)
+    for entry, status in outdated:
+        if status["status"] != "outdated":
+            continue
+        try:
+            with _keep_checkout(project_path, entry["dvc_file"]):
+                dvc.update([entry["dvc_file"]], no_download=True)
+                _pull_matching(project_path, entry["dvc_file"], entry.get("include") or [],
+                               entry.get("exclude") or [], jobs=jobs)
+            status["status"] = "updated"
+        except DVCError as e:
+            status["status"], status["error"] = "failed", str(e)
+
+    updated = []
+    try:
+        with get_metadata_store(project_path).batch():
+            for entry, status in outdated:
+                if status["status"] != "updated":
+                    continue
+                resolved = read_dvc_import(project_path, entry["dvc_file"])
+                entry = dict(entry, source_commit=resolved["source_commit"] or status["upstream_commit"],
+                             dvc_hash=resolved["dvc_hash"])
+                updated.append(entry)
+                result = ImportResult(product_name=entry["source"], success=True, dvc_file=entry["dvc_file"],
+                                      local_path=entry["local_path"], source_commit=entry["source_commit"])
+                product_info = {"repository": {"github_url": entry.get("source_url", "")},
+                                "stage": entry.get("stage", ""), "path": entry.get("path", ""),
+                                "include": entry.get("include"), "exclude": entry.get("exclude")}
+                update_project_metadata(project_path, result, product_info)
+    except MetadataStoreError as e:
+        console.print(f"⚠️  Failed to update metadata: {e}", style="yellow")
+    if updated:
+        _update_lock(project_path, updated)
+
+    _print_dvc_timings(dvc, first_timing)
+    return statuses
+
+
+def _stage_hash(dvc_file: Optional[bytes]) -> Optional[str]:
+    """Output hash recorded in the contents of a .dvc file."""
+    if not dvc_file:
+        return None
+    try:
+        outs = (yaml.safe_load(dvc_file) or {}).get("outs") or [{}]
+    except yaml.YAMLError:
+        return None
+    if not isinstance(outs[0], dict):
+        return None
+    return outs[0].get("md5") or outs[0].get("etag")
+
+
+def find_outdated_dependencies(project_path: Path, max_workers: int = 8) -> List[Dict[str, Any]]:
+    """Compare every imported dependency in metadata.json with its source.
+
+    Sources are read from cached bare clones (see ``source_mirror``):
+    each is fetched once, then the upstream commit, the number of commits
+    since the imported one and the hash in the source's ``<path>.dvc`` are
+    all read without a checkout. Dependencies are checked concurrently.
+
+    Args:
+        project_path: Path to the project directory
+        max_workers: Dependencies checked concurrently
+
+    Returns:
+        One report per dependency with ``source``, ``local_path``,
+        ``locked_commit``, ``upstream_commit``, ``commits_behind``,
+        ``data_changed`` (None when the source does not track the imported
+        path by itself), ``status`` ("up-to-date", "moved" for new commits
+        with the same data, "stale", "unverified" when the source could not be
+        fetched and the report is based on the last cached copy of it, or
+        "failed") and ``error``
+    """
+    from .source_mirror import get_source_mirror
+
+    validate_project_directory(project_path)
+    metadata = load_project_metadata(project_path)
+    dependencies = metadata.get("metadata", {}).get("data_dependencies", [])
+
+    def check(dependency: Dict[str, Any]) -> Dict[str, Any]:
+        report = {
+            "source": dependency.get("source"),
+            "local_path": dependency.get("local_path"),
+            "locked_commit": dependency.get("source_commit"),
+            "upstream_commit": None,
+            "commits_behind": None,
+            "data_changed": None,
+            "status": "up-to-date",
+            "error": None,
+        }
+        try:
+            imported = read_dvc_import(project_path, dependency.get("dvc_file") or "")
+            url = imported["source_url"] or _dvc_url(dependency.get("source_url") or "")
+            if not url:
+                raise DataImportError("no source repository recorded")
+            locked = report["locked_commit"] = imported["source_commit"] or report["locked_commit"]
+
+            mirror = get_source_mirror(url)
+            mirror.sync()
+            upstream = report["upstream_commit"] = mirror.resolve(imported["source_rev"])
+            if upstream != locked:
+                report["commits_behind"] = mirror.commits_between(locked, upstream) if locked else None
+                source_path = (imported["source_path"] or dependency.get("path")
+                               or f"data/{dependency.get('stage') or 'final'}").rstrip('/')
+                upstream_hash = _stage_hash(mirror.read(f"{upstream}:{source_path}.dvc"))
+                if upstream_hash and imported["dvc_hash"]:
+                    report["data_changed"] = upstream_hash != imported["dvc_hash"]
+                report["status"] = "moved" if report["data_changed"] is False else "stale"
+            if mirror.sync_error:
+                # Compared with the last cached copy of the source, which may be behind it
+                report["status"] = "unverified"
+                report["error"] = f"could not fetch {url}: {mirror.sync_error}"
+        except Exception as e:
+            report["status"], report["error"] = "failed", str(e)
+        return report
+
+    if not dependencies:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(dependencies)))) as pool:
+        return list(pool.map(check, dependencies))
+
+
+# Files a clone needs for DVC to find and fetch outputs; nothing else is checked out
+_DVC_METADATA_PATTERNS = ["/.dvc/", "/.dvcignore", "*.dvc", "dvc.yaml", "dvc.lock"]
+
+
+def _clone_dvc_metadata(repo_url: str, target: Path) -> None:
+    """Clone the latest commit of a repository with only its DVC metadata checked out.
+
+    The clone is depth 1 and blob-filtered, so only the blobs of the files
+    matching _DVC_METADATA_PATTERNS are downloaded.
+    """
+    repo = git.Repo.clone_from(repo_url, target, depth=1, filter="blob:none", no_checkout=True)
+    repo.git.sparse_checkout("set", "--no-cone", *_DVC_METADATA_PATTERNS)
+    repo.git.read_tree("-mu", "HEAD")
+
+
+def _move_into(source: Path, dest: Path) -> None:
+    """Move the contents of ``source`` into ``dest``, replacing clashing files."""
+    dest.mkdir(parents=True, exist_ok=True)
+    for child in source.iterdir():
+        target = dest / child.name
+        if child.is_dir() and target.is_dir():
+            _move_into(child, target)
+            continue
+        if target.is_dir():
+            shutil.rmtree(target)
+        os.replace(child, target)
+
+
+def _make_writable(path: Path) -> None:
+    """DVC checks linked files out read-only; the pulled copy belongs to the user."""
+    paths = [path] if path.is_file() else [p for p in path.rglob("*") if p.is_file()]
+    for file in paths:
+        file.chmod(file.stat().st_mode | 0o200)
+
+
 def pull_data_product(
     product_name: str,
     destination: Optional[str] = None,
     stage: Optional[str] = None,
-    path: Optional[str] = None
+    path: Optional[str] = None,
+    jobs: Optional[int] = None,
+    include: Optional[List[str]] = None,
+    exclude: Optional[List[str]] = None
 ) -> bool:
     """Pull/download data from a registered data product.
 
-    This is similar to enclave data pulling but for general use.
+    This is similar to enclave data pulling but for general use. The product
+    repository is cloned at depth 1 without file contents, so only its DVC
+    metadata is downloaded, and only the requested stage or path is fetched
+    from DVC storage. DVC checks the data out using reflinks or hard links to
+    a throwaway cache (reflinks or copies when the lab-wide shared cache is
+    configured), and the checked-out files are then moved (not copied) into
+    ``destination``, which is why the clone is made beside it.
+
+    ``include`` and ``exclude`` glob patterns are matched against the
+    directory's .dir manifest, so only the matching files are fetched.
 
     Args:
         product_name: Name of the data product
         destination: Local destination directory
         stage: Pipeline stage to pull
         path: Specific path to pull
+        jobs: Parallel download jobs (default: DVC's own default)
+        include: Glob patterns of files to pull, relative to the stage or path
+        exclude: Glob patterns of files not to pull
 
     Returns:
         True if successful
@@ -441,40 +1036,60 @@ def pull_data_product(
         dest_path = Path(destination)
         dest_path.mkdir(parents=True, exist_ok=True)
 
-        # This would implement the actual data pulling logic
-        # For now, just clone and pull the data
         repo_url = product_info["repository"]["github_url"]
 
         console.print(f"📥 Pulling data from {product_name}...")
 
         # Convert to SSH URL
         if repo_url.startswith('https://github.com/'):
-            ssh_url = repo_url.replace('https://github.com/', 'git@github.com:')
+            repo_url = repo_url.replace('https://github.com/', 'git@github.com:')
 
-        # Clone repository
-        temp_dir = Path(tempfile.mkdtemp())
+        # Clone beside the destination so checked-out files can be moved into it
+        temp_dir = Path(tempfile.mkdtemp(dir=dest_path.resolve().parent, prefix=f".{dest_path.name}-"))
         try:
-            repo = git.Repo.clone_from(ssh_url, temp_dir)
+            _clone_dvc_metadata(repo_url, temp_dir)
 
-            # Determine what to copy
-            if stage:
-                source_path = temp_dir / "data" / stage
-            elif path:
-                source_path = temp_dir / path
+            # Determine what to fetch
+            if path:
+                target = path.rstrip('/')
             else:
-                source_path = temp_dir / "data" / "final"
+                target = f"data/{stage or 'final'}"
+
+            dvc = DVCAdapter(temp_dir)
+            # Fetched objects land in the shared cache when there is one; the
+            # pulled files then must not be links the user could edit through
+            if not configure_shared_cache(dvc, link_types="reflink,copy", record=False):
+                dvc.config("cache.type", "reflink,hardlink,copy", level="local")
+            remote = product_info.get("storage", {}).get("dvc", {})
+            if remote.get("remote_url"):
+                remote_name = remote.get("remote_name") or "storage"
+                dvc.remote_add(remote_name, remote["remote_url"], default=True, level="local", force=True)
+                endpoint = get_config().get("storage", {}).get("endpoint", "")
+                if endpoint:
+                    dvc.remote_modify(remote_name, "endpointurl", endpoint, level="local")
+
+            # A .dvc file for a tracked stage, otherwise the output (or a file
+            # inside one) named directly, e.g. a pipeline stage's output
+            stage_file = f"{target}.dvc"
+            if include or exclude:
+                files = dvc.glob(str(temp_dir), target, include or [], exclude or [])
+                dvc.pull([f"{target}/{file}" for file in files], jobs=jobs)
+            else:
+                dvc.pull([stage_file if (temp_dir / stage_file).exists() else target], jobs=jobs)
 
-            if source_path.exists():
-                if source_path.is_file():
-                    shutil.copy2(source_path, dest_path)
-                else:
-                    shutil.copytree(source_path, dest_path, dirs_exist_ok=True)
+            source_path = temp_dir / target
+            if not source_path.exists():
+                console.print(f"❌ Source path {target} not found in {product_name}", style="red")
+                return False
 
-                console.print(f"✅ Data pulled to {dest_path}", style="green")
-                return True
+            _make_writable(source_path)
+            if source_path.is_file():
+                os.replace(source_path, dest_path / source_path.name)
             else:
-                console.print(f"❌ Source path {source_path} not found", style="red")
-                return False
+                _move_into(source_path, dest_path)
+
+            console.print(f"✅ Data pulled to {dest_path}", style="green")
+            return True
 
         finally:
             shutil.rmtree(temp_dir, ignore_errors=True)
@@ -520,15 +1135,46 @@ def list_data_products(show_imported: bool = False, project_path: Optional[Path]
         # List available data products from registry
         try:
             registry_client = get_registry_client()
-            products = registry_client.list_data_products()
 
             console.print("📋 Available Data Products:")
             console.print("-" * 30)
 
-            for product in products:
+            # Print entries as they are parsed rather than after the whole catalog
+            for product in registry_client.iter_data_products():
                 console.print(f"• {product['name']}")
                 console.print(f"  Description: {product.get('description', 'N/A')}")
                 console.print()
 
         except Exception as e:
             console.print(f"❌ Error accessing registry: {e}", style="red")
+
+
+def search_data_products(query: str, limit: int = 10) -> None:
+    """Search available data products and print the best matches.
+
+    Args:
+        query: Search text matched against names, descriptions and tags
+        limit: Maximum number of results to show
+
+    Raises:
+        RegistryError: If the registry cannot be searched
+    """
+    try:
+        registry_client = get_registry_client()
+        results = registry_client.search_data_products(query, limit=limit)
+    except Exception as e:
+        raise RegistryError(f"Failed to search the registry: {e}")
+
+    if not results:
+        console.print(f"No data products match '{query}'.")
+        return
+
+    console.print(f"🔎 Data products matching '{query}':")
+    console.print("-" * 30)
+
+    for product in results:
+        console.print(f"• {product['name']}")
+        console.print(f"  Description: {product.get('description') or 'N/A'}")
+        if product.get("tags"):
+            console.print(f"  Tags: {', '.join(str(tag) for tag in product['tags'])}")
+        console.print()
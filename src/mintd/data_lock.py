@@ -0,0 +1,144 @@
+"""Lockfile of a project's resolved data dependencies.
+
+``data.lock`` sits beside metadata.json and records, for every imported data
+product, the upstream git commit and DVC hash it was resolved to. It pins a
+project's inputs exactly, and lets ``mintd data sync`` find the dependencies
+that moved upstream with one ``git ls-remote`` each, without cloning or
+downloading anything.
+"""
+
+import re
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import yaml
+
+DATA_LOCK_FILE = "data.lock"
+
+# Bumped whenever the lockfile layout changes
+LOCK_VERSION = 1
+
+# Revisions that are already commits and so can never move upstream
+# A full or abbreviated commit SHA (git abbreviates to at least 7 digits)
+_COMMIT_SHA = re.compile(r"^[0-9a-f]{7,40}$")
+
+_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def read_dvc_import(project_path: Path, dvc_file: str) -> Dict[str, Optional[str]]:
+    """Read what an import's .dvc file resolved to.
+
+    Args:
+        project_path: Project directory
+        dvc_file: .dvc file written by ``dvc import``, relative to the project
+
+    Returns:
+        Dictionary with ``source_url``, ``source_path`` and ``source_rev``
+        (what was imported from where), ``source_commit`` (the locked
+        upstream commit) and ``dvc_hash`` (hash of the imported output, or
+        for a filtered import the source hash recorded on its dependency);
+        values are None when the file does not record them
+    """
+    try:
+        with open(Path(project_path) / dvc_file, "r") as f:
+            data = yaml.load(f, Loader=_LOADER) or {}
+    except (OSError, yaml.YAMLError):
+        data = {}
+
+    deps = data.get("deps") or [{}]
+    outs = data.get("outs") or [{}]
+    dep = deps[0] if isinstance(deps[0], dict) else {}
+    out = outs[0] if isinstance(outs[0], dict) else {}
+    repo = dep.get("repo") or {}
+    return {
+        "source_url": repo.get("url"),
+        "source_path": dep.get("path"),
+        "source_rev": repo.get("rev"),
+        "source_commit": repo.get("rev_lock"),
+        "dvc_hash": out.get("md5") or out.get("etag") or dep.get("md5"),
+    }
+
+
+def load_data_lock(project_path: Path) -> List[Dict[str, Any]]:
+    """Return the entries of a project's data.lock (empty if there is none)."""
+    try:
+        with open(Path(project_path) / DATA_LOCK_FILE, "r") as f:
+            data = yaml.load(f, Loader=_LOADER) or {}
+    except FileNotFoundError:
+        return []
+    return list(data.get("dependencies") or [])
+
+
+def _entry_key(entry: Dict[str, Any]) -> tuple:
+    return entry.get("source"), entry.get("local_path")
+
+
+def update_data_lock(project_path: Path, entries: Iterable[Dict[str, Any]]) -> None:
+    """Add or replace lock entries, keyed by product and local path.
+
+    The file is rewritten atomically, with entries sorted by local path so
+    that it diffs cleanly under version control.
+
+    Args:
+        project_path: Project directory
+        entries: Entries with ``source``, ``source_url``, ``rev``, ``stage``,
+            ``path``, ``local_path``, ``dvc_file``, ``source_commit`` and
+            ``dvc_hash``
+    """
+    locked = {_entry_key(entry): entry for entry in load_data_lock(project_path)}
+    for entry in entries:
+        locked[_entry_key(entry)] = entry
+
+    lock_file = Path(project_path) / DATA_LOCK_FILE
+    tmp = lock_file.with_name(f".{DATA_LOCK_FILE}.tmp")
+    with open(tmp, "w") as f:
+        yaml.safe_dump(
+            {
+                "version": LOCK_VERSION,
+                "dependencies": sorted(locked.values(), key=lambda e: (str(e.get("local_path")), str(e.get("source")))),
+            },
+            f, default_flow_style=False, sort_keys=False
+        )
+    tmp.replace(lock_file)
+
+
+def is_pinned(rev: Optional[str]) -> bool:
+    """True if ``rev`` is a commit SHA, full or abbreviated, which cannot move upstream.
+
+    A branch or tag named like a hexadecimal SHA counts as pinned too.
+    """
+    return bool(rev and _COMMIT_SHA.match(rev))
+
+
+def remote_commit(url: str, rev: Optional[str] = None, timeout: int = 60) -> str:
+    """Resolve a branch, tag or HEAD of a remote repository to a commit.
+
+    Args:
+        url: Repository URL
+        rev: Branch or tag (default: the remote's HEAD)
+        timeout: Seconds before giving up
+
+    Returns:
+        Commit SHA
+
+    Raises:
+        RuntimeError: If the remote cannot be reached or has no such revision
+    """
+    ref = rev or "HEAD"
+    try:
+        result = subprocess.run(
+            ["git", "ls-remote", url, ref, f"{ref}^{{}}"],
+            capture_output=True, text=True, check=True, timeout=timeout
+        )
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+        stderr = getattr(e, "stderr", None)
+        raise RuntimeError(f"git ls-remote {url} failed: {stderr.strip() if stderr else e}")
+
+    refs = dict(reversed(line.split("\t", 1)) for line in result.stdout.splitlines() if "\t" in line)
+    # A pattern also matches remote-tracking refs; an annotated tag's commit is its peeled (^{}) ref
+    for name in (f"refs/tags/{ref}^{{}}", f"refs/heads/{ref}", f"refs/tags/{ref}", ref):
+        if name in refs:
+            return refs[name]
+    # ls-remote matches patterns by path suffix, so "main" also lists refs/heads/release/main
+    raise RuntimeError(f"Revision '{ref}' not found in {url}")
@@ -0,0 +1,77 @@
+"""Data-dependency graph across the registry catalog.
+
+Projects record the data products they import under
+``metadata.data_dependencies``. The graph aggregates those records for the
+whole catalog into forward (``consumer -> sources``) and reverse
+(``source -> consumers``) adjacency lists. It is stored precomputed in the
+catalog index, so "who depends on this product" is a dictionary lookup and
+transitive impact is a breadth-first walk over in-memory lists.
+"""
+
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+
+def extract_dependencies(catalog_data: Dict[str, Any]) -> List[str]:
+    """Return the sorted, de-duplicated data product names an entry depends on."""
+    metadata = catalog_data.get("metadata") if isinstance(catalog_data, dict) else None
+    records = metadata.get("data_dependencies") if isinstance(metadata, dict) else None
+    sources = set()
+    for record in records or []:
+        if isinstance(record, dict) and record.get("source"):
+            sources.add(str(record["source"]))
+        elif isinstance(record, str):
+            sources.add(record)
+    return sorted(sources)
+
+
+def build_dependency_graph(forward: Dict[str, List[str]]) -> Dict[str, Dict[str, List[str]]]:
+    """Build forward and reverse adjacency from per-entry dependency lists.
+
+    Args:
+        forward: Mapping of catalog entry name to the products it depends on
+
+    Returns:
+        ``{"forward": {...}, "reverse": {...}}`` with sorted adjacency lists;
+        entries without dependencies are omitted from ``forward``
+    """
+    reverse: Dict[str, List[str]] = {}
+    for consumer, sources in forward.items():
+        for source in sources:
+            reverse.setdefault(source, []).append(consumer)
+
+    return {
+        "forward": {name: sorted(sources) for name, sources in sorted(forward.items()) if sources},
+        "reverse": {name: sorted(consumers) for name, consumers in sorted(reverse.items())},
+    }
+
+
+def walk(adjacency: Dict[str, List[str]], start: str,
+         max_depth: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Breadth-first walk from ``start``, visiting each node once.
+
+    Args:
+        adjacency: ``forward`` or ``reverse`` adjacency from the graph
+        start: Node to start from (not included in the result)
+        max_depth: Stop after this many hops (None for the full closure)
+
+    Returns:
+        List of ``{"name", "depth", "via"}`` dictionaries ordered by depth
+        then name, where ``via`` is the node through which it was reached
+    """
+    seen = {start}
+    frontier = deque([(start, 0)])
+    reached = []
+
+    while frontier:
+        node, depth = frontier.popleft()
+        if max_depth is not None and depth >= max_depth:
+            continue
+        for neighbour in adjacency.get(node, ()):
+            if neighbour in seen:
+                continue
+            seen.add(neighbour)
+            reached.append({"name": neighbour, "depth": depth + 1, "via": node})
+            frontier.append((neighbour, depth + 1))
+
+    return sorted(reached, key=lambda item: (item["depth"], item["name"]))
@@ -0,0 +1,436 @@
+"""Shared access to DVC for mintd.
+
+mintd drives DVC through its Python API (``dvc.repo.Repo``) instead of
+spawning the ``dvc`` CLI for every step, which costs about a second of
+interpreter and plugin start-up per call. One adapter, holding one Repo, is
+kept per project directory, and every operation is timed. The CLI is used
+instead when the API cannot be imported or the installed DVC's ``Repo``
+lacks the methods and arguments mintd calls (checked once per process), or
+when ``MINTD_DVC_BACKEND=cli`` is set. On the API backend,
+DVC's clones of source repositories are made from mintd's cached mirrors
+(see ``source_mirror``).
+"""
+
+import inspect
+import json
+import logging
+import os
+import re
+import subprocess
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# "api" (in-process, the default) or "cli" (spawn the dvc executable)
+BACKEND_ENV = "MINTD_DVC_BACKEND"
+
+# Repo methods mintd calls and the keyword arguments it passes them
+# (``imp`` hands its keyword arguments on to ``imp_url``)
+_API_SIGNATURES = {
+    "imp": ("out", "rev"),
+    "imp_url": ("no_download", "jobs"),
+    "pull": ("targets", "jobs"),
+    "fetch": ("targets", "jobs"),
+    "update": ("targets", "rev", "no_download", "jobs"),
+    "ls": ("rev", "recursive", "dvc_only"),
+}
+
+
+class DVCError(Exception):
+    """A DVC operation failed."""
+
+
+@lru_cache(maxsize=None)
+def _api_incompatibility() -> Optional[str]:
+    """Why the installed DVC's Python API cannot be used, or None if it can."""
+    try:
+        from dvc.repo import Repo
+    except ImportError as e:
+        return f"dvc.repo cannot be imported ({e})"
+    for name, keywords in _API_SIGNATURES.items():
+        method = getattr(Repo, name, None)
+        if method is None:
+            return f"dvc.repo.Repo has no {name}()"
+        parameters = inspect.signature(method).parameters
+        missing = [keyword for keyword in keywords if keyword not in parameters]
+        if missing:
+            return f"dvc.repo.Repo.{name}() takes no {', '.join(missing)}"
+    return None
+
+
+def _default_backend() -> str:
+    if os.getenv(BACKEND_ENV, "").lower() == "cli":
+        return "cli"
+    reason = _api_incompatibility()
+    if reason:
+        logger.warning("Running DVC through its CLI: %s", reason)
+        return "cli"
+    return "api"
+
+
+def match_paths(paths: Iterable[str], include: Iterable[str] = (), exclude: Iterable[str] = ()) -> List[str]:
+    """Filter relative paths with glob patterns, e.g. ``year=2023/*``.
+
+    A pattern matches a path if it matches the path itself or one of its
+    parent directories, so ``year=2023`` selects everything under that
+    directory. With no include patterns every path is included.
+
+    Args:
+        paths: POSIX paths relative to the directory being filtered
+        include: Keep only paths matching one of these patterns
+        exclude: Then drop paths matching any of these patterns
+
+    Returns:
+        The matching paths, in input order
+    """
+    include = [pattern.rstrip("/") for pattern in include]
+    exclude = [pattern.rstrip("/") for pattern in exclude]
+
+    def matches(path: str, patterns: List[str]) -> bool:
+        parts = path.split("/")
+        prefixes = ["/".join(parts[:i]) for i in range(1, len(parts) + 1)]
+        return any(fnmatchcase(prefix, pattern) for pattern in patterns for prefix in prefixes)
+
+    return [path for path in paths
+            if (not include or matches(path, include)) and not matches(path, exclude)]
+
+
+@contextmanager
+def _quiet_dvc_logger() -> Iterator[None]:
+    """Hide DVC's informational console output, as the captured CLI output was."""
+    import dvc  # noqa: F401  (importing dvc configures its logger)
+
+    dvc_logger = logging.getLogger("dvc")
+    level = dvc_logger.level
+    dvc_logger.setLevel(max(level, logging.WARNING))
+    try:
+        yield
+    finally:
+        dvc_logger.setLevel(level)
+
+
+class DVCAdapter:
+    """DVC operations on one project, in-process where possible.
+
+    Example:
+        dvc = get_dvc_adapter(project_path)
+        dvc.imp(url, "data/final", "data/imports/claims", no_download=True)
+        dvc.pull(["data/imports/claims.dvc"], jobs=8)
+        print(dvc.timings)
+    """
+
+    def __init__(self, root: Path, backend: Optional[str] = None):
+        """
+        Initialize the adapter.
+
+        Args:
+            root: Project directory (the DVC repository root)
+            backend: "api" or "cli" (default: from MINTD_DVC_BACKEND, else "api")
+        """
+        self.root = Path(root)
+        self.backend = backend or _default_backend()
+        self.timings: List[Dict[str, Any]] = []
+        self._repo = None
+        # DVC locks the whole repository per operation and a Repo object is
+        # not thread-safe, so operations on one project take turns
+        self._lock = threading.RLock()
+
+    @property
+    def repo(self):
+        """The project's ``dvc.repo.Repo``, opened on first use."""
+        if self._repo is None:
+            from dvc.repo import Repo
+            self._repo = Repo(str(self.root))
+        return self._repo
+
+    @contextmanager
+    def _timed(self, operation: str) -> Iterator[Dict[str, Any]]:
+        timing = {"operation": operation, "backend": self.backend, "seconds": 0.0}
+        start = time.perf_counter()
+        try:
+            yield timing
+        finally:
+            timing["seconds"] = round(time.perf_counter() - start, 3)
+            self.timings.append(timing)
+            logger.debug("dvc %s (%s) took %.3fs", operation, timing["backend"], timing["seconds"])
+
+    def _cli(self, args: List[str]) -> str:
+        try:
+            result = subprocess.run(["dvc", *args], cwd=self.root, capture_output=True, text=True, check=True)
+        except FileNotFoundError:
+            raise DVCError("dvc command not found")
+        except subprocess.CalledProcessError as e:
+            raise DVCError(e.stderr.strip() if e.stderr else str(e))
+        return result.stdout
+
+    def _run(self, operation: str, api: Callable[[], Any], cli_args: List[str]) -> Any:
+        """Run ``api`` in-process, or ``dvc <cli_args>`` on the CLI backend."""
+        with self._lock, self._timed(operation):
+            if self.backend == "api":
+                # Operations may have been partly applied, so errors are not retried on the CLI
+                try:
+                    with _quiet_dvc_logger():
+                        return api()
+                except Exception as e:
+                    raise DVCError(str(e)) from e
+            return self._cli(cli_args)
+
+    def _use_mirrors(self, urls: Iterable[str], refresh: bool = False) -> None:
+        """Have in-process DVC clone these source repositories from their cached mirrors."""
+        from .source_mirror import use_mirror_for_dvc
+
+        for url in dict.fromkeys(url for url in urls if url):
+            use_mirror_for_dvc(url, refresh=refresh)
+
+    def _import_urls(self, targets: Iterable[str]) -> List[str]:
+        """Source repository URLs of the imports among ``targets``.
+
+        Targets are .dvc files or paths inside an import's output, relative
+        to the project; targets that are not imports are skipped.
+        """
+        import yaml
+
+        urls = []
+        for target in targets:
+            parts = target.rstrip("/").split("/")
+            candidates = [target] if target.endswith(".dvc") else \
+                ["/".join(parts[:i]) + ".dvc" for i in range(len(parts), 0, -1)]
+            for candidate in candidates:
+                try:
+                    stage = yaml.safe_load((self.root / candidate).read_text()) or {}
+                    urls.append(stage["deps"][0]["repo"]["url"])
+                    break
+                except FileNotFoundError:
+                    continue
+                except (OSError, yaml.YAMLError, KeyError, IndexError, TypeError):
+                    break
+        return urls
+
+    @staticmethod
+    def _level_args(level: Optional[str]) -> List[str]:
+        return [f"--{level}"] if level else []
+
+    def init(self) -> None:
+        """Initialise DVC in the project (``dvc init``)."""
+        def from_api() -> None:
+            from dvc.repo import Repo
+            self._repo = Repo.init(str(self.root))
+
+        self._run("init", from_api, ["init"])
+
+    def _config_edit(self, level: Optional[str], edit: Callable[[Dict[str, Any]], None]) -> None:
+        repo = self.repo
+        with repo.config.edit(level) as conf:
+            edit(conf)
+        # The Repo builds its cache and remotes from the config when opened
+        repo.close()
+        self._repo = None
+
+    def remote_add(self, name: str, url: str, default: bool = False,
+                   level: Optional[str] = None, force: bool = False) -> None:
+        """Add a remote (``dvc remote add``).
+
+        Args:
+            name: Remote name
+            url: Remote URL
+            default: Make it the default remote
+            level: Config level ("global", "system", "local"; default: the repo config)
+            force: Overwrite an existing remote of the same name
+        """
+        name = name.lower()
+
+        def edit(conf: Dict[str, Any]) -> None:
+            if name in conf["remote"] and not force:
+                raise DVCError(f"remote '{name}' already exists. Use force to overwrite it.")
+            conf["remote"][name] = {"url": url}
+            if default:
+                conf["core"]["remote"] = name
+
+        cli_args = ["remote", "add", *self._level_args(level)]
+        cli_args += (["-d"] if default else []) + (["-f"] if force else []) + [name, url]
+        self._run("remote add", lambda: self._config_edit(level, edit), cli_args)
+
+    def remote_modify(self, name: str, option: str, value: str, level: Optional[str] = None) -> None:
+        """Set an option of a remote (``dvc remote modify``)."""
+        name = name.lower()
+
+        def edit(conf: Dict[str, Any]) -> None:
+            conf["remote"].setdefault(name, {})[option] = value
+
+        cli_args = ["remote", "modify", *self._level_args(level), name, option, value]
+        self._run("remote modify", lambda: self._config_edit(level, edit), cli_args)
+
+    def config(self, option: str, value: str, level: Optional[str] = None) -> None:
+        """Set a DVC config option such as ``cache.type`` (``dvc config``)."""
+        section, key = option.split(".", 1)
+
+        def edit(conf: Dict[str, Any]) -> None:
+            conf[section][key] = value
+
+        cli_args = ["config", *self._level_args(level), option, value]
+        self._run("config", lambda: self._config_edit(level, edit), cli_args)
+
+    def imp(self, url: str, path: str, out: str, rev: Optional[str] = None,
+            no_download: bool = False, jobs: Optional[int] = None) -> None:
+        """Import a path from another DVC repository (``dvc import``).
+
+        Args:
+            url: Source repository URL
+            path: Path in the source repository
+            out: Destination, relative to the project
+            rev: Source revision
+            no_download: Only write the .dvc file; fetch the data with ``pull``
+            jobs: Parallel download jobs
+        """
+        cli_args = ["import", url, path, "-o", out]
+        cli_args += (["--rev", rev] if rev else []) + (["--no-download"] if no_download else [])
+        cli_args += ["--jobs", str(jobs)] if jobs else []
+
+        def from_api() -> None:
+            self._use_mirrors([url])
+            self.repo.imp(url, path, out=str(self.root / out), rev=rev, no_download=no_download, jobs=jobs)
+
+        self._run("import", from_api, cli_args)
+
+    def pull(self, targets: Optional[List[str]] = None, jobs: Optional[int] = None) -> None:
+        """Fetch and check out tracked data (``dvc pull``).
+
+        Args:
+            targets: .dvc files or outputs, relative to the project (default: everything)
+            jobs: Parallel transfer jobs
+        """
+        targets = list(targets or [])
+        cli_args = ["pull", *targets] + (["--jobs", str(jobs)] if jobs else [])
+
+        def from_api() -> None:
+            self._use_mirrors(self._import_urls(targets))
+            self.repo.pull(targets=[str(self.root / t) for t in targets] or None, jobs=jobs)
+
+        self._run("pull", from_api, cli_args)
+
+    def fetch(self, targets: Optional[List[str]] = None, jobs: Optional[int] = None) -> Optional[int]:
+        """Download tracked data into the cache without checking it out (``dvc fetch``).
+
+        Args:
+            targets: .dvc files or outputs, relative to the project (default: everything)
+            jobs: Parallel transfer jobs
+
+        Returns:
+            Number of objects downloaded (None if the CLI did not report it)
+        """
+        targets = list(targets or [])
+        cli_args = ["fetch", *targets] + (["--jobs", str(jobs)] if jobs else [])
+
+        def from_api() -> int:
+            self._use_mirrors(self._import_urls(targets))
+            return self.repo.fetch(targets=[str(self.root / t) for t in targets] or None, jobs=jobs)
+
+        fetched = self._run("fetch", from_api, cli_args)
+        if isinstance(fetched, str):
+            match = re.search(r"(\d+) files? fetched", fetched)
+            return int(match.group(1)) if match else (0 if "Everything is up to date" in fetched else None)
+        return fetched
+
+    def update(self, targets: List[str], rev: Optional[str] = None, no_download: bool = False,
+               jobs: Optional[int] = None) -> None:
+        """Move imports to the latest commit of their source (``dvc update``).
+
+        Args:
+            targets: .dvc files of imports, relative to the project
+            rev: Revision to move to (default: the revision each import tracks)
+            no_download: Only rewrite the .dvc files; fetch the data with ``pull``
+            jobs: Parallel download jobs
+        """
+        cli_args = ["update", *targets]
+        cli_args += (["--rev", rev] if rev else []) + (["--no-download"] if no_download else [])
+        cli_args += ["--jobs", str(jobs)] if jobs else []
+
+        def from_api() -> None:
+            self._use_mirrors(self._import_urls(targets), refresh=True)
+            self.repo.update(targets=[str(self.root / t) for t in targets], rev=rev, no_download=no_download,
+                             jobs=jobs)
+
+        self._run("update", from_api, cli_args)
+
+    def ls(self, url: str, path: str, rev: Optional[str] = None, recursive: bool = False) -> List[Dict[str, Any]]:
+        """List DVC-tracked entries of a repository (``dvc ls --dvc-only``).
+
+        Directory outputs are listed from their ``.dir`` manifest, which is
+        fetched from the remote if needed; no file contents are downloaded.
+
+        Args:
+            url: Repository URL or local path
+            path: Path in the repository
+            rev: Git revision
+            recursive: List files in subdirectories too
+
+        Returns:
+            Entries with ``path`` (relative to ``path``), ``isdir``, ``size`` and ``md5``
+        """
+        def from_api() -> List[Dict[str, Any]]:
+            from dvc.repo import Repo
+            self._use_mirrors([url])
+            return Repo.ls(url, path, rev=rev, recursive=recursive, dvc_only=True)
+
+        cli_args = ["ls", url, path, "--json", "--dvc-only"]
+        cli_args += (["--rev", rev] if rev else []) + (["-R"] if recursive else [])
+        entries = self._run("ls", from_api, cli_args)
+        return json.loads(entries) if isinstance(entries, str) else entries
+
+    def glob(self, url: str, path: str, include: Iterable[str] = (), exclude: Iterable[str] = (),
+             rev: Optional[str] = None) -> List[str]:
+        """Files of a tracked directory that match glob filters (see ``match_paths``).
+
+        Args:
+            url: Repository URL or local path
+            path: DVC-tracked directory in the repository
+            include: Patterns selecting files, relative to ``path``
+            exclude: Patterns dropping files, relative to ``path``
+            rev: Git revision
+
+        Returns:
+            Matching file paths, relative to ``path``
+
+        Raises:
+            DVCError: If no file matches
+        """
+        files = [entry["path"] for entry in self.ls(url, path, rev=rev, recursive=True) if not entry.get("isdir")]
+        matched = match_paths(files, include, exclude)
+        if not matched:
+            filters = " ".join([f"--include '{p}'" for p in include] + [f"--exclude '{p}'" for p in exclude])
+            raise DVCError(f"No files under {path} match {filters}")
+        return matched
+
+    def timing_summary(self, since: int = 0) -> Dict[str, Dict[str, float]]:
+        """Call count and total seconds per operation, in first-use order.
+
+        Args:
+            since: Only count operations from this index of ``timings`` on
+        """
+        summary: Dict[str, Dict[str, float]] = OrderedDict()
+        for timing in self.timings[since:]:
+            entry = summary.setdefault(timing["operation"], {"calls": 0, "seconds": 0.0})
+            entry["calls"] += 1
+            entry["seconds"] = round(entry["seconds"] + timing["seconds"], 3)
+        return summary
+
+
+_adapters: Dict[Path, DVCAdapter] = {}
+_adapters_lock = threading.Lock()
+
+
+def get_dvc_adapter(project_path: Path) -> DVCAdapter:
+    """Return the shared adapter for a project, creating it on first use."""
+    key = Path(project_path).resolve()
+    with _adapters_lock:
+        adapter = _adapters.get(key)
+        if adapter is None:
+            adapter = _adapters[key] = DVCAdapter(key)
+        return adapter
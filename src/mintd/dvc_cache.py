@@ -0,0 +1,179 @@
+"""Lab-wide shared DVC cache.
+
+When ``dvc_cache.dir`` is set in the mintd config, new projects, data imports
+and enclave staging repositories point DVC at that one cache directory
+instead of a private ``.dvc/cache`` each, and check data out as links into it
+(``dvc_cache.type``), so an object used by many projects is stored once. The
+projects configured this way are recorded so that ``mintd cache`` can compare
+the data they track with what the cache actually holds.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import yaml
+
+from .config import CONFIG_DIR, get_config
+from .dvc_adapter import DVCAdapter
+
+# Link types tried, in order, when checking data out of the shared cache
+DEFAULT_LINK_TYPES = "reflink,hardlink,symlink"
+
+# Projects that have been pointed at the shared cache
+PROJECTS_FILE = CONFIG_DIR / "shared_cache_projects.json"
+
+
+def get_shared_cache_settings(config: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, str]]:
+    """Return the shared cache settings, or None if no shared cache is configured.
+
+    Args:
+        config: mintd configuration (default: loaded from ~/.mintd/config.yaml)
+
+    Returns:
+        Dictionary with ``dir``, ``shared`` and ``type``
+    """
+    section = (config if config is not None else get_config()).get("dvc_cache") or {}
+    if not section.get("dir"):
+        return None
+    return {
+        "dir": str(Path(section["dir"]).expanduser().resolve()),
+        "shared": section.get("shared", "group") or "",
+        "type": section.get("type") or DEFAULT_LINK_TYPES,
+    }
+
+
+def configure_shared_cache(dvc: DVCAdapter, link_types: Optional[str] = None,
+                           record: bool = True) -> bool:
+    """Point a DVC repository at the shared cache, if one is configured.
+
+    The settings go into the repository's local (uncommitted) config, since
+    the cache path is specific to this machine.
+
+    Args:
+        dvc: Adapter of the repository to configure
+        link_types: Override ``dvc_cache.type`` for this repository
+        record: Record the repository for ``mintd cache`` (off for throwaway clones)
+
+    Returns:
+        True if a shared cache was configured
+    """
+    settings = get_shared_cache_settings()
+    if settings is None:
+        return False
+
+    Path(settings["dir"]).mkdir(parents=True, exist_ok=True)
+    dvc.config("cache.dir", settings["dir"], level="local")
+    if settings["shared"]:
+        dvc.config("cache.shared", settings["shared"], level="local")
+    dvc.config("cache.type", link_types or settings["type"], level="local")
+
+    if record:
+        _record_project(dvc.root)
+    return True
+
+
+def _load_projects() -> List[str]:
+    try:
+        with open(PROJECTS_FILE, "r") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return []
+
+
+def _record_project(project_path: Path) -> None:
+    project = str(Path(project_path).resolve())
+    projects = _load_projects()
+    if project in projects:
+        return
+    PROJECTS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = PROJECTS_FILE.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        json.dump(sorted(projects + [project]), f, indent=2)
+    tmp.replace(PROJECTS_FILE)
+
+
+def _iter_tracked_outputs(project_path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield the ``outs`` entries of every .dvc file and dvc.lock in a project."""
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    for root, dirs, files in os.walk(project_path):
+        dirs[:] = [d for d in dirs if d not in (".git", ".dvc")]
+        for name in files:
+            if not (name.endswith(".dvc") or name == "dvc.lock"):
+                continue
+            try:
+                with open(Path(root) / name, "r") as f:
+                    data = yaml.load(f, Loader=loader) or {}
+            except (OSError, yaml.YAMLError):
+                continue
+            if name == "dvc.lock":
+                stages = (data.get("stages") or {}).values()
+                outs = [out for stage in stages for out in stage.get("outs") or []]
+            else:
+                outs = data.get("outs") or []
+            yield from (out for out in outs if isinstance(out, dict))
+
+
+def _stored_size(cache_dir: Path) -> Dict[str, int]:
+    """Objects and bytes held in a cache directory, counting each inode once."""
+    seen = set()
+    objects = stored = 0
+    for root, _, files in os.walk(cache_dir):
+        for name in files:
+            stat = os.lstat(os.path.join(root, name))
+            if (stat.st_dev, stat.st_ino) in seen:
+                continue
+            seen.add((stat.st_dev, stat.st_ino))
+            objects += 1
+            stored += stat.st_size
+    return {"objects": objects, "stored_bytes": stored}
+
+
+def cache_report() -> Optional[Dict[str, Any]]:
+    """Summarise what the shared cache holds against what its projects track.
+
+    Returns:
+        None if no shared cache is configured, otherwise a dictionary with the
+        cache settings, ``objects`` and ``stored_bytes`` in the cache, one
+        ``projects`` entry per recorded project (``path``, ``outputs``,
+        ``tracked_bytes``), the total ``tracked_bytes`` and ``saved_bytes``
+        (what separate per-project caches would have needed beyond the
+        shared one)
+    """
+    settings = get_shared_cache_settings()
+    if settings is None:
+        return None
+
+    projects = []
+    for project in _load_projects():
+        path = Path(project)
+        if not (path / ".dvc").is_dir():
+            continue
+        outs = list(_iter_tracked_outputs(path))
+        projects.append({
+            "path": project,
+            "outputs": len(outs),
+            "tracked_bytes": sum(int(out.get("size") or 0) for out in outs),
+        })
+
+    stored = _stored_size(Path(settings["dir"]))
+    tracked = sum(project["tracked_bytes"] for project in projects)
+    return {
+        **settings,
+        **stored,
+        "projects": projects,
+        "tracked_bytes": tracked,
+        "saved_bytes": max(0, tracked - stored["stored_bytes"]),
+    }
+
+
+def format_size(size: float) -> str:
+    """Human-readable byte count (e.g. ``1.5 GB``)."""
+    if size < 1024:
+        return f"{size:.0f} B"
+    for unit in ("KB", "MB", "GB"):
+        size /= 1024
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+    return f"{size / 1024:.1f} TB"
@@ -15,6 +15,8 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional, Any
 
+from .dvc_adapter import DVCError, get_dvc_adapter
+from .dvc_cache import configure_shared_cache
 from .registry import query_registry_for_product
 from .config import get_config
 
@@ -50,8 +52,8 @@ def convert_to_ssh_url(https_url: str) -> str:
 
 def configure_dvc_remote(repo_dir: Path, repo_name: str, dvc_remote_url: str = "") -> None:
     """Configure DVC remote in cloned repo."""
-    import subprocess
-    
+    dvc = get_dvc_adapter(repo_dir)
+
     # First, check what remote name the repo expects
     repo_config = repo_dir / ".dvc" / "config"
     expected_remote = "storage"  # Default
@@ -66,45 +68,49 @@ def configure_dvc_remote(repo_dir: Path, repo_name: str, dvc_remote_url: str = "
     # If we have an explicit URL from registry, use it directly
     if dvc_remote_url:
         try:
-            subprocess.run(
-                ["dvc", "remote", "add", "-f", expected_remote, dvc_remote_url],
-                capture_output=True, text=True, cwd=repo_dir
-            )
-            
-            # Copy endpoint configuration from mintd config if needed
-            config = get_config()
-            endpoint = config.get('storage', {}).get('endpoint', '')
-            if endpoint:
-                subprocess.run(
-                    ["dvc", "remote", "modify", expected_remote, "endpointurl", endpoint],
-                    capture_output=True, text=True, cwd=repo_dir
-                )
-            return
-        except Exception:
+            dvc.remote_add(expected_remote, dvc_remote_url, force=True)
+        except DVCError:
             pass
+
+        # Copy endpoint configuration from mintd config if needed
+        config = get_config()
+        endpoint = config.get('storage', {}).get('endpoint', '')
+        if endpoint:
+            try:
+                dvc.remote_modify(expected_remote, "endpointurl", endpoint)
+            except DVCError:
+                pass
+        return
     
     # Fallback: search global DVC config (simplified for now)
     try:
-        subprocess.run(
-            ["dvc", "remote", "add", "-f", expected_remote, f"s3://cooper-globus/lab/{repo_name}/"],
-            capture_output=True, text=True, cwd=repo_dir
-        )
-    except Exception:
+        dvc.remote_add(expected_remote, f"s3://cooper-globus/lab/{repo_name}/", force=True)
+    except DVCError:
         pass
 
-def pull_dvc_data(repo_dir: Path, repo_name: str, stage: str, dvc_remote_url: str = "") -> None:
-    """Pull DVC data for a specific stage using DVC Repo API."""
-    from dvc.repo import Repo as DVCRepo
-    
+def pull_dvc_data(repo_dir: Path, repo_name: str, stage: str, dvc_remote_url: str = "",
+                  include: Optional[List[str]] = None, exclude: Optional[List[str]] = None) -> None:
+    """Pull DVC data for a specific stage using the shared DVC adapter.
+
+    With ``include``/``exclude`` glob patterns (relative to the stage
+    directory), only the matching files listed in the stage's .dir manifest
+    are fetched and checked out.
+    """
     configure_dvc_remote(repo_dir, repo_name, dvc_remote_url)
+    dvc = get_dvc_adapter(repo_dir)
+    configure_shared_cache(dvc)
     
-    repo = DVCRepo(repo_dir)
     stage_dvc = repo_dir / "data" / f"{stage}.dvc"
     
-    if stage_dvc.exists():
-        repo.pull(targets=[str(stage_dvc)])
+    if stage_dvc.exists() and (include or exclude):
+        files = dvc.glob(str(repo_dir), f"data/{stage}", include or [], exclude or [])
+        # Files an earlier, differently filtered pull left behind would be copied too
+        shutil.rmtree(repo_dir / "data" / stage, ignore_errors=True)
+        dvc.pull([f"data/{stage}/{file}" for file in files])
+    elif stage_dvc.exists():
+        dvc.pull([str(stage_dvc.relative_to(repo_dir))])
     else:
-        repo.pull()
+        dvc.pull()
 
 def get_dvc_hash(repo_dir: Path, stage: str) -> Tuple[str, str]:
     """Get DVC hash and commit for a stage."""
@@ -196,7 +202,8 @@ def pull_enclave_data(enclave_path: Path, repo_name: Optional[str] = None, pull_
         repo_dir = clone_or_update_repo(curr_repo, repo_info['repo_url'], enclave_path)
         
         data_stage = item.get('stage', 'final')
-        pull_dvc_data(repo_dir, curr_repo, data_stage, repo_info.get('dvc_remote_url', ''))
+        pull_dvc_data(repo_dir, curr_repo, data_stage, repo_info.get('dvc_remote_url', ''),
+                      include=item.get('include'), exclude=item.get('exclude'))
         
         dvc_hash, git_commit = get_dvc_hash(repo_dir, data_stage)
         # Unified naming: hash-date
@@ -0,0 +1,146 @@
+"""Read git objects through one long-lived ``git cat-file --batch`` process.
+
+Spawning git per file costs far more than reading the file. ``GitObjectReader``
+keeps a single ``cat-file --batch`` process per repository and answers any
+number of object lookups over its pipes, with no working tree involved.
+"""
+
+import subprocess
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+
+class GitObjectReader:
+    """Read blobs from a git object database over a persistent pipe.
+
+    Example:
+        with GitObjectReader(mirror_path) as reader:
+            data = reader.read("HEAD:catalog/data/data_example.yaml")
+    """
+
+    def __init__(self, git_dir: Path):
+        """
+        Initialize the reader. The git process starts on first use.
+
+        Args:
+            git_dir: Path to the repository's git directory (bare repo or ``.git``)
+        """
+        self.git_dir = Path(git_dir)
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                ['git', '--git-dir', str(self.git_dir), 'cat-file', '--batch'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+        return self._proc
+
+    def _read_response(self, proc: subprocess.Popen) -> Optional[bytes]:
+        """Read one ``<sha> <type> <size>\\n<data>\\n`` response (None for missing objects)."""
+        header = proc.stdout.readline()
+        if not header:
+            raise RuntimeError(f"git cat-file exited unexpectedly for {self.git_dir}")
+
+        parts = header.split()
+        if len(parts) < 3 or parts[-1] == b"missing":
+            return None
+
+        size = int(parts[2])
+        data = proc.stdout.read(size)
+        proc.stdout.read(1)  # trailing newline
+        return data
+
+    def read(self, spec: str) -> Optional[bytes]:
+        """Return the contents of one object.
+
+        Args:
+            spec: Object name, e.g. a blob SHA or ``<rev>:<path>``
+
+        Returns:
+            Object contents, or None if the object does not exist
+        """
+        return self.read_many([spec])[spec]
+
+    def read_many(self, specs: Iterable[str]) -> Dict[str, Optional[bytes]]:
+        """Return the contents of many objects in one pipelined exchange.
+
+        Requests are written in batches and their responses read back in
+        order, so the pipe never waits on a round-trip per object.
+
+        Args:
+            specs: Object names (blob SHAs or ``<rev>:<path>``)
+
+        Returns:
+            Dictionary mapping each spec to its contents (None if missing)
+        """
+        specs = [spec for spec in specs]
+        results: Dict[str, Optional[bytes]] = {}
+
+        with self._lock:
+            proc = self._ensure_started()
+            # Keep the request side smaller than the pipe buffer so git never blocks on us
+            batch_size = 256
+            for start in range(0, len(specs), batch_size):
+                batch = specs[start:start + batch_size]
+                proc.stdin.write(b"".join(f"{spec}\n".encode() for spec in batch))
+                proc.stdin.flush()
+                for spec in batch:
+                    results[spec] = self._read_response(proc)
+
+        return results
+
+    def close(self) -> None:
+        """Stop the git process."""
+        with self._lock:
+            if self._proc is not None:
+                if self._proc.poll() is None:
+                    self._proc.stdin.close()
+                    try:
+                        self._proc.wait(timeout=5)
+                    except subprocess.TimeoutExpired:
+                        self._proc.kill()
+                        self._proc.wait()
+                self._proc.stdout.close()
+                self._proc = None
+
+    def __enter__(self) -> "GitObjectReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+def ls_tree(git_dir: Path, ref: str, path: str) -> Dict[str, str]:
+    """List the blobs under ``path`` at ``ref`` with their SHAs.
+
+    Args:
+        git_dir: Repository git directory
+        ref: Commit-ish to list
+        path: Directory prefix within the tree (e.g. ``catalog/``)
+
+    Returns:
+        Dictionary mapping file path to blob SHA
+    """
+    result = subprocess.run(
+        ['git', '--git-dir', str(git_dir), 'ls-tree', '-r', ref, path],
+        capture_output=True, text=True, check=True
+    )
+    tree = {}
+    for line in result.stdout.splitlines():
+        meta, _, file_path = line.partition("\t")
+        parts = meta.split()
+        if len(parts) == 3 and parts[1] == "blob":
+            tree[file_path] = parts[2]
+    return tree
+
@@ -0,0 +1,307 @@
+"""GitHub transports used by the registry to open and list pull requests.
+
+Two transports share one small interface:
+
+- ``GhCliTransport`` shells out to the GitHub CLI for every call. It needs no
+  token handling of its own and is the fallback.
+- ``HttpGitHubTransport`` talks to the REST API over one pooled
+  ``requests.Session`` (keep-alive), follows pagination, and sends
+  conditional requests with stored ETags so unchanged listings cost a
+  ``304 Not Modified`` and no rate limit.
+
+``get_github_transport`` picks between them from the ``registry.github_transport``
+setting.
+"""
+
+import json
+import os
+import subprocess
+import urllib.parse
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError
+
+from .registry_cache import CACHE_ROOT, write_json_atomic
+
+DEFAULT_API_URL = "https://api.github.com"
+
+# Stored ETags and response bodies for conditional requests
+ETAG_CACHE_PATH = CACHE_ROOT.parent / "github_etags.json"
+
+# Fields every transport returns for a pull request (the ``gh --json`` names)
+PR_FIELDS = ("number", "title", "url", "headRefName", "state", "body")
+
+
+class GitHubTransportError(Exception):
+    """Raised when a GitHub API call fails.
+
+    ``retry_safe`` is True when the call certainly had no effect on GitHub
+    (the connection was never made, or the credentials were rejected), so it
+    can be repeated through another transport even if it writes.
+    """
+
+    def __init__(self, message: str, retry_safe: bool = False):
+        super().__init__(message)
+        self.retry_safe = retry_safe
+
+
+class GitHubTransport(ABC):
+    """Interface shared by the GitHub transports."""
+
+    name = "base"
+
+    @abstractmethod
+    def create_pull_request(self, repo: str, title: str, body: str, head: str, base: str = "main") -> str:
+        """Open a pull request and return its URL.
+
+        Args:
+            repo: Repository as ``org/name``
+            title: PR title
+            body: PR body
+            head: Branch with the changes
+            base: Branch to merge into
+
+        Returns:
+            URL of the created pull request
+        """
+
+    @abstractmethod
+    def list_pull_requests(self, repo: str, state: str = "open", limit: int = 1000) -> List[Dict[str, Any]]:
+        """List pull requests with the fields in ``PR_FIELDS``.
+
+        Args:
+            repo: Repository as ``org/name``
+            state: ``open``, ``closed`` or ``all``
+            limit: Maximum number of pull requests returned
+
+        Returns:
+            List of pull request dictionaries
+        """
+
+
+class GhCliTransport(GitHubTransport):
+    """Run the GitHub CLI once per call."""
+
+    name = "gh"
+
+    def _run(self, *args: str) -> subprocess.CompletedProcess:
+        try:
+            return subprocess.run(["gh", *args], capture_output=True, text=True, check=True)
+        except FileNotFoundError:
+            raise GitHubTransportError("GitHub CLI (gh) is not installed")
+        except subprocess.CalledProcessError as e:
+            raise GitHubTransportError(f"gh {' '.join(args[:2])} failed: {e.stderr.strip()}")
+
+    def create_pull_request(self, repo: str, title: str, body: str, head: str, base: str = "main") -> str:
+        result = self._run("pr", "create", "--title", title, "--body", body,
+                           "--head", head, "--base", base, "--repo", repo)
+        return result.stdout.strip()
+
+    def list_pull_requests(self, repo: str, state: str = "open", limit: int = 1000) -> List[Dict[str, Any]]:
+        result = self._run("pr", "list", "--repo", repo, "--state", state,
+                           "--limit", str(limit), "--json", ",".join(PR_FIELDS))
+        try:
+            return json.loads(result.stdout or "[]")
+        except json.JSONDecodeError as e:
+            raise GitHubTransportError(f"Unexpected gh output: {e}")
+
+
+class HttpGitHubTransport(GitHubTransport):
+    """Call the GitHub REST API over a persistent, pooled HTTP session."""
+
+    name = "http"
+
+    def __init__(self, token: Optional[str] = None, api_url: str = DEFAULT_API_URL,
+                 etag_cache_path: Optional[Path] = None, timeout: float = 30.0):
+        """
+        Initialize the transport.
+
+        Args:
+            token: GitHub token (anonymous requests if None)
+            api_url: REST API root, e.g. for GitHub Enterprise
+            etag_cache_path: File to persist ETags in (in-memory only if None)
+            timeout: Per-request timeout in seconds
+        """
+        self.api_url = api_url.rstrip("/")
+        self.timeout = timeout
+        self.etag_cache_path = etag_cache_path
+
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=8))
+        self.session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=8))
+        self.session.headers.update({
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+            "User-Agent": "mintd",
+        })
+        if token:
+            self.session.headers["Authorization"] = f"Bearer {token}"
+
+        self._etags = self._load_etags()
+
+    def _load_etags(self) -> Dict[str, Dict[str, Any]]:
+        if not self.etag_cache_path:
+            return {}
+        try:
+            with open(self.etag_cache_path, "r") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _save_etags(self) -> None:
+        if self.etag_cache_path:
+            try:
+                write_json_atomic(self.etag_cache_path, self._etags)
+            except OSError:
+                pass
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        try:
+            response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+        except requests.RequestException as e:
+            raise GitHubTransportError(f"GitHub API request failed: {e}", retry_safe=_never_sent(e))
+        if response.status_code >= 400:
+            message = response.text[:200]
+            try:
+                message = response.json().get("message", message)
+            except ValueError:
+                pass
+            raise GitHubTransportError(f"GitHub API {method} {url} returned {response.status_code}: {message}",
+                                       retry_safe=response.status_code in (401, 403))
+        return response
+
+    def _get_json(self, url: str) -> Dict[str, Any]:
+        """GET ``url`` conditionally; returns the body and the next page URL."""
+        cached = self._etags.get(url)
+        headers = {"If-None-Match": cached["etag"]} if cached else {}
+
+        response = self._request("GET", url, headers=headers)
+        if response.status_code == 304 and cached:
+            return {"body": cached["body"], "next": cached.get("next")}
+
+        next_url = response.links.get("next", {}).get("url")
+        body = response.json()
+        if response.headers.get("ETag"):
+            self._etags[url] = {"etag": response.headers["ETag"], "body": body, "next": next_url}
+        return {"body": body, "next": next_url}
+
+    def create_pull_request(self, repo: str, title: str, body: str, head: str, base: str = "main") -> str:
+        response = self._request("POST", f"{self.api_url}/repos/{repo}/pulls",
+                                 json={"title": title, "body": body, "head": head, "base": base})
+        return response.json()["html_url"]
+
+    def list_pull_requests(self, repo: str, state: str = "open", limit: int = 1000) -> List[Dict[str, Any]]:
+        query = urllib.parse.urlencode({"state": state, "per_page": min(100, limit)})
+        url = f"{self.api_url}/repos/{repo}/pulls?{query}"
+
+        pulls = []
+        try:
+            while url and len(pulls) < limit:
+                page = self._get_json(url)
+                pulls.extend(page["body"])
+                url = page["next"]
+        finally:
+            self._save_etags()
+
+        return [
+            {
+                "number": pr["number"],
+                "title": pr["title"],
+                "url": pr["html_url"],
+                "headRefName": pr["head"]["ref"],
+                "state": pr["state"].upper(),
+                "body": pr.get("body") or "",
+            }
+            for pr in pulls[:limit]
+        ]
+
+
+def _never_sent(error: requests.RequestException) -> bool:
+    """Whether a request failed before a connection to the server was made."""
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, ConnectTimeoutError)  # includes connection refused and DNS failures
+
+
+class FallbackTransport(GitHubTransport):
+    """Use a primary transport, switching to a fallback after it fails.
+
+    Reads are repeated through the fallback after any failure. A pull
+    request is only created again when the primary's attempt certainly had
+    no effect, or when no open pull request from its branch exists, so a
+    timeout or server error cannot open the same registration twice.
+    """
+
+    def __init__(self, primary: GitHubTransport, fallback: GitHubTransport):
+        self.primary = primary
+        self.fallback = fallback
+        self.name = f"{primary.name}+{fallback.name}"
+
+    def create_pull_request(self, repo: str, title: str, body: str, head: str, base: str = "main") -> str:
+        try:
+            return self.primary.create_pull_request(repo, title, body, head, base=base)
+        except GitHubTransportError as e:
+            if not e.retry_safe:
+                # The request may have been applied before it failed
+                existing = [pr for pr in self.list_pull_requests(repo) if pr["headRefName"] == head]
+                if existing:
+                    return existing[0]["url"]
+        return self.fallback.create_pull_request(repo, title, body, head, base=base)
+
+    def list_pull_requests(self, repo: str, state: str = "open", limit: int = 1000) -> List[Dict[str, Any]]:
+        try:
+            return self.primary.list_pull_requests(repo, state=state, limit=limit)
+        except GitHubTransportError:
+            return self.fallback.list_pull_requests(repo, state=state, limit=limit)
+
+
+def find_github_token() -> Optional[str]:
+    """Find a GitHub token from the environment or the GitHub CLI's login.
+
+    Returns:
+        Token string, or None if none is available
+    """
+    for var in ("GITHUB_TOKEN", "GH_TOKEN"):
+        if os.getenv(var):
+            return os.environ[var].strip()
+    try:
+        result = subprocess.run(["gh", "auth", "token"], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    token = result.stdout.strip()
+    return token if result.returncode == 0 and token else None
+
+
+def get_github_transport(mode: str = "auto", api_url: Optional[str] = None) -> GitHubTransport:
+    """Create the GitHub transport selected by ``mode``.
+
+    Args:
+        mode: ``gh`` (CLI only), ``http`` (REST API only), or ``auto``
+            (REST API with the CLI as fallback when a token is available,
+            otherwise the CLI)
+        api_url: REST API root (default: https://api.github.com)
+
+    Returns:
+        GitHub transport
+
+    Raises:
+        ValueError: If ``mode`` is not recognised
+    """
+    mode = (mode or "auto").lower()
+    if mode == "gh":
+        return GhCliTransport()
+    if mode not in ("auto", "http"):
+        raise ValueError(f"Unknown GitHub transport '{mode}'. Use 'auto', 'http' or 'gh'.")
+
+    token = find_github_token()
+    if mode == "auto" and not token:
+        return GhCliTransport()
+
+    http = HttpGitHubTransport(token=token, api_url=api_url or DEFAULT_API_URL,
+                               etag_cache_path=ETAG_CACHE_PATH)
+    return http if mode == "http" else FallbackTransport(http, GhCliTransport())
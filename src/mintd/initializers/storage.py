@@ -1,6 +1,5 @@
 """DVC and storage initialization for S3-compatible buckets."""
 
-import subprocess
 import shutil
 from pathlib import Path
 from typing import Optional
@@ -9,6 +8,8 @@ import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 
 from ..config import get_config, get_storage_credentials
+from ..dvc_adapter import get_dvc_adapter
+from ..dvc_cache import configure_shared_cache
 
 # Mapping from sensitivity levels to ACL folder names
 SENSITIVITY_TO_ACL = {
@@ -63,28 +64,27 @@ def init_dvc(project_path: Path, bucket_prefix: str, sensitivity: str = "restric
     dvc_info = {"remote_name": remote_name, "remote_url": remote_url}
 
     try:
+        dvc = get_dvc_adapter(project_path)
+
         # Initialize DVC
-        _run_dvc_command(project_path, ["init"])
+        dvc.init()
+
+        # Use the lab-wide shared cache, if one is configured
+        configure_shared_cache(dvc)
 
         # Add as global remote so it's available across all projects
-        _run_dvc_command(project_path, ["remote", "add", "--global", "-d", remote_name, remote_url])
+        dvc.remote_add(remote_name, remote_url, default=True, level="global")
 
         # Configure remote settings (globally)
         if storage.get("endpoint"):
-            _run_dvc_command(project_path, [
-                "remote", "modify", "--global", remote_name, "endpointurl", storage["endpoint"]
-            ])
+            dvc.remote_modify(remote_name, "endpointurl", storage["endpoint"], level="global")
 
         if storage.get("region"):
-            _run_dvc_command(project_path, [
-                "remote", "modify", "--global", remote_name, "region", storage["region"]
-            ])
+            dvc.remote_modify(remote_name, "region", storage["region"], level="global")
 
         # Enable cloud versioning support
         if storage.get("versioning", True):
-            _run_dvc_command(project_path, [
-                "remote", "modify", "--global", remote_name, "version_aware", "true"
-            ])
+            dvc.remote_modify(remote_name, "version_aware", "true", level="global")
 
     except Exception as e:
         # For any DVC-related error, just warn and continue
@@ -128,33 +128,3 @@ def is_dvc_repo(project_path: Path) -> bool:
     """
     dvc_dir = project_path / ".dvc"
     return dvc_dir.is_dir()
-
-
-def _run_dvc_command(project_path: Path, args: list[str]) -> str:
-    """Run a DVC command in the project directory.
-
-    Args:
-        project_path: Path to the project directory
-        args: DVC command arguments
-
-    Returns:
-        Command output
-
-    Raises:
-        subprocess.CalledProcessError: If the command fails
-        FileNotFoundError: If dvc is not available
-    """
-    try:
-        result = subprocess.run(
-            ["dvc"] + args,
-            cwd=project_path,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return result.stdout
-    except FileNotFoundError:
-        raise FileNotFoundError("dvc command not found")
-    except subprocess.CalledProcessError:
-        # Re-raise for caller to handle
-        raise
\ No newline at end of file
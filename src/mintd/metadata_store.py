@@ -0,0 +1,199 @@
+"""Locked, atomic updates to a project's metadata.json.
+
+Imports, pipeline runs and ``mintd update`` commands all read-modify-write
+metadata.json. ``MetadataStore`` serialises those edits with an advisory lock
+on ``.mintd/metadata.lock`` (across processes) and a lock per store (across
+threads), and replaces the file atomically, so a reader never sees half a
+file and no edit is lost to a concurrent one. Edits made inside ``batch()``
+are queued and written together.
+"""
+
+import json
+import logging
+import os
+import stat
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+METADATA_FILE = "metadata.json"
+LOCK_FILE = Path(".mintd") / "metadata.lock"
+
+
+class MetadataStoreError(Exception):
+    """metadata.json could not be read or written."""
+
+
+class MetadataStore:
+    """Serialised read-modify-write access to one project's metadata.json.
+
+    Example:
+        store = get_metadata_store(project_path)
+        with store.edit() as metadata:
+            metadata["storage"]["sensitivity"] = "restricted"
+
+        with store.batch():
+            for dependency in dependencies:
+                store.update(lambda metadata, d=dependency: add(metadata, d))
+    """
+
+    def __init__(self, project_path: Path):
+        """
+        Initialize the store.
+
+        Args:
+            project_path: Project directory containing metadata.json
+        """
+        self.project_path = Path(project_path)
+        self.path = self.project_path / METADATA_FILE
+        self.lock_path = self.project_path / LOCK_FILE
+        self._lock = threading.RLock()
+        self._lock_depth = 0
+        self._lock_file = None
+        self._batch_depth = 0
+        self._pending: List[Callable[[Dict[str, Any]], None]] = []
+
+    def read(self) -> Dict[str, Any]:
+        """Return the current metadata. Writes are atomic, so no lock is needed."""
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise MetadataStoreError(f"{METADATA_FILE} not found in {self.project_path}")
+        except (OSError, ValueError) as e:
+            raise MetadataStoreError(f"Failed to read {self.path}: {e}")
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """Hold the project's metadata lock (re-entrant within a thread)."""
+        with self._lock:
+            if self._lock_depth == 0:
+                self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+                self._lock_file = open(self.lock_path, "a+")
+                _lock_file(self._lock_file)
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+                if self._lock_depth == 0:
+                    _unlock_file(self._lock_file)
+                    self._lock_file.close()
+                    self._lock_file = None
+
+    def _write(self, metadata: Dict[str, Any]) -> None:
+        fd, tmp_name = tempfile.mkstemp(dir=self.project_path, prefix=f".{METADATA_FILE}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(metadata, f, indent=2)
+                f.write("\n")
+                f.flush()
+                os.fsync(f.fileno())
+            # mkstemp creates the file owner-only; keep the mode metadata.json had
+            os.chmod(tmp_name, stat.S_IMODE(os.stat(self.path).st_mode))
+            os.replace(tmp_name, self.path)
+        except BaseException as e:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            if isinstance(e, (OSError, TypeError, ValueError)):
+                raise MetadataStoreError(f"Failed to write {self.path}: {e}")
+            raise
+
+    @contextmanager
+    def edit(self) -> Iterator[Dict[str, Any]]:
+        """Load metadata under the lock and write it back when the block exits.
+
+        Nothing is written if the block raises.
+        """
+        with self.locked():
+            metadata = self.read()
+            yield metadata
+            self._write(metadata)
+
+    def update(self, change: Callable[[Dict[str, Any]], None]) -> None:
+        """Apply ``change`` to the metadata, now or, inside ``batch()``, at the end of the batch."""
+        # Held across the edit too, so a batch cannot start between the check and the write
+        with self._lock:
+            if self._batch_depth:
+                self._pending.append(change)
+                return
+            with self.edit() as metadata:
+                change(metadata)
+
+    def flush(self) -> None:
+        """Write all queued changes in one locked read-modify-write."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            if not pending:
+                return
+            with self.edit() as metadata:
+                for change in pending:
+                    change(metadata)
+
+    @contextmanager
+    def batch(self) -> Iterator["MetadataStore"]:
+        """Queue ``update`` calls from any thread and write them together on exit.
+
+        Queued changes are written even if the block raises, since they
+        describe work that already happened; a failure to write them then
+        is logged rather than masking the original error.
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            if self._end_batch():
+                try:
+                    self.flush()
+                except MetadataStoreError as e:
+                    logger.warning("Discarded queued metadata changes: %s", e)
+            raise
+        if self._end_batch():
+            self.flush()
+
+    def _end_batch(self) -> bool:
+        """Leave a batch; True if it was the outermost one."""
+        with self._lock:
+            self._batch_depth -= 1
+            return self._batch_depth == 0
+
+
+def _lock_file(f) -> None:
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+
+def _unlock_file(f) -> None:
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+_stores: Dict[Path, MetadataStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_metadata_store(project_path: Path) -> MetadataStore:
+    """Return the shared store for a project, creating it on first use."""
+    key = Path(project_path).resolve()
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = MetadataStore(key)
+        return store
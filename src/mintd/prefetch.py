@@ -0,0 +1,197 @@
+"""Background prefetch of a project's data dependencies into the DVC cache.
+
+A fresh checkout of a project has the .dvc files of its imports but none of
+their data, so the first ``dvc repro`` or ``dvc checkout`` stalls on
+downloads. ``mintd data prefetch`` fetches every dependency recorded in
+data.lock and metadata.json into the project's DVC cache (the lab-wide
+shared cache, when one is configured) ahead of time. By default it runs in
+a detached process that logs its progress to ``.mintd/prefetch.log``, so it
+can be started right after ``git clone`` and left to run.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from rich.console import Console
+
+from .data_import import DataImportError, validate_project_directory
+from .data_lock import load_data_lock, read_dvc_import
+from .dvc_adapter import DVCAdapter, DVCError, get_dvc_adapter
+from .dvc_cache import configure_shared_cache
+from .registry import load_project_metadata
+
+console = Console()
+
+PREFETCH_LOG = Path(".mintd") / "prefetch.log"
+PREFETCH_PID = Path(".mintd") / "prefetch.pid"
+
+
+def _log(message: str) -> None:
+    console.print(f"{datetime.now():%H:%M:%S} {message}", highlight=False)
+
+
+def collect_dependencies(project_path: Path) -> List[Dict[str, Any]]:
+    """Data dependencies to prefetch: data.lock entries, then any others in metadata.json.
+
+    Returns:
+        One entry per .dvc file, in lock order
+    """
+    entries = load_data_lock(project_path)
+    try:
+        entries += load_project_metadata(project_path).get("metadata", {}).get("data_dependencies", [])
+    except Exception:
+        pass
+
+    seen = set()
+    dependencies = []
+    for entry in entries:
+        dvc_file = entry.get("dvc_file")
+        if dvc_file and dvc_file not in seen:
+            seen.add(dvc_file)
+            dependencies.append(entry)
+    return dependencies
+
+
+def _fetch_targets(project_path: Path, dvc: DVCAdapter, dependency: Dict[str, Any]) -> List[str]:
+    """What to fetch for a dependency: its .dvc file, or just the files its filters select."""
+    dvc_file = dependency["dvc_file"]
+    include, exclude = dependency.get("include") or [], dependency.get("exclude") or []
+    if not (include or exclude):
+        return [dvc_file]
+
+    imported = read_dvc_import(project_path, dvc_file)
+    files = dvc.glob(imported["source_url"], (imported["source_path"] or "").rstrip('/'), include, exclude,
+                     rev=imported["source_commit"])
+    output = dvc_file[:-len(".dvc")]
+    return [f"{output}/{path}" for path in files]
+
+
+def prefetch_data_dependencies(project_path: Path, jobs: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Fetch the data of every dependency into the DVC cache, without checking it out.
+
+    Dependencies are fetched one after another (DVC locks the repository per
+    operation), each with ``jobs`` parallel transfers, and a line is logged
+    as each finishes. Dependencies imported with include/exclude filters
+    fetch only their matching files.
+
+    Args:
+        project_path: Path to the project directory
+        jobs: Parallel transfer jobs per dependency (default: DVC's own default)
+
+    Returns:
+        One report per dependency with ``source``, ``dvc_file``, ``status``
+        ("fetched" or "failed"), ``objects`` (number downloaded, None if
+        unknown), ``seconds`` and ``error``
+    """
+    validate_project_directory(project_path)
+    dependencies = collect_dependencies(project_path)
+    if not dependencies:
+        _log("No data dependencies to prefetch")
+        return []
+
+    dvc = get_dvc_adapter(project_path)
+    shared = configure_shared_cache(dvc)
+    _log(f"Prefetching {len(dependencies)} data dependenc{'y' if len(dependencies) == 1 else 'ies'} "
+         f"into the {'shared' if shared else 'project'} DVC cache")
+
+    reports = []
+    start = time.perf_counter()
+    for number, dependency in enumerate(dependencies, 1):
+        report = {
+            "source": dependency.get("source"),
+            "dvc_file": dependency["dvc_file"],
+            "status": "fetched",
+            "objects": None,
+            "seconds": 0.0,
+            "error": None,
+        }
+        began = time.perf_counter()
+        try:
+            if not (project_path / report["dvc_file"]).exists():
+                raise DataImportError(f"{report['dvc_file']} is missing")
+            report["objects"] = dvc.fetch(_fetch_targets(project_path, dvc, dependency), jobs=jobs)
+        except (DataImportError, DVCError) as e:
+            report["status"], report["error"] = "failed", str(e)
+        report["seconds"] = round(time.perf_counter() - began, 3)
+        reports.append(report)
+
+        progress = f"[{number}/{len(dependencies)}]"
+        if report["status"] == "failed":
+            _log(f"{progress} ❌ {report['source']}: {report['error']}")
+        else:
+            count = report["objects"]
+            objects = "" if count is None else f"{count} object{'' if count == 1 else 's'} "
+            _log(f"{progress} ✅ {report['source']}: {objects}in {report['seconds']:.1f}s")
+
+    failed = sum(report["status"] == "failed" for report in reports)
+    _log(f"Done in {time.perf_counter() - start:.1f}s: {len(reports) - failed} fetched, {failed} failed")
+    return reports
+
+
+def prefetch_running(project_path: Path) -> Optional[int]:
+    """PID of the project's background prefetch, or None if none is running."""
+    try:
+        pid = int((project_path / PREFETCH_PID).read_text().strip())
+    except (OSError, ValueError):
+        return None
+
+    if os.name == "nt":
+        result = subprocess.run(["tasklist", "/FI", f"PID eq {pid}", "/NH"], capture_output=True, text=True)
+        return pid if str(pid) in result.stdout else None
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return None
+    except PermissionError:
+        pass
+    return pid
+
+
+def start_prefetch(project_path: Path, jobs: Optional[int] = None) -> Tuple[int, Path]:
+    """Start ``mintd data prefetch --foreground`` in a detached process.
+
+    Args:
+        project_path: Path to the project directory
+        jobs: Parallel transfer jobs per dependency
+
+    Returns:
+        The process ID and the log file its progress is written to
+
+    Raises:
+        DataImportError: If a prefetch is already running for the project
+    """
+    project_path = Path(project_path).resolve()
+    validate_project_directory(project_path)
+    log_path = project_path / PREFETCH_LOG
+    running = prefetch_running(project_path)
+    if running:
+        raise DataImportError(f"A prefetch is already running (PID {running}); see {log_path}")
+
+    cmd = [sys.executable, "-m", "mintd", "data", "prefetch", "--foreground", "-p", str(project_path)]
+    cmd += ["--jobs", str(jobs)] if jobs else []
+    if os.name == "nt":
+        detach = {"creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP}
+    else:
+        detach = {"start_new_session": True}
+
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_path, "w") as log:
+        process = subprocess.Popen(cmd, cwd=project_path, stdin=subprocess.DEVNULL, stdout=log,
+                                   stderr=subprocess.STDOUT, **detach)
+    (project_path / PREFETCH_PID).write_text(f"{process.pid}\n")
+    return process.pid, log_path
+
+
+def finish_prefetch(project_path: Path) -> None:
+    """Remove the PID file of this process's prefetch, if it is the one recorded."""
+    pid_path = project_path / PREFETCH_PID
+    try:
+        if int(pid_path.read_text().strip()) == os.getpid():
+            pid_path.unlink()
+    except (OSError, ValueError):
+        pass
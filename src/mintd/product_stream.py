@@ -0,0 +1,349 @@
+"""Streaming reads of single files from registered data products.
+
+``mintd data pull`` checks out a whole stage, which is wasteful when an
+analysis needs one table out of a large product. ``open_product_file`` instead
+opens the file with ``dvc.api.open``, reading straight from the product's DVC
+remote, and keeps what it reads in a local block cache: the file is read in
+fixed-size blocks stored under ``~/.mintd/cache/blocks``, keyed by the file's
+DVC hash, and the least recently used blocks are evicted once the cache grows
+past its size limit. Re-reading a hot file, or the same byte range of it,
+then costs no network traffic.
+"""
+
+import io
+import os
+import shutil
+import tempfile
+import threading
+from contextlib import ExitStack
+from pathlib import Path
+from typing import IO, Any, Callable, ContextManager, Dict, List, Optional, Tuple
+
+from .config import CONFIG_DIR, get_config
+
+BLOCK_CACHE_ROOT = CONFIG_DIR / "cache" / "blocks"
+DEFAULT_BLOCK_SIZE_MB = 8
+DEFAULT_MAX_SIZE_GB = 10
+
+_MB = 1024 * 1024
+
+
+class BlockCache:
+    """Size-bounded, least-recently-used store of file blocks.
+
+    Blocks are files named ``<key>-<block size>/<index>``, so caches with
+    different block sizes can share a directory without reading each
+    other's blocks at the wrong offsets. Reading a block bumps its
+    modification time, which is the recency used for eviction, so several
+    processes can share one cache directory without a separate index.
+
+    Example:
+        cache = get_block_cache()
+        data = cache.get(md5, 0)
+        if data is None:
+            cache.put(md5, 0, fetch_block(0))
+    """
+
+    def __init__(self, root: Path, max_size: int, block_size: int):
+        """
+        Initialize the cache.
+
+        Args:
+            root: Directory holding the blocks
+            max_size: Bytes kept before the least recently used blocks are evicted
+            block_size: Bytes per block (the last block of a file may be shorter)
+        """
+        self.root = Path(root)
+        self.max_size = max_size
+        self.block_size = block_size
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _block_path(self, key: str, index: int) -> Path:
+        return self.root / key[:2] / f"{key}-{self.block_size}" / str(index)
+
+    def _blocks(self) -> List[Tuple[float, int, Path]]:
+        """(mtime, size, path) of every block in the cache."""
+        blocks = []
+        for path in self.root.glob("*/*/*"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # evicted by another process
+                continue
+            if path.is_file() and not path.name.startswith("."):
+                blocks.append((stat.st_mtime, stat.st_size, path))
+        return blocks
+
+    def size(self) -> int:
+        """Bytes currently cached."""
+        return sum(size for _, size, _ in self._blocks())
+
+    def get(self, key: str, index: int) -> Optional[bytes]:
+        """Return a cached block and mark it recently used (None if not cached)."""
+        path = self._block_path(key, index)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return data
+
+    def put(self, key: str, index: int, data: bytes) -> None:
+        """Store a block, evicting older blocks if the cache is over its limit."""
+        path = self._block_path(key, index)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{index}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+        with self._lock:
+            if self._size is None:
+                self._size = self.size()
+            else:
+                self._size += len(data)
+            if self._size > self.max_size:
+                self._size = self._evict()
+
+    def _evict(self) -> int:
+        """Delete least recently used blocks until the cache fits; return its new size."""
+        blocks = sorted(self._blocks())
+        total = sum(size for _, size, _ in blocks)
+        for _, size, path in blocks:
+            if total <= self.max_size:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            try:
+                path.parent.rmdir()
+            except OSError:  # other blocks of the file remain
+                pass
+        return total
+
+    def clear(self) -> None:
+        """Delete every cached block."""
+        with self._lock:
+            shutil.rmtree(self.root, ignore_errors=True)
+            self._size = 0
+
+
+def get_block_cache(config: Optional[Dict[str, Any]] = None) -> BlockCache:
+    """Return the block cache described by the ``block_cache`` config section.
+
+    Args:
+        config: mintd configuration (default: loaded from ~/.mintd/config.yaml)
+    """
+    section = (config if config is not None else get_config()).get("block_cache") or {}
+    root = Path(section["dir"]).expanduser() if section.get("dir") else BLOCK_CACHE_ROOT
+    max_size = int(float(section.get("max_size_gb", DEFAULT_MAX_SIZE_GB)) * 1024 * _MB)
+    block_size = int(float(section.get("block_size_mb", DEFAULT_BLOCK_SIZE_MB)) * _MB)
+    return BlockCache(root, max_size=max_size, block_size=block_size)
+
+
+class ProductFile(io.RawIOBase):
+    """Seekable, read-only view of a remote file, read block by block through a ``BlockCache``.
+
+    The remote stream is opened on the first block that is not cached, and
+    only re-positioned (or reopened, if it cannot seek) when reads jump around.
+    """
+
+    def __init__(self, opener: Callable[[], ContextManager[IO[bytes]]], size: Optional[int],
+                 key: Optional[str], cache: BlockCache, name: str = ""):
+        """
+        Initialize the file.
+
+        Args:
+            opener: Returns a context manager yielding the remote file, opened in binary mode
+            size: File size in bytes (None if unknown; the file then ends at the first short block)
+            key: Cache key of the file's contents (None to bypass the cache)
+            cache: Block cache to read through
+            name: Name reported by ``name``
+        """
+        super().__init__()
+        self.name = name
+        self._opener = opener
+        self._size = size
+        self._key = key
+        self._cache = cache
+        self._block_size = cache.block_size
+        self._pos = 0
+        self._stream: Optional[IO[bytes]] = None
+        self._stream_pos = 0
+        self._stack = ExitStack()
+        # The block being read, so small sequential reads do not hit the disk each time
+        self._current: Tuple[int, bytes] = (-1, b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            if self._size is None:
+                raise io.UnsupportedOperation("size of the remote file is unknown")
+            pos = self._size + offset
+        else:
+            raise ValueError(f"invalid whence ({whence})")
+        if pos < 0:
+            raise ValueError(f"negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def readinto(self, buffer) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        if self._size is not None and self._pos >= self._size:
+            return 0
+        index, offset = divmod(self._pos, self._block_size)
+        block = self._block(index)
+        n = max(0, min(len(buffer), len(block) - offset))
+        buffer[:n] = block[offset:offset + n]
+        self._pos += n
+        return n
+
+    def _block(self, index: int) -> bytes:
+        if self._current[0] == index:
+            return self._current[1]
+        data = self._cache.get(self._key, index) if self._key else None
+        if data is None:
+            data = self._fetch(index)
+            if self._key and data:
+                self._cache.put(self._key, index, data)
+        self._current = (index, data)
+        return data
+
+    def _fetch(self, index: int) -> bytes:
+        """Read one block from the remote file."""
+        start = index * self._block_size
+        if self._stream is not None and self._stream_pos != start:
+            if self._stream.seekable():
+                self._stream.seek(start)
+                self._stream_pos = start
+            elif self._stream_pos > start:
+                self._reopen()
+        if self._stream is None:
+            self._reopen()
+        while self._stream_pos < start:  # a stream that cannot seek is read forward
+            skipped = self._stream.read(min(self._block_size, start - self._stream_pos))
+            if not skipped:
+                break
+            self._stream_pos += len(skipped)
+
+        chunks = []
+        remaining = self._block_size if self._size is None else min(self._block_size, self._size - start)
+        while remaining > 0:
+            chunk = self._stream.read(remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        data = b"".join(chunks)
+        self._stream_pos += len(data)
+        return data
+
+    def _reopen(self) -> None:
+        self._stack.close()
+        self._stream = self._stack.enter_context(self._opener())
+        self._stream_pos = 0
+
+    def close(self) -> None:
+        if not self.closed:
+            self._stack.close()
+            self._stream = None
+            self._current = (-1, b"")
+        super().close()
+
+
+def open_product_file(
+    product_name: str,
+    path: str,
+    rev: Optional[str] = None,
+    mode: str = "rb",
+    encoding: Optional[str] = None,
+    cache: Optional[BlockCache] = None,
+) -> IO:
+    """Open one file of a registered data product without pulling the product.
+
+    The file is streamed from the product's DVC remote (configured from the
+    registry entry, like ``mintd data pull``) and read through the local
+    block cache. Files kept in git rather than DVC are streamed uncached.
+
+    Example:
+        with open_product_file("data_claims", "data/final/claims_2023.parquet") as f:
+            df = pd.read_parquet(f)
+
+    Args:
+        product_name: Name of the data product
+        path: File path within the product repository, e.g. ``data/final/table.csv``
+        rev: Git revision of the product (default: its default branch)
+        mode: "rb" or "r"
+        encoding: Text encoding for mode "r"
+        cache: Block cache to read through (default: from the ``block_cache`` config)
+
+    Returns:
+        A seekable file object; close it (or use it as a context manager) when done
+
+    Raises:
+        ValueError: If mode is not "rb" or "r"
+        FileNotFoundError: If the product has no such file
+        IsADirectoryError: If the path is a directory
+    """
+    if mode not in ("rb", "r"):
+        raise ValueError(f"Unsupported mode '{mode}': product files are opened with 'rb' or 'r'")
+
+    import dvc.api
+    from .data_import import _dvc_url, query_data_product
+
+    product_info = query_data_product(product_name)
+    url = _dvc_url(product_info["repository"]["github_url"])
+    dvc_config = _remote_config(product_info)
+
+    fs = dvc.api.DVCFileSystem(url, rev=rev, config=dvc_config)
+    try:
+        info = fs.info(path)
+        # Pin the commit, so reopening the stream later cannot see a newer file
+        rev = fs.repo.get_rev()
+    finally:
+        fs.close()
+    if info["type"] == "directory":
+        raise IsADirectoryError(f"'{path}' is a directory in {product_name}")
+
+    def opener() -> ContextManager[IO[bytes]]:
+        return dvc.api.open(path, repo=url, rev=rev, mode="rb", config=dvc_config)
+
+    raw = ProductFile(opener, size=info.get("size"), key=(info.get("dvc_info") or {}).get("md5"),
+                      cache=cache or get_block_cache(), name=path)
+    binary = io.BufferedReader(raw, buffer_size=io.DEFAULT_BUFFER_SIZE)
+    if mode == "rb":
+        return binary
+    return io.TextIOWrapper(binary, encoding=encoding)
+
+
+def _remote_config(product_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """DVC config selecting the remote listed in the registry, if any."""
+    remote = product_info.get("storage", {}).get("dvc", {})
+    if not remote.get("remote_url"):
+        return None
+    remote_name = remote.get("remote_name") or "storage"
+    settings = {"url": remote["remote_url"]}
+    endpoint = get_config().get("storage", {}).get("endpoint", "")
+    if endpoint:
+        settings["endpointurl"] = endpoint
+    return {"core": {"remote": remote_name}, "remote": {remote_name: settings}}
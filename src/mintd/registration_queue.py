@@ -0,0 +1,251 @@
+"""Durable queue of registry registrations waiting to be submitted.
+
+Registrations that could not be (or should not yet be) submitted are kept in
+a small SQLite database, one row per project. Enqueuing the same project
+again replaces its metadata rather than adding a duplicate. Failed attempts
+are retried with exponential backoff, and workers claim rows under a lease,
+so several ``mintd registry worker`` processes can drain the queue at once
+without submitting the same project twice.
+"""
+
+import json
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Delay after the first failed attempt; doubled for each further failure
+BASE_RETRY_DELAY = 60
+
+# Upper bound on the retry delay (seconds)
+MAX_RETRY_DELAY = 6 * 60 * 60
+
+# How long a worker may hold a claimed registration before others may retry it
+CLAIM_LEASE = 15 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS registrations (
+    full_name TEXT PRIMARY KEY,
+    project_path TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    enqueued_at REAL NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    claimed_until REAL NOT NULL DEFAULT 0,
+    last_error TEXT
+)
+"""
+
+
+def retry_delay(attempts: int) -> float:
+    """Seconds to wait before the next try after ``attempts`` failures."""
+    return min(MAX_RETRY_DELAY, BASE_RETRY_DELAY * 2 ** max(0, attempts - 1))
+
+
+class RegistrationQueue:
+    """SQLite-backed queue of pending registrations.
+
+    Example:
+        queue = RegistrationQueue(Path.home() / ".mintd" / "registration_queue.db")
+        queue.enqueue(project_path, metadata)
+        for job in queue.claim():
+            ...
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open (and if needed create) the queue database.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """A connection in autocommit mode; one per call keeps threads independent."""
+        conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _job(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            "full_name": row["full_name"],
+            "project_path": row["project_path"],
+            "metadata": json.loads(row["metadata"]),
+            "created_at": row["created_at"],
+            "enqueued_at": row["enqueued_at"],
+            "attempts": row["attempts"],
+            "next_attempt_at": row["next_attempt_at"],
+            "last_error": row["last_error"],
+        }
+
+    def enqueue(self, project_path: Path, metadata: Dict[str, Any], now: Optional[float] = None) -> None:
+        """Add a registration, replacing any queued one for the same project.
+
+        A re-enqueued project is due immediately and its attempt count resets.
+        """
+        now = time.time() if now is None else now
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO registrations
+                    (full_name, project_path, metadata, created_at, enqueued_at, next_attempt_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(full_name) DO UPDATE SET
+                    project_path = excluded.project_path,
+                    metadata = excluded.metadata,
+                    enqueued_at = excluded.enqueued_at,
+                    attempts = 0,
+                    next_attempt_at = excluded.next_attempt_at,
+                    last_error = NULL
+                """,
+                (metadata["project"]["full_name"], str(project_path), json.dumps(metadata),
+                 datetime.now().isoformat(), now, now)
+            )
+
+    def pending(self) -> List[Dict[str, Any]]:
+        """Every queued registration, soonest due first."""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT * FROM registrations ORDER BY next_attempt_at, full_name").fetchall()
+        return [self._job(row) for row in rows]
+
+    def claim(self, limit: Optional[int] = None, force: bool = False,
+              now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Lease registrations to the calling worker.
+
+        Args:
+            limit: Maximum number to claim (default: all)
+            force: Ignore the backoff schedule and claim everything not
+                already leased to another worker
+            now: Current time (for tests)
+
+        Returns:
+            Claimed registrations
+        """
+        now = time.time() if now is None else now
+        due_clause = "" if force else "AND next_attempt_at <= :now"
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = conn.execute(
+                    f"SELECT * FROM registrations WHERE claimed_until <= :now {due_clause} "
+                    "ORDER BY next_attempt_at, full_name LIMIT :limit",
+                    {"now": now, "limit": -1 if limit is None else limit}
+                ).fetchall()
+                conn.executemany(
+                    "UPDATE registrations SET claimed_until = ? WHERE full_name = ?",
+                    [(now + CLAIM_LEASE, row["full_name"]) for row in rows]
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return [self._job(row) for row in rows]
+
+    def complete(self, job: Dict[str, Any]) -> None:
+        """Drop a submitted registration, unless it was re-enqueued meanwhile."""
+        with self._connect() as conn:
+            conn.execute(
+                "DELETE FROM registrations WHERE full_name = ? AND enqueued_at = ?",
+                (job["full_name"], job["enqueued_at"])
+            )
+            conn.execute(
+                "UPDATE registrations SET claimed_until = 0 WHERE full_name = ?", (job["full_name"],)
+            )
+
+    def fail(self, job: Dict[str, Any], error: str, now: Optional[float] = None) -> float:
+        """Record a failed attempt and schedule the retry.
+
+        Returns:
+            Time of the next attempt
+        """
+        now = time.time() if now is None else now
+        attempts = job["attempts"] + 1
+        next_attempt = now + retry_delay(attempts)
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE registrations SET attempts = ?, next_attempt_at = ?, claimed_until = 0, last_error = ? "
+                "WHERE full_name = ? AND enqueued_at = ?",
+                (attempts, next_attempt, error, job["full_name"], job["enqueued_at"])
+            )
+            conn.execute(
+                "UPDATE registrations SET claimed_until = 0 WHERE full_name = ?", (job["full_name"],)
+            )
+        return next_attempt
+
+    def remove(self, full_name: str) -> bool:
+        """Drop a registration. Returns True if it was queued."""
+        with self._connect() as conn:
+            return conn.execute("DELETE FROM registrations WHERE full_name = ?", (full_name,)).rowcount > 0
+
+    def import_legacy(self, pending_dir: Path) -> int:
+        """Move JSON files from the old ``pending_registrations`` directory into the queue.
+
+        Returns:
+            Number of registrations imported
+        """
+        imported = 0
+        for file in sorted(Path(pending_dir).glob("*.json")):
+            try:
+                with open(file, "r") as f:
+                    item = json.load(f)
+                self.enqueue(Path(item["project_path"]), item["metadata"])
+            except (json.JSONDecodeError, OSError, KeyError, TypeError):
+                continue
+            file.unlink()
+            imported += 1
+        return imported
+
+
+def drain_queue(queue: RegistrationQueue, register: Callable[[Dict[str, Any]], str],
+                max_workers: int = 4, force: bool = False,
+                on_result: Optional[Callable[[Dict[str, Any], Optional[str], Optional[str]], None]] = None
+                ) -> Dict[str, int]:
+    """Submit every due registration, several at a time.
+
+    Args:
+        queue: Queue to drain
+        register: Submits one registration's metadata and returns the PR URL
+        max_workers: Registrations submitted concurrently
+        force: Retry registrations still backing off
+        on_result: Called as ``(job, pr_url, error)`` when each one finishes
+
+    Returns:
+        Dictionary with ``submitted`` and ``failed`` counts
+    """
+    jobs = queue.claim(force=force)
+    counts = {"submitted": 0, "failed": 0}
+    if not jobs:
+        return counts
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs)))) as pool:
+        futures = {pool.submit(register, job["metadata"]): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                pr_url = future.result()
+            except Exception as e:
+                queue.fail(job, str(e))
+                counts["failed"] += 1
+                if on_result:
+                    on_result(job, None, str(e))
+            else:
+                queue.complete(job)
+                counts["submitted"] += 1
+                if on_result:
+                    on_result(job, pr_url, None)
+
+    return counts
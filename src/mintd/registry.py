@@ -1,38 +1,219 @@
 """Registry integration for mintd - Tokenless GitOps operations using git + gh CLI."""
 
 import os
+import re
 import json
+import asyncio
+import copy
 import yaml
 import tempfile
 import shutil
 import subprocess
+import sys
+import threading
 import urllib.parse
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Any, Tuple, List
+from typing import Dict, Optional, Any, Tuple, List, Iterable, Iterator
+
+from .github_transport import GhCliTransport, GitHubTransport, GitHubTransportError, get_github_transport
+from .git_batch import GitObjectReader, ls_tree
+from .catalog_schema import SCHEMA_FINGERPRINT, validate_catalog_blobs, validate_catalog_entry
+from .registration_queue import RegistrationQueue, drain_queue
+from .registry_snapshot import CatalogSnapshot, get_active_snapshot, write_snapshot_bundle
+from .dependency_graph import build_dependency_graph, extract_dependencies, walk
+from .catalog_index import build_catalog_index, search_catalog_index, suggest_names
+from .registry_cache import (
+    CACHE_ROOT,
+    RegistryCache,
+    latest_catalog_index,
+    load_catalog_index,
+    load_validation_results,
+    registry_cache_slug,
+    save_catalog_index,
+    save_validation_results,
+)
+
+# Use libyaml's C loader when PyYAML was built against it; it is several
+# times faster than the pure-Python SafeLoader with identical semantics.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Catalogs smaller than this are parsed inline; process startup would dominate.
+PARALLEL_PARSE_THRESHOLD = 256
+
+# Catalog subdirectory for each project type
+CATALOG_TYPE_DIRS = {'data': 'data', 'project': 'projects', 'infra': 'infra'}
+
+# Directories never searched when discovering local projects
+DISCOVERY_SKIP_DIRS = {'.git', '.dvc', '.mintd', 'node_modules', '.venv', 'venv', '__pycache__', 'data'}
+
+
+def load_catalog_yaml(stream: Any) -> Any:
+    """Parse a catalog YAML document with the fastest available safe loader."""
+    return yaml.load(stream, Loader=YAML_LOADER)
+
+
+def summarize_catalog_entry(name: str, catalog_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the product summary shown by ``mintd data list``.
+
+    Args:
+        name: Catalog file stem
+        catalog_data: Parsed catalog entry
+
+    Returns:
+        Dictionary with name, type, full_name, description, tags, dependencies,
+        created_at and created_by
+    """
+    return {
+        "name": name,
+        "type": catalog_data.get("project", {}).get("type", "data"),
+        "full_name": catalog_data.get("project", {}).get("full_name", ""),
+        "description": catalog_data.get("metadata", {}).get("description", ""),
+        "tags": catalog_data.get("metadata", {}).get("tags", []) or [],
+        "dependencies": extract_dependencies(catalog_data),
+        "created_at": catalog_data.get("project", {}).get("created_at", ""),
+        "created_by": catalog_data.get("ownership", {}).get("created_by", "")
+    }
+
+
+def _parse_catalog_summary(path: str) -> Optional[Dict[str, Any]]:
+    """Parse one catalog file into a summary, or None if it is malformed.
+
+    Module-level so it can be shipped to worker processes.
+    """
+    try:
+        with open(path, 'r') as f:
+            catalog_data = load_catalog_yaml(f)
+        return summarize_catalog_entry(Path(path).stem, catalog_data)
+    except Exception:
+        return None
+
+
+def _parse_catalog_blob(item: Tuple[str, bytes]) -> Optional[Dict[str, Any]]:
+    """Parse one ``(catalog path, yaml bytes)`` pair into a summary, or None if malformed.
+
+    The summary also records the catalog ``path``. Module-level so it can be
+    shipped to worker processes.
+    """
+    path, data = item
+    try:
+        summary = summarize_catalog_entry(Path(path).stem, load_catalog_yaml(data))
+    except Exception:
+        return None
+    summary["path"] = path
+    return summary
+
+
+def _iter_parsed(parse: Any, items: List[Any], max_workers: Optional[int]) -> Iterator[Dict[str, Any]]:
+    """Apply ``parse`` to ``items`` inline or across a process pool, in order."""
+    workers = max_workers or os.cpu_count() or 1
+
+    if len(items) < PARALLEL_PARSE_THRESHOLD or workers <= 1:
+        for item in items:
+            summary = parse(item)
+            if summary is not None:
+                yield summary
+        return
+
+    # Small chunks keep the first results flowing quickly
+    chunksize = max(1, min(64, len(items) // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for summary in pool.map(parse, items, chunksize=chunksize):
+            if summary is not None:
+                yield summary
+
+
+def iter_catalog_summaries(catalog_dir: Path, max_workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """Stream product summaries for every ``*.yaml`` file in a catalog directory.
+
+    Small catalogs are parsed inline. Large ones are parsed across a process
+    pool and yielded in file order as soon as each chunk is ready, so callers
+    can start printing before the whole catalog has been read. Malformed
+    entries are skipped.
+
+    Args:
+        catalog_dir: Directory containing catalog YAML files
+        max_workers: Worker process count (default: CPU count; 1 disables the pool)
+
+    Yields:
+        Product summary dictionaries (see ``summarize_catalog_entry``)
+    """
+    if not catalog_dir.exists():
+        return
+
+    files = sorted(str(p) for p in catalog_dir.glob("*.yaml"))
+    yield from _iter_parsed(_parse_catalog_summary, files, max_workers)
+
+
+def iter_catalog_blob_summaries(blobs: List[Tuple[str, bytes]],
+                                max_workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """Stream product summaries for catalog entries already read into memory.
+
+    Same parsing rules as ``iter_catalog_summaries``.
+
+    Args:
+        blobs: ``(catalog path, yaml bytes)`` pairs, in the order to yield them
+        max_workers: Worker process count (default: CPU count; 1 disables the pool)
+
+    Yields:
+        Product summary dictionaries (see ``summarize_catalog_entry``)
+    """
+    yield from _iter_parsed(_parse_catalog_blob, blobs, max_workers)
 
 
 class LocalRegistry:
     """Tokenless registry operations using git + gh CLI."""
 
-    def __init__(self, registry_url: str):
+    def __init__(self, registry_url: str, cache_ttl: Optional[int] = None,
+                 cache_root: Optional[Path] = None, github: Optional[GitHubTransport] = None):
         """
         Initialize local registry operations.
 
         Args:
             registry_url: URL of the registry repository (e.g., https://github.com/org/registry)
+            cache_ttl: Seconds to trust the cached registry HEAD before re-checking it
+                with ``git ls-remote``. None disables the lookup cache.
+            cache_root: Override the lookup cache directory
+            github: Transport for pull request calls (default: the GitHub CLI)
         """
         self.registry_url = registry_url
         self.registry_org, self.registry_name = self._parse_registry_url(registry_url)
+        self.github = github or GhCliTransport()
         self.temp_dir = None
         self.repo_path = None
+        self.cache = None
+        if cache_ttl is not None:
+            self.cache = RegistryCache(registry_url, self.clone_url, ttl=cache_ttl, cache_root=cache_root)
+        # Persistent bare mirror and catalog index, kept beside the lookup cache
+        self.cache_dir = (cache_root or CACHE_ROOT) / registry_cache_slug(registry_url)
+        self.mirror_path = self.cache_dir / "mirror.git"
+        self._mirror_sha: Optional[str] = None
+        self._objects: Optional[GitObjectReader] = None
+        # Lookups may come from several threads (e.g. bulk data imports)
+        self._mirror_lock = threading.Lock()
+
+    @property
+    def clone_url(self) -> str:
+        """Git URL for the registry: SSH for GitHub, otherwise the URL as given."""
+        if urllib.parse.urlparse(self.registry_url).netloc.endswith("github.com"):
+            return f"git@github.com:{self.registry_org}/{self.registry_name}.git"
+        return self.registry_url
+
+    @property
+    def repo_slug(self) -> str:
+        """Registry repository as ``org/name``."""
+        return f"{self.registry_org}/{self.registry_name}"
 
     def _parse_registry_url(self, url: str) -> Tuple[str, str]:
         """Parse registry URL to extract org and repo name."""
         parsed = urllib.parse.urlparse(url)
         path_parts = parsed.path.strip('/').split('/')
         if len(path_parts) >= 2:
-            return path_parts[0], path_parts[1]
+            if parsed.netloc.endswith("github.com"):
+                return path_parts[0], path_parts[1]
+            # Local paths and other hosts: the repository is the last component
+            return path_parts[-2], path_parts[-1]
         raise ValueError(f"Invalid registry URL: {url}")
 
     def _run_git_command(self, *args, cwd: Optional[Path] = None, check: bool = True) -> subprocess.CompletedProcess:
@@ -83,13 +264,361 @@ class LocalRegistry:
 
             raise
 
+    async def _run_async_command(self, *cmd: str) -> subprocess.CompletedProcess:
+        """Run a command with asyncio and capture its output.
+
+        Raises:
+            FileNotFoundError: If the executable is not installed
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await proc.communicate()
+        return subprocess.CompletedProcess(list(cmd), proc.returncode,
+                                           stdout.decode(), stderr.decode())
+
+    def _mirror_sync_command(self) -> List[str]:
+        """Command that creates the registry mirror, or fetches into it if it exists."""
+        if self.mirror_path.exists():
+            return ['git', '--git-dir', str(self.mirror_path), 'fetch', '--prune', '--quiet',
+                    'origin', '+refs/heads/*:refs/heads/*']
+        self.mirror_path.parent.mkdir(parents=True, exist_ok=True)
+        return ['git', 'clone', '--bare', '--quiet', self.clone_url, str(self.mirror_path)]
+
+    def sync_mirror(self) -> Path:
+        """Create or update the persistent bare mirror of the registry.
+
+        Returns:
+            Path to the mirror's git directory
+        """
+        self._run_git_command(*self._mirror_sync_command()[1:], cwd=Path.cwd())
+        return self.mirror_path
+
+    def catalog_tree(self, ref: str = "HEAD") -> Dict[str, str]:
+        """Map each catalog file path in the mirror at ``ref`` to its blob SHA."""
+        return ls_tree(self.mirror_path, ref, 'catalog/')
+
+    def list_catalog_paths(self, ref: str = "HEAD") -> List[str]:
+        """List catalog file paths in the mirror at ``ref`` without a checkout."""
+        return sorted(self.catalog_tree(ref))
+
+    @property
+    def objects(self) -> GitObjectReader:
+        """Persistent ``git cat-file --batch`` reader over the mirror."""
+        if self._objects is None:
+            self._objects = GitObjectReader(self.mirror_path)
+        return self._objects
+
+    def close(self) -> None:
+        """Stop the mirror's object reader process, if running."""
+        if self._objects is not None:
+            self._objects.close()
+            self._objects = None
+
+    def _mirror_head(self, expected: Optional[str] = None) -> str:
+        """Return the mirror's HEAD SHA, updating the mirror once per registry instance.
+
+        The mirror is fetched again only when ``expected`` (a HEAD SHA known to
+        be current, e.g. from ``git ls-remote``) differs from what it holds.
+        When offline, a stale mirror is used rather than failing.
+        """
+        with self._mirror_lock:
+            if self._mirror_sha and (expected is None or expected == self._mirror_sha):
+                return self._mirror_sha
+
+            cmd = self._mirror_sync_command()
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode != 0 and not (self.mirror_path / "HEAD").exists():
+                raise RuntimeError(f"Failed to update registry mirror: {result.stderr.strip()}")
+            self._mirror_sha = self._run_git_command('--git-dir', str(self.mirror_path), 'rev-parse', 'HEAD',
+                                                     cwd=Path.cwd()).stdout.strip()
+            return self._mirror_sha
+
+    def read_catalog_entry(self, catalog_path: str, ref: str = "HEAD") -> Optional[Dict[str, Any]]:
+        """Read and parse one catalog entry from the mirror without a checkout.
+
+        Args:
+            catalog_path: Path within the registry, e.g. ``catalog/data/data_x.yaml``
+            ref: Commit-ish to read from
+
+        Returns:
+            Parsed catalog entry, or None if the file does not exist at ``ref``
+        """
+        data = self.objects.read(f"{ref}:{catalog_path}")
+        return None if data is None else load_catalog_yaml(data)
+
+    def _iter_mirror_summaries(self, ref: str, type_dirs: Iterable[str] = ('data',),
+                               max_workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Stream summaries of the catalog entries under ``catalog/<type_dir>/`` at ``ref``."""
+        tree = self.catalog_tree(ref)
+        prefixes = tuple(f"catalog/{type_dir}/" for type_dir in type_dirs)
+        paths = sorted(path for path in tree if path.startswith(prefixes) and path.endswith('.yaml'))
+        contents = self.objects.read_many(tree[path] for path in paths)
+        blobs = [(path, contents[tree[path]]) for path in paths if contents[tree[path]] is not None]
+        yield from iter_catalog_blob_summaries(blobs, max_workers=max_workers)
+
+    def catalog_changes(self, since: str, until: Optional[str] = None,
+                        include_entries: bool = True) -> Dict[str, Any]:
+        """Return catalog entries added, modified or removed between two registry commits.
+
+        Computed with ``git diff`` on the mirror, so subscribers can store the
+        returned ``to`` SHA and process only deltas on their next sync.
+        Renamed files are reported as a removal plus an addition.
+
+        Args:
+            since: Registry commit the caller last processed
+            until: Commit to compare against (default: current registry HEAD)
+            include_entries: Parse and include the catalog entry of added and
+                modified files
+
+        Returns:
+            Dictionary with ``from`` and ``to`` SHAs and ``added``, ``modified``
+            and ``removed`` lists of ``{path, name, type[, entry]}`` items
+
+        Raises:
+            ValueError: If ``since`` or ``until`` is not a commit in the registry
+        """
+        until = until or self._mirror_head()
+        shas = []
+        for rev in (since, until):
+            result = self._run_git_command('--git-dir', str(self.mirror_path), 'rev-parse', '--verify',
+                                           '--quiet', f"{rev}^{{commit}}", cwd=Path.cwd(), check=False)
+            if result.returncode != 0:
+                raise ValueError(f"Unknown registry commit: {rev}")
+            shas.append(result.stdout.strip())
+        from_sha, to_sha = shas
+
+        diff = self._run_git_command('--git-dir', str(self.mirror_path), 'diff', '--name-status', '-z',
+                                     '--no-renames', from_sha, to_sha, '--', 'catalog/', cwd=Path.cwd())
+        fields = diff.stdout.split('\0')
+        changes: Dict[str, Any] = {"from": from_sha, "to": to_sha, "added": [], "modified": [], "removed": []}
+        kinds = {"A": "added", "M": "modified", "T": "modified", "D": "removed"}
+        type_for_dir = {type_dir: project_type for project_type, type_dir in CATALOG_TYPE_DIRS.items()}
+
+        for status, path in zip(fields[0::2], fields[1::2]):
+            parts = Path(path).parts
+            if status not in kinds or len(parts) != 3 or not path.endswith('.yaml'):
+                continue
+            changes[kinds[status]].append({
+                "path": path,
+                "name": Path(path).stem,
+                "type": type_for_dir.get(parts[1], parts[1]),
+            })
+
+        if include_entries:
+            changed = changes["added"] + changes["modified"]
+            contents = self.objects.read_many(f"{to_sha}:{item['path']}" for item in changed)
+            for item in changed:
+                data = contents[f"{to_sha}:{item['path']}"]
+                try:
+                    item["entry"] = load_catalog_yaml(data) if data is not None else None
+                except yaml.YAMLError:
+                    item["entry"] = None
+
+        return changes
+
+    def catalog_index(self) -> Dict[str, Any]:
+        """Return the catalog index at the registry HEAD.
+
+        The index holds the data product search structures and the
+        data-dependency graph across every catalog type. It is built once per
+        registry commit and stored in the cache directory, so repeated
+        lookups only pay for a mirror fetch. When an index for an earlier
+        commit is on disk, only the entries changed since then are re-read.
+
+        Returns:
+            Catalog index (see ``catalog_index.build_catalog_index``)
+        """
+        sha = self._mirror_head()
+        index = load_catalog_index(self.cache_dir, sha)
+        if index is not None:
+            return index
+
+        previous = latest_catalog_index(self.cache_dir)
+        state = None
+        if previous is not None:
+            try:
+                state = self._apply_catalog_changes(previous[1], previous[0], sha)
+            except (ValueError, subprocess.CalledProcessError):
+                state = None
+        if state is None:
+            state = self._scan_catalog(sha)
+        entries, forward, paths = state
+
+        graph = build_dependency_graph(forward)
+        graph["paths"] = paths
+        index = build_catalog_index(entries, dependency_graph=graph)
+        save_catalog_index(self.cache_dir, sha, index)
+        return index
+
+    @staticmethod
+    def _graph_key(summary: Dict[str, Any]) -> str:
+        """Dependency graph node name for a catalog entry."""
+        return summary.get("full_name") or summary["name"]
+
+    def _scan_catalog(self, sha: str) -> Tuple[List[Dict[str, Any]], Dict[str, List[str]], Dict[str, str]]:
+        """Read every catalog entry at ``sha`` into index entries, dependencies and path names."""
+        entries, forward, paths = [], {}, {}
+        for summary in self._iter_mirror_summaries(sha, CATALOG_TYPE_DIRS.values()):
+            key = self._graph_key(summary)
+            paths[summary["path"]] = key
+            forward[key] = summary["dependencies"]
+            if summary["path"].startswith('catalog/data/'):
+                entries.append(summary)
+        return entries, forward, paths
+
+    def _apply_catalog_changes(self, index: Dict[str, Any], since: str,
+                               until: str) -> Tuple[List[Dict[str, Any]], Dict[str, List[str]], Dict[str, str]]:
+        """Bring the index state stored for ``since`` up to date with ``until``."""
+        changes = self.catalog_changes(since, until)
+        by_path = {entry["path"]: entry for entry in index["entries"]}
+        paths = dict(index["dependencies"]["paths"])
+        forward = dict(index["dependencies"]["forward"])
+
+        for item in changes["removed"] + changes["added"] + changes["modified"]:
+            by_path.pop(item["path"], None)
+            key = paths.pop(item["path"], None)
+            if key is not None:
+                forward.pop(key, None)
+
+        for item in changes["added"] + changes["modified"]:
+            if not isinstance(item.get("entry"), dict):
+                continue
+            summary = summarize_catalog_entry(item["name"], item["entry"])
+            summary["path"] = item["path"]
+            key = self._graph_key(summary)
+            paths[item["path"]] = key
+            forward[key] = summary["dependencies"]
+            if item["path"].startswith('catalog/data/'):
+                by_path[item["path"]] = summary
+
+        return [by_path[path] for path in sorted(by_path)], forward, paths
+
+    def dependents(self, product_name: str, transitive: bool = False) -> List[Dict[str, Any]]:
+        """List catalog entries that depend on a data product.
+
+        Args:
+            product_name: Data product name (e.g., "data_hospital-claims")
+            transitive: Include indirect dependents, not just direct ones
+
+        Returns:
+            List of ``{"name", "depth", "via"}`` dictionaries ordered by depth
+        """
+        reverse = self.catalog_index()["dependencies"]["reverse"]
+        return walk(reverse, product_name, max_depth=None if transitive else 1)
+
+    def impact(self, product_name: str) -> Dict[str, Any]:
+        """Summarise everything affected when a data product releases.
+
+        Args:
+            product_name: Data product name
+
+        Returns:
+            Dictionary with the transitive ``dependents`` and the names of
+            the affected ``projects`` (prj_ entries) to rerun
+        """
+        affected = self.dependents(product_name, transitive=True)
+        return {
+            "product": product_name,
+            "dependents": affected,
+            "projects": sorted(item["name"] for item in affected if item["name"].startswith("prj_")),
+        }
+
+    def export_snapshot(self, output: Optional[Path] = None) -> Dict[str, Any]:
+        """Write an offline snapshot bundle of the catalog at the registry HEAD.
+
+        Args:
+            output: Bundle path to write (default: ``registry-snapshot-<sha>.tar.gz``
+                in the current directory)
+
+        Returns:
+            The bundle manifest (registry URL, commit, entry count) plus the
+            ``path`` written
+        """
+        sha = self._mirror_head()
+        output = Path(output or f"registry-snapshot-{sha[:12]}.tar.gz")
+        index = self.catalog_index()
+        tree = self.catalog_tree(sha)
+        contents = self.objects.read_many(tree.values())
+        files = [(path, contents[blob]) for path, blob in tree.items() if contents[blob] is not None]
+        manifest = write_snapshot_bundle(output, {"registry_url": self.registry_url, "sha": sha}, index, files)
+        return dict(manifest, path=str(output))
+
+    def validate_catalog(self, ref: Optional[str] = None,
+                         max_workers: Optional[int] = None) -> Dict[str, List[str]]:
+        """Validate every catalog entry in the mirror against the catalog schema.
+
+        Results are cached per blob SHA, so entries unchanged since the last
+        run are not re-read or re-validated; the rest are validated across a
+        process pool.
+
+        Args:
+            ref: Commit-ish to validate (default: current registry HEAD)
+            max_workers: Worker process count (see ``validate_catalog_blobs``)
+
+        Returns:
+            Dictionary mapping each catalog path to its error messages
+            (an empty list for valid entries)
+        """
+        sha = self._mirror_head() if ref is None else self._run_git_command(
+            '--git-dir', str(self.mirror_path), 'rev-parse', '--verify', f"{ref}^{{commit}}",
+            cwd=Path.cwd()).stdout.strip()
+
+        tree = {path: blob for path, blob in self.catalog_tree(sha).items() if path.endswith('.yaml')}
+        cached = load_validation_results(self.cache_dir, SCHEMA_FINGERPRINT)
+
+        pending = sorted(set(tree.values()) - set(cached))
+        if pending:
+            contents = self.objects.read_many(pending)
+            blobs = [(blob, contents[blob]) for blob in pending if contents[blob] is not None]
+            cached.update(validate_catalog_blobs(blobs, max_workers=max_workers))
+
+        live = set(tree.values())
+        save_validation_results(self.cache_dir, SCHEMA_FINGERPRINT,
+                                {blob: result for blob, result in cached.items() if blob in live})
+
+        results = {}
+        for path in sorted(tree):
+            result = cached.get(tree[path], {"errors": ["$: could not read blob"], "type": None})
+            errors = [error for error in result["errors"]]
+            type_dir = Path(path).parts[1] if len(Path(path).parts) == 3 else None
+            if type_dir not in CATALOG_TYPE_DIRS.values():
+                errors.append(f"{path}: not in a catalog type directory ({', '.join(CATALOG_TYPE_DIRS.values())})")
+            elif result["type"] in CATALOG_TYPE_DIRS and CATALOG_TYPE_DIRS[result["type"]] != type_dir:
+                errors.append(f"$.project.type: '{result['type']}' entries belong in catalog/{CATALOG_TYPE_DIRS[result['type']]}/")
+            results[path] = errors
+
+        return results
+
+    def search_data_products(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Search data products by name, description and tags.
+
+        Args:
+            query: Search text
+            limit: Maximum number of results
+
+        Returns:
+            Product summaries ranked best first, each with a ``score``
+        """
+        return search_catalog_index(self.catalog_index(), query, limit=limit)
+
+    def suggest_data_products(self, product_name: str, limit: int = 5) -> List[str]:
+        """Return names of data products similar to ``product_name``, best first."""
+        try:
+            return suggest_names(self.catalog_index(), product_name, limit=limit)
+        except Exception:
+            # Suggestions are a courtesy; never mask the original lookup error
+            return []
+
     def _clone_registry(self) -> Path:
         """Clone the registry repository using SSH."""
         self.temp_dir = Path(tempfile.mkdtemp(prefix="mintd-registry-"))
-        ssh_url = f"git@github.com:{self.registry_org}/{self.registry_name}.git"
+        ssh_url = self.clone_url
 
         print(f"📥 Cloning registry: {ssh_url}")
-        self._run_git_command('clone', ssh_url, cwd=self.temp_dir)
+        self._run_git_command('clone', ssh_url, self.registry_name, cwd=self.temp_dir)
 
         self.repo_path = self.temp_dir / self.registry_name
         print(f"✅ Cloned to: {self.repo_path}")
@@ -113,7 +642,7 @@ class LocalRegistry:
     def _write_catalog_entry(self, catalog_entry: Dict[str, Any], project_name: str) -> Path:
         """Write catalog entry to the appropriate file."""
         project_type = catalog_entry['project']['type']
-        type_dir = {'data': 'data', 'project': 'projects', 'infra': 'infra'}[project_type]
+        type_dir = CATALOG_TYPE_DIRS[project_type]
 
         # Ensure catalog directory exists
         catalog_dir = self.repo_path / 'catalog' / type_dir
@@ -141,25 +670,14 @@ class LocalRegistry:
         print(f"✅ Pushed branch: {branch_name}")
 
     def _create_pull_request(self, branch_name: str, title: str, body: str) -> str:
-        """Create a pull request using GitHub CLI."""
+        """Create a pull request through the configured GitHub transport."""
         try:
-            # Use GitHub CLI to create PR
-            result = self._run_gh_command(
-                'pr', 'create',
-                '--title', title,
-                '--body', body,
-                '--head', branch_name,
-                '--base', 'main'
-            )
-
-            pr_url = result.stdout.strip()
+            pr_url = self.github.create_pull_request(self.repo_slug, title, body, head=branch_name, base='main')
             print(f"✅ Created PR: {pr_url}")
             return pr_url
 
-        except subprocess.CalledProcessError as e:
+        except GitHubTransportError as e:
             print(f"❌ Failed to create PR: {e}")
-            print(f"stdout: {e.stdout}")
-            print(f"stderr: {e.stderr}")
             raise
 
     def register_project(self, metadata: Dict[str, Any]) -> str:
@@ -205,7 +723,7 @@ This PR registers a new {catalog_entry['project']['type']} project: **{project_n
 ### Details
 - **Type**: {catalog_entry['project']['type']}
 - **Full Name**: {catalog_entry['project']['full_name']}
-- **Created by**: {catalog_entry['ownership']['created_by']}
+- **Created by**: {catalog_entry['project'].get('created_by') or catalog_entry['ownership'].get('created_by', '')}
 
 ### Checklist
 - [ ] Catalog entry follows schema requirements
@@ -230,59 +748,153 @@ After merging this PR:
             if self.temp_dir and self.temp_dir.exists():
                 shutil.rmtree(self.temp_dir)
 
-    def check_registration_status(self, project_name: str) -> Dict[str, Any]:
+    def register_projects(self, registrations: List[Dict[str, Any]]) -> str:
         """
-        Check if a project is registered and get its status.
+        Register many projects with a single branch, commit and pull request.
 
         Args:
-            project_name: Short name of the project (without prefix)
+            registrations: Prepared registrations (see ``prepare_registrations``)
+                with valid catalog entries
 
         Returns:
-            Dictionary with registration status information
+            URL of the created pull request
         """
+        if not registrations:
+            raise ValueError("No projects to register")
+
         try:
-            # Clone registry to check current state
+            print(f"🚀 Registering {len(registrations)} projects in one pull request...")
             self._clone_registry()
 
-            # Try different project types
-            for project_type in ["data", "project", "infra"]:
-                catalog_path = self.repo_path / 'catalog' / {'data': 'data', 'project': 'projects', 'infra': 'infra'}[project_type] / f"{project_name}.yaml"
+            branch_name = f"register-batch-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+            self._create_branch(branch_name)
 
-                if catalog_path.exists():
-                    return {
-                        "registered": True,
-                        "type": project_type,
-                        "full_name": f"{project_type}_{project_name}",
-                        "url": f"{self.registry_url}/blob/main/{catalog_path.relative_to(self.repo_path)}"
-                    }
+            for registration in registrations:
+                self._write_catalog_entry(registration["entry"], registration["name"])
 
-            # Check for open PRs using gh CLI
-            try:
-                result = self._run_gh_command('pr', 'list', '--state', 'open', '--json', 'title,url,headRefName')
-                prs = json.loads(result.stdout)
-
-                for pr in prs:
-                    if f"register-{project_name}" in pr.get('headRefName', '') or f"Register.*{project_name}" in pr.get('title', ''):
-                        return {
-                            "registered": False,
-                            "pending_pr": pr.get('url'),
-                            "pr_title": pr.get('title'),
-                            "status": "pending_review"
-                        }
-            except subprocess.CalledProcessError:
-                # gh CLI not available or no PRs found
-                pass
+            title = f"Register {len(registrations)} projects"
+            self._commit_and_push(branch_name, title)
+
+            project_lines = "\n".join(
+                f"- **{r['name']}** ({r['entry']['project']['type']}, `{r['entry']['project']['full_name']}`)"
+                for r in registrations
+            )
+            body = f"""## Bulk Project Registration
 
-            return {"registered": False, "status": "not_found"}
+This PR registers {len(registrations)} existing projects:
+
+{project_lines}
+
+### Checklist
+- [ ] Catalog entries follow schema requirements
+- [ ] Access control teams are appropriate
+- [ ] Storage configuration is correct
+"""
+            return self._create_pull_request(branch_name, title, body)
 
         finally:
-            # Cleanup
             if self.temp_dir and self.temp_dir.exists():
                 shutil.rmtree(self.temp_dir)
 
+    def check_registration_status(self, project_name: str) -> Dict[str, Any]:
+        """
+        Check if a project is registered and get its status.
+
+        Args:
+            project_name: Short name of the project (without prefix)
+
+        Returns:
+            Dictionary with registration status information
+        """
+        return self.check_registration_statuses([project_name])[project_name]
+
+    def check_registration_statuses(self, project_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Check the registration status of many projects at once.
+
+        The registry mirror is updated and open PRs are listed concurrently,
+        once for the whole batch; each project is then resolved locally
+        against the catalog tree and the PR list.
+
+        Args:
+            project_names: Short names of the projects (without prefix)
+
+        Returns:
+            Dictionary mapping each project name to its status information
+        """
+        return asyncio.run(self._check_registration_statuses_async(project_names))
+
+    async def _check_registration_statuses_async(self, project_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Gather the mirror update and PR listing, then resolve every project."""
+        mirror_result, open_prs = await asyncio.gather(
+            self._run_async_command(*self._mirror_sync_command()),
+            self._list_open_prs_async()
+        )
+        if mirror_result.returncode != 0:
+            raise RuntimeError(f"Failed to update registry mirror: {mirror_result.stderr.strip()}")
+
+        tree_result = await self._run_async_command(
+            'git', '--git-dir', str(self.mirror_path), 'ls-tree', '-r', '--name-only', 'HEAD', 'catalog/'
+        )
+        if tree_result.returncode != 0:
+            raise RuntimeError(f"Failed to read registry catalog: {tree_result.stderr.strip()}")
+        catalog_paths = set(tree_result.stdout.splitlines())
+        # The mirror was just fetched; re-read its HEAD on the next lookup
+        self._mirror_sha = None
+
+        return {
+            name: self._resolve_registration_status(name, catalog_paths, open_prs)
+            for name in project_names
+        }
+
+    async def _list_open_prs_async(self) -> List[Dict[str, Any]]:
+        """Run ``_list_open_prs`` on a worker thread so it overlaps the mirror update."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._list_open_prs)
+
+    def _list_open_prs(self) -> List[Dict[str, Any]]:
+        """List open registry PRs in one transport call (empty if GitHub is unreachable)."""
+        try:
+            return self.github.list_pull_requests(self.repo_slug, state="open", limit=1000)
+        except GitHubTransportError:
+            return []
+
+    def _resolve_registration_status(self, project_name: str, catalog_paths: set,
+                                     open_prs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Resolve one project's status from the catalog tree and open PRs."""
+        for project_type, type_dir in CATALOG_TYPE_DIRS.items():
+            catalog_path = f"catalog/{type_dir}/{project_name}.yaml"
+            if catalog_path in catalog_paths:
+                return {
+                    "registered": True,
+                    "type": project_type,
+                    "full_name": f"{project_type}_{project_name}",
+                    "url": f"{self.registry_url}/blob/main/{catalog_path}"
+                }
+
+        title_pattern = re.compile(rf"Register.*\b{re.escape(project_name)}\b")
+        # Bulk registration PRs list one "- **name** (...)" line per project
+        body_pattern = re.compile(rf"^- \*\*{re.escape(project_name)}\*\* \(", re.MULTILINE)
+        for pr in open_prs:
+            if (pr.get('headRefName', '') == f"register-{project_name}"
+                    or title_pattern.search(pr.get('title', ''))
+                    or body_pattern.search(pr.get('body') or '')):
+                return {
+                    "registered": False,
+                    "pending_pr": pr.get('url'),
+                    "pr_title": pr.get('title'),
+                    "status": "pending_review"
+                }
+
+        return {"registered": False, "status": "not_found"}
+
     def query_data_product(self, product_name: str) -> Dict[str, Any]:
         """Query registry for data product information.
 
+        The entry is read from the registry mirror without a checkout. When
+        the lookup cache is enabled, a lookup already answered at the current
+        registry HEAD is served from disk without touching the mirror.
+
         Args:
             product_name: Name of the data product (e.g., "data_cms-provider-data-service")
 
@@ -293,39 +905,49 @@ After merging this PR:
             FileNotFoundError: If product not found
             RuntimeError: If registry access fails
         """
-        try:
-            # Clone registry to get current catalog
-            self._clone_registry()
+        catalog_path = f"catalog/data/{product_name}.yaml"
 
-            # Look for the product in the catalog
-            catalog_dir = self.repo_path / 'catalog' / 'data'
-            catalog_file = catalog_dir / f"{product_name}.yaml"
+        head_sha = self.cache.head_sha() if self.cache else None
+        if head_sha:
+            cached = self.cache.get(head_sha, catalog_path)
+            if cached is not None:
+                if not cached.get("found"):
+                    raise FileNotFoundError(cached.get("error", f"Data product '{product_name}' not found in registry"))
+                return cached["entry"]
 
-            if not catalog_file.exists():
-                # Try to find similar products for suggestions
-                available_products = []
-                if catalog_dir.exists():
-                    for yaml_file in catalog_dir.glob("*.yaml"):
-                        available_products.append(yaml_file.stem)
+        sha = self._mirror_head(expected=head_sha)
+        if self.cache and sha != head_sha:
+            self.cache.record_head(sha)
 
-                error_msg = f"Data product '{product_name}' not found in registry"
-                if available_products:
-                    error_msg += f". Available products: {', '.join(available_products[:5])}"
-                    if len(available_products) > 5:
-                        error_msg += f" (and {len(available_products) - 5} more)"
+        catalog_data = self.read_catalog_entry(catalog_path, sha)
 
-                raise FileNotFoundError(error_msg)
+        if catalog_data is None:
+            error_msg = f"Data product '{product_name}' not found in registry"
+            suggestions = self.suggest_data_products(product_name)
+            if suggestions:
+                error_msg += f". Did you mean: {', '.join(suggestions)}?"
 
-            # Read and parse the catalog entry
-            with open(catalog_file, 'r') as f:
-                catalog_data = yaml.safe_load(f)
+            if self.cache:
+                self.cache.put_missing(sha, catalog_path, error_msg)
+            raise FileNotFoundError(error_msg)
 
-            return catalog_data
+        if self.cache:
+            self.cache.put(sha, catalog_path, catalog_data)
+        return catalog_data
 
-        finally:
-            # Cleanup
-            if self.temp_dir and self.temp_dir.exists():
-                shutil.rmtree(self.temp_dir)
+    def iter_data_products(self, max_workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Stream summaries of the data products in the registry.
+
+        Catalog blobs are read from the registry mirror through one
+        ``git cat-file --batch`` process and parsed in parallel.
+
+        Args:
+            max_workers: Parser process count (see ``iter_catalog_summaries``)
+
+        Yields:
+            Data product summaries
+        """
+        yield from self._iter_mirror_summaries(self._mirror_head(), max_workers=max_workers)
 
     def list_data_products(self) -> List[Dict[str, Any]]:
         """List all available data products in the registry.
@@ -333,91 +955,91 @@ After merging this PR:
         Returns:
             List of data product summaries
         """
-        try:
-            # Clone registry to get current catalog
-            self._clone_registry()
+        return list(self.iter_data_products())
 
-            products = []
-            catalog_dir = self.repo_path / 'catalog' / 'data'
+    def _generate_catalog_entry(self, metadata: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
+        """Generate a catalog entry for the project using metadata.json values."""
+        return build_catalog_entry(metadata)
 
-            if catalog_dir.exists():
-                for yaml_file in catalog_dir.glob("*.yaml"):
-                    try:
-                        with open(yaml_file, 'r') as f:
-                            catalog_data = yaml.safe_load(f)
 
-                        product_info = {
-                            "name": yaml_file.stem,
-                            "type": catalog_data.get("project", {}).get("type", "data"),
-                            "full_name": catalog_data.get("project", {}).get("full_name", ""),
-                            "description": catalog_data.get("metadata", {}).get("description", ""),
-                            "created_at": catalog_data.get("project", {}).get("created_at", ""),
-                            "created_by": catalog_data.get("ownership", {}).get("created_by", "")
-                        }
-                        products.append(product_info)
+def get_registry_client() -> LocalRegistry:
+    """Create a registry client using the configured registry URL.
 
-                    except Exception as e:
-                        # Skip malformed catalog entries but continue
-                        continue
+    Lookups are cached on disk unless ``registry.cache`` is false; the
+    freshness TTL comes from ``registry.cache_ttl`` (seconds). GitHub calls
+    use the transport named by ``registry.github_transport``.
+    """
+    from .config import get_config, get_registry_url
+    from .registry_cache import DEFAULT_CACHE_TTL
+    config = get_config()
+    registry_config = config.get("registry", {})
+    registry_url = get_registry_url()
 
-            return products
+    cache_ttl = None
+    # Values set with 'mintd config setup --set' arrive as strings
+    if str(registry_config.get("cache", True)).lower() not in ("false", "0", "no"):
+        cache_ttl = int(registry_config.get("cache_ttl", DEFAULT_CACHE_TTL))
 
-        finally:
-            # Cleanup
-            if self.temp_dir and self.temp_dir.exists():
-                shutil.rmtree(self.temp_dir)
+    github = None
+    if urllib.parse.urlparse(registry_url).netloc.endswith("github.com") or registry_config.get("github_api_url"):
+        github = get_github_transport(registry_config.get("github_transport", "auto"),
+                                      api_url=registry_config.get("github_api_url"))
 
-    def _generate_catalog_entry(self, metadata: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
-        """Generate a catalog entry for the project using metadata.json values."""
-        project_name = metadata["project"]["name"]
-        project_type = metadata["project"]["type"]
-        full_name = metadata["project"]["full_name"]
-
-        # Start with the metadata.json as the base catalog entry
-        entry = dict(metadata)
-
-        # Update registry-specific fields that may need adjustment
-        current_time = datetime.now().isoformat() + 'Z'
-        entry['status']['last_updated'] = current_time
-
-        # Add storage section for data and project types if not present
-        if project_type in ['data', 'project'] and 'storage' not in entry:
-            entry['storage'] = {
-                'dvc': {
-                    'remote_name': 'wasabi',
-                    'bucket': "lab-data" if project_type == 'data' else "lab-projects",
-                    'path': full_name,
-                    'endpoint': 'https://s3.wasabisys.com',
-                    'region': 'us-east-1'
-                },
-                'estimated_size': 'TBD',
-                'sensitivity': 'restricted'
-            }
-
-        # Add data dependencies for projects if not present
-        if project_type == 'project' and 'data_dependencies' not in entry['metadata']:
-            entry['metadata']['data_dependencies'] = []
-
-        return entry, project_name
+    return LocalRegistry(registry_url, cache_ttl=cache_ttl, github=github)
 
 
-def get_registry_client() -> LocalRegistry:
-    """Create a registry client using the configured registry URL."""
-    from .config import get_config
-    config = get_config()
-    registry_url = config.get("registry", {}).get("url", "")
-    return LocalRegistry(registry_url)
+# Snapshot notices already printed by this process, so bulk lookups print each once
+_snapshot_notices: set = set()
+
+
+def _registry_snapshot() -> Optional[CatalogSnapshot]:
+    """The imported snapshot if it is of the configured registry, announcing its commit and age.
+
+    A snapshot exported from another registry is ignored, with a warning.
+    """
+    from .config import get_registry_url
+
+    snapshot = get_active_snapshot()
+    if snapshot is None:
+        return None
+    try:
+        registry_url = get_registry_url()
+    except ValueError:  # offline machines may only have the snapshot
+        registry_url = None
+
+    if registry_url and not snapshot.matches(registry_url):
+        notice = (f"⚠️  Ignoring registry snapshot {snapshot.sha[:12]} of {snapshot.registry_url}: "
+                  f"the configured registry is {registry_url}")
+        snapshot = None
+    else:
+        notice = (f"📦 Reading the registry from snapshot {snapshot.sha[:12]}, exported {snapshot.age()} ago "
+                  f"(run 'mintd registry snapshot clear' to go online)")
+    if notice not in _snapshot_notices:
+        _snapshot_notices.add(notice)
+        print(notice, file=sys.stderr)
+    return snapshot
 
 
 def query_registry_for_product(product_name: str) -> Dict[str, Any]:
     """Helper to query registry for a data product.
 
+    Reads come from the imported registry snapshot when there is one for
+    the configured registry (see ``mintd registry snapshot import``),
+    without touching the network.
+
     Args:
         product_name: Name of the data product (e.g., "data_cms-provider-data-service")
 
     Returns:
         Dictionary with existence and catalog data
     """
+    snapshot = _registry_snapshot()
+    if snapshot is not None:
+        catalog_data = snapshot.query_data_product(product_name)
+        if catalog_data is None:
+            return {"exists": False}
+        return {"exists": True, "catalog_data": catalog_data, "snapshot": snapshot.sha}
+
     try:
         client = get_registry_client()
         catalog_data = client.query_data_product(product_name)
@@ -478,45 +1100,154 @@ def load_project_metadata(project_path: Path) -> Dict[str, Any]:
     return metadata
 
 
+def build_catalog_entry(metadata: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
+    """Generate a catalog entry for a project from its metadata.json values.
+
+    Args:
+        metadata: Project metadata dictionary from metadata.json
+
+    Returns:
+        Tuple of (catalog entry, short project name used for the catalog file)
+    """
+    project_name = metadata["project"]["name"]
+    project_type = metadata["project"]["type"]
+    full_name = metadata["project"]["full_name"]
+
+    # Start with the metadata.json as the base catalog entry
+    entry = dict(metadata)
+
+    # Update registry-specific fields that may need adjustment
+    current_time = datetime.now().isoformat() + 'Z'
+    entry['status']['last_updated'] = current_time
+
+    # Add storage section for data and project types if not present
+    if project_type in ['data', 'project'] and 'storage' not in entry:
+        entry['storage'] = {
+            'dvc': {
+                'remote_name': 'wasabi',
+                'bucket': "lab-data" if project_type == 'data' else "lab-projects",
+                'path': full_name,
+                'endpoint': 'https://s3.wasabisys.com',
+                'region': 'us-east-1'
+            },
+            'estimated_size': 'TBD',
+            'sensitivity': 'restricted'
+        }
+
+    # Add data dependencies for projects if not present
+    if project_type == 'project' and 'data_dependencies' not in entry['metadata']:
+        entry['metadata']['data_dependencies'] = []
+
+    return entry, project_name
+
+
+def _prepare_registration(item: Tuple[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Build and validate the catalog entry for one local project.
+
+    Module-level so it can be shipped to worker processes.
+    """
+    path, metadata = item
+    project = metadata.get("project") if isinstance(metadata.get("project"), dict) else {}
+    prepared = {"path": path, "name": project.get("name"), "full_name": project.get("full_name"),
+                "type": project.get("type"), "entry": None}
+
+    errors = validate_catalog_entry(metadata)
+    if not errors:
+        entry, _ = build_catalog_entry(copy.deepcopy(metadata))
+        errors = validate_catalog_entry(entry)
+        prepared["entry"] = entry
+    prepared["errors"] = errors
+    return prepared
+
+
+def prepare_registrations(projects: List[Tuple[Path, Dict[str, Any]]],
+                          max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Build and validate catalog entries for many local projects, in parallel when there are enough.
+
+    Args:
+        projects: ``(project path, metadata)`` pairs, e.g. from ``discover_local_projects``
+        max_workers: Worker process count (default: CPU count; 1 disables the pool)
+
+    Returns:
+        List of dictionaries with path, name, full_name, type, the catalog
+        ``entry`` and validation ``errors``, in input order
+    """
+    items = [(str(path), metadata) for path, metadata in projects]
+    return [prepared for prepared in _iter_parsed(_prepare_registration, items, max_workers)]
+
+
+def discover_local_projects(root: Path, max_depth: int = 4) -> List[Tuple[Path, Dict[str, Any]]]:
+    """Find mintd projects under a directory by their metadata.json.
+
+    Projects are not searched for nested projects, and common heavy
+    directories (.git, data, virtualenvs) are skipped.
+
+    Args:
+        root: Directory to search
+        max_depth: Maximum directory depth below ``root`` to descend
+
+    Returns:
+        List of (project_path, raw metadata) tuples, sorted by path
+    """
+    root = Path(root)
+    projects = []
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        current = Path(dirpath)
+        depth = len(current.relative_to(root).parts)
+
+        if "metadata.json" in filenames:
+            try:
+                with open(current / "metadata.json", "r") as f:
+                    metadata = json.load(f)
+                if metadata.get("project", {}).get("name") and metadata["project"].get("type"):
+                    projects.append((current, metadata))
+                    dirnames[:] = []
+                    continue
+            except (json.JSONDecodeError, OSError, AttributeError):
+                pass
+
+        if depth >= max_depth:
+            dirnames[:] = []
+        else:
+            dirnames[:] = [d for d in dirnames if d not in DISCOVERY_SKIP_DIRS and not d.startswith('.')]
+
+    return sorted(projects, key=lambda item: str(item[0]))
+
+
+def get_registration_queue() -> RegistrationQueue:
+    """Open the pending-registration queue under ``~/.mintd``.
+
+    Registrations saved as JSON files by earlier mintd versions are moved
+    into the queue the first time it is opened.
+    """
+    mintd_dir = Path.home() / ".mintd"
+    queue = RegistrationQueue(mintd_dir / "registration_queue.db")
+    legacy_dir = mintd_dir / "pending_registrations"
+    if legacy_dir.exists():
+        queue.import_legacy(legacy_dir)
+    return queue
+
+
 def save_pending_registration(project_path: Path, metadata: Dict[str, Any]) -> None:
-    """Save registration request for later retry when registry is available.
+    """Queue a registration request for later submission.
+
+    A request already queued for the same project is replaced.
 
     Args:
         project_path: Path to the project directory
         metadata: Project metadata to save for later registration
     """
-    pending_dir = Path.home() / ".mintd" / "pending_registrations"
-    pending_dir.mkdir(parents=True, exist_ok=True)
-
-    pending_file = pending_dir / f"{metadata['project']['full_name']}.json"
-
-    with open(pending_file, "w") as f:
-        json.dump({
-            "project_path": str(project_path),
-            "metadata": metadata,
-            "created_at": datetime.now().isoformat()
-        }, f, indent=2)
+    get_registration_queue().enqueue(project_path, metadata)
 
 
 def get_pending_registrations() -> list:
     """Get list of pending registrations.
 
     Returns:
-        List of pending registration info dictionaries
+        List of pending registration info dictionaries, soonest due first
     """
-    pending_dir = Path.home() / ".mintd" / "pending_registrations"
-    if not pending_dir.exists():
-        return []
-
-    pending = []
-    for file in pending_dir.glob("*.json"):
-        try:
-            with open(file, "r") as f:
-                pending.append(json.load(f))
-        except (json.JSONDecodeError, IOError):
-            continue
-
-    return pending
+    return get_registration_queue().pending()
 
 
 def clear_pending_registration(project_name: str) -> None:
@@ -525,8 +1256,35 @@ def clear_pending_registration(project_name: str) -> None:
     Args:
         project_name: Full project name (e.g., "data_hospital_project")
     """
-    pending_dir = Path.home() / ".mintd" / "pending_registrations"
-    pending_file = pending_dir / f"{project_name}.json"
+    get_registration_queue().remove(project_name)
+
 
-    if pending_file.exists():
-        pending_file.unlink()
\ No newline at end of file
+def process_pending_registrations(max_workers: int = 4, force: bool = False,
+                                  on_result=None) -> Dict[str, int]:
+    """Submit queued registrations concurrently, each through its own registry client.
+
+    Args:
+        max_workers: Registrations submitted at once
+        force: Retry registrations that are still backing off
+        on_result: Called as ``(job, pr_url, error)`` when each one finishes
+
+    Returns:
+        Dictionary with ``submitted`` and ``failed`` counts
+    """
+    def register(metadata: Dict[str, Any]) -> str:
+        return get_registry_client().register_project(metadata)
+
+    return drain_queue(get_registration_queue(), register, max_workers=max_workers,
+                       force=force, on_result=on_result)
+
+
+def start_registration_worker() -> None:
+    """Start a detached ``mintd registry worker`` that drains the queue in the background."""
+    log_path = Path.home() / ".mintd" / "registration_worker.log"
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_path, "a") as log:
+        subprocess.Popen(
+            [sys.executable, "-m", "mintd", "registry", "worker"],
+            stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT,
+            start_new_session=True
+        )
\ No newline at end of file
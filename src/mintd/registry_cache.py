@@ -0,0 +1,200 @@
+"""On-disk cache of registry catalog lookups.
+
+Entries are keyed by the registry HEAD commit and the catalog path they were
+read from, so a cached answer is valid for as long as the registry HEAD has
+not moved. Freshness is checked with a single ``git ls-remote`` round-trip,
+and a TTL lets repeated lookups skip even that.
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .catalog_index import INDEX_VERSION
+from .config import CONFIG_DIR
+
+# Default location for cached registry data
+CACHE_ROOT = CONFIG_DIR / "cache" / "registry"
+
+# Seconds a verified HEAD SHA is trusted before asking the remote again
+DEFAULT_CACHE_TTL = 300
+
+
+def registry_cache_slug(registry_url: str) -> str:
+    """Turn a registry URL into a filesystem-safe directory name."""
+    slug = re.sub(r"^[a-z]+://", "", registry_url.strip().rstrip("/"))
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", slug).strip("_")
+
+
+def write_json_atomic(path: Path, data: Any) -> None:
+    """Write JSON to ``path`` via a temp file and rename."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, default=str)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def load_catalog_index(cache_dir: Path, sha: str) -> Optional[Dict[str, Any]]:
+    """Load the catalog index stored for registry commit ``sha``, if any."""
+    try:
+        with open(cache_dir / "index" / f"{sha}.json", "r") as f:
+            index = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if index.get("version") != INDEX_VERSION:
+        return None
+    return index
+
+
+def latest_catalog_index(cache_dir: Path) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """Return ``(sha, index)`` for whichever catalog index is stored, if any."""
+    for path in sorted((cache_dir / "index").glob("*.json")):
+        index = load_catalog_index(cache_dir, path.stem)
+        if index is not None:
+            return path.stem, index
+    return None
+
+
+def save_catalog_index(cache_dir: Path, sha: str, index: Dict[str, Any]) -> None:
+    """Store the catalog index for ``sha`` and drop indexes of older commits."""
+    index_dir = cache_dir / "index"
+    write_json_atomic(index_dir / f"{sha}.json", index)
+    for child in index_dir.glob("*.json"):
+        if child.stem != sha:
+            child.unlink()
+
+
+def load_validation_results(cache_dir: Path, fingerprint: str) -> Dict[str, Any]:
+    """Load cached per-blob validation results made with schema ``fingerprint``."""
+    try:
+        with open(cache_dir / "validation.json", "r") as f:
+            stored = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if stored.get("schema") != fingerprint:
+        return {}
+    return stored.get("results", {})
+
+
+def save_validation_results(cache_dir: Path, fingerprint: str, results: Dict[str, Any]) -> None:
+    """Store per-blob validation results made with schema ``fingerprint``."""
+    write_json_atomic(cache_dir / "validation.json", {"schema": fingerprint, "results": results})
+
+
+class RegistryCache:
+    """Cache catalog lookups for one registry, keyed by HEAD SHA and catalog path."""
+
+    def __init__(self, registry_url: str, remote_url: str, ttl: int = DEFAULT_CACHE_TTL,
+                 cache_root: Optional[Path] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            registry_url: Registry URL (used to namespace the cache directory)
+            remote_url: Git URL passed to ``git ls-remote`` for freshness checks
+            ttl: Seconds to trust a verified HEAD SHA without contacting the remote
+            cache_root: Override the cache root directory (default: ~/.mintd/cache/registry)
+        """
+        self.registry_url = registry_url
+        self.remote_url = remote_url
+        self.ttl = ttl
+        self.cache_dir = (cache_root or CACHE_ROOT) / registry_cache_slug(registry_url)
+        self.head_file = self.cache_dir / "head.json"
+
+    def _read_head(self) -> Optional[Dict[str, Any]]:
+        """Read the last verified HEAD record, if any."""
+        try:
+            with open(self.head_file, "r") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _ls_remote_head(self) -> Optional[str]:
+        """Ask the remote for its HEAD SHA with a single ``git ls-remote``."""
+        try:
+            result = subprocess.run(
+                ["git", "ls-remote", self.remote_url, "HEAD"],
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=30
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None
+
+        for line in result.stdout.splitlines():
+            parts = line.split()
+            if len(parts) == 2 and parts[1] == "HEAD":
+                return parts[0]
+        return None
+
+    def head_sha(self, refresh: bool = False) -> Optional[str]:
+        """Return the registry HEAD SHA, contacting the remote only when the TTL expired.
+
+        Args:
+            refresh: Ignore the TTL and always run ``git ls-remote``
+
+        Returns:
+            HEAD SHA, or None if it could not be determined
+        """
+        record = self._read_head()
+        if record and not refresh and time.time() - record.get("checked_at", 0) < self.ttl:
+            return record.get("sha")
+
+        sha = self._ls_remote_head()
+        if sha is None:
+            # Remote unreachable: we cannot prove freshness, so do not serve cached data
+            return None
+
+        self.record_head(sha)
+        return sha
+
+    def record_head(self, sha: str) -> None:
+        """Record ``sha`` as the verified HEAD and drop entries cached for older SHAs."""
+        write_json_atomic(self.head_file, {"sha": sha, "checked_at": time.time()})
+
+        if self.cache_dir.exists():
+            for child in self.cache_dir.iterdir():
+                if child.is_dir() and child.name != sha and re.fullmatch(r"[0-9a-f]{40}", child.name):
+                    shutil.rmtree(child, ignore_errors=True)
+
+    def _entry_path(self, sha: str, catalog_path: str) -> Path:
+        """Location of the cached lookup for ``catalog_path`` at ``sha``."""
+        return self.cache_dir / sha / f"{catalog_path}.json"
+
+    def get(self, sha: str, catalog_path: str) -> Optional[Dict[str, Any]]:
+        """Return the cached lookup record for ``catalog_path`` at ``sha``.
+
+        Returns:
+            ``{"found": True, "entry": {...}}``, ``{"found": False, "error": "..."}``,
+            or None on a cache miss
+        """
+        try:
+            with open(self._entry_path(sha, catalog_path), "r") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def put(self, sha: str, catalog_path: str, entry: Dict[str, Any]) -> None:
+        """Cache a catalog entry found at ``catalog_path``."""
+        write_json_atomic(self._entry_path(sha, catalog_path), {"found": True, "entry": entry})
+
+    def put_missing(self, sha: str, catalog_path: str, error: str) -> None:
+        """Cache the fact that ``catalog_path`` does not exist at ``sha``."""
+        write_json_atomic(self._entry_path(sha, catalog_path), {"found": False, "error": error})
+
+    def clear(self) -> None:
+        """Remove everything cached for this registry."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
@@ -0,0 +1,243 @@
+"""Portable offline snapshots of the registry catalog.
+
+A snapshot bundle is one gzip-compressed tar holding every catalog file at a
+registry commit, the prebuilt catalog index for that commit and a small
+manifest. ``mintd registry snapshot export`` writes one on a connected
+machine; ``mintd registry snapshot import`` unpacks it on a machine that
+cannot reach GitHub, after which registry reads are served from disk without
+any network round-trips.
+"""
+
+import io
+import json
+import shutil
+import tarfile
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import yaml
+
+from .catalog_index import INDEX_VERSION, suggest_names
+from .config import CONFIG_DIR
+
+# Where ``mintd registry snapshot import`` unpacks the active snapshot
+SNAPSHOT_DIR = CONFIG_DIR / "snapshot"
+
+# Bumped whenever the bundle layout changes
+SNAPSHOT_FORMAT = 1
+
+MANIFEST_NAME = "manifest.json"
+INDEX_NAME = "index.json"
+
+
+def _add_bytes(tar: tarfile.TarFile, name: str, data: bytes, mtime: float) -> None:
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mtime = int(mtime)
+    info.mode = 0o644
+    tar.addfile(info, io.BytesIO(data))
+
+
+def write_snapshot_bundle(output: Path, manifest: Dict[str, Any], index: Dict[str, Any],
+                          files: Iterable[Tuple[str, bytes]]) -> Dict[str, Any]:
+    """Write a snapshot bundle.
+
+    Args:
+        output: Bundle path to write (``.tar.gz``)
+        manifest: Registry URL and commit the snapshot was taken at
+        index: Catalog index for that commit
+        files: ``(catalog path, contents)`` pairs
+
+    Returns:
+        The manifest as stored in the bundle
+    """
+    files = sorted(files)
+    manifest = dict(manifest, format=SNAPSHOT_FORMAT, entries=len(files),
+                    created_at=manifest.get("created_at") or time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()))
+    now = time.time()
+
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp = output.with_name(f".{output.name}.tmp")
+    with tarfile.open(tmp, "w:gz") as tar:
+        _add_bytes(tar, MANIFEST_NAME, json.dumps(manifest, indent=2).encode(), now)
+        _add_bytes(tar, INDEX_NAME, json.dumps(index, default=str).encode(), now)
+        for path, data in files:
+            _add_bytes(tar, path, data, now)
+    tmp.replace(output)
+    return manifest
+
+
+def _check_member(member: tarfile.TarInfo) -> None:
+    """Reject bundle members that are not plain files inside the snapshot."""
+    path = PurePosixPath(member.name)
+    if not member.isfile() or path.is_absolute() or ".." in path.parts:
+        raise ValueError(f"Unexpected entry in snapshot bundle: {member.name}")
+    if member.name not in (MANIFEST_NAME, INDEX_NAME) and path.parts[0] != "catalog":
+        raise ValueError(f"Unexpected entry in snapshot bundle: {member.name}")
+
+
+def import_snapshot_bundle(bundle: Path, snapshot_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """Unpack a snapshot bundle, replacing any previously imported snapshot.
+
+    The bundle is extracted beside the target and swapped in, so a failed
+    import leaves the previous snapshot untouched.
+
+    Args:
+        bundle: Bundle written by ``write_snapshot_bundle``
+        snapshot_dir: Where to unpack (default: SNAPSHOT_DIR)
+
+    Returns:
+        The bundle manifest
+
+    Raises:
+        ValueError: If the file is not a snapshot bundle this version can read
+    """
+    snapshot_dir = Path(snapshot_dir or SNAPSHOT_DIR)
+    snapshot_dir.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(dir=snapshot_dir.parent, prefix=".snapshot-"))
+
+    try:
+        try:
+            with tarfile.open(bundle, "r:gz") as tar:
+                members = tar.getmembers()
+                for member in members:
+                    _check_member(member)
+                tar.extractall(staging, members=members)
+        except tarfile.TarError as e:
+            raise ValueError(f"Not a registry snapshot bundle: {bundle} ({e})")
+
+        manifest = _load_manifest(staging)
+        if manifest is None:
+            raise ValueError(f"Not a registry snapshot bundle: {bundle} (no {MANIFEST_NAME})")
+        if manifest.get("format") != SNAPSHOT_FORMAT:
+            raise ValueError(f"Unsupported snapshot format {manifest.get('format')!r} in {bundle}")
+
+        if snapshot_dir.exists():
+            shutil.rmtree(snapshot_dir)
+        staging.replace(snapshot_dir)
+        return manifest
+    finally:
+        if staging.exists():
+            shutil.rmtree(staging, ignore_errors=True)
+
+
+def _load_manifest(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path / MANIFEST_NAME, "r") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+class CatalogSnapshot:
+    """Read-only view of an imported snapshot."""
+
+    def __init__(self, path: Path, manifest: Dict[str, Any]):
+        """
+        Initialize the view.
+
+        Args:
+            path: Snapshot directory
+            manifest: Its manifest
+        """
+        self.path = Path(path)
+        self.manifest = manifest
+        self._index: Optional[Dict[str, Any]] = None
+
+    @property
+    def sha(self) -> str:
+        """Registry commit the snapshot was taken at."""
+        return self.manifest.get("sha", "")
+
+    @property
+    def registry_url(self) -> str:
+        """URL of the registry the snapshot was exported from."""
+        return self.manifest.get("registry_url", "")
+
+    def matches(self, registry_url: str) -> bool:
+        """Whether the snapshot was exported from ``registry_url`` (any clone URL form)."""
+        return _normalize_registry_url(self.registry_url) == _normalize_registry_url(registry_url)
+
+    def age(self) -> str:
+        """How long ago the snapshot was exported, e.g. "3 days" ("unknown" if not recorded)."""
+        try:
+            created = datetime.strptime(self.manifest["created_at"], "%Y-%m-%dT%H:%M:%SZ")
+        except (KeyError, TypeError, ValueError):
+            return "unknown"
+        seconds = max(0, (datetime.now(timezone.utc) - created.replace(tzinfo=timezone.utc)).total_seconds())
+        for unit, size in (("day", 86400), ("hour", 3600), ("minute", 60)):
+            if seconds >= size:
+                count = int(seconds // size)
+                return f"{count} {unit}{'' if count == 1 else 's'}"
+        return "less than a minute"
+
+    def read_entry(self, catalog_path: str) -> Optional[Dict[str, Any]]:
+        """Return the parsed catalog entry at ``catalog_path``, or None if absent."""
+        try:
+            with open(self.path / catalog_path, "r") as f:
+                return yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+        except FileNotFoundError:
+            return None
+
+    def query_data_product(self, product_name: str) -> Optional[Dict[str, Any]]:
+        """Return the catalog entry of a data product, or None if it is not in the snapshot."""
+        return self.read_entry(f"catalog/data/{product_name}.yaml")
+
+    def index(self) -> Dict[str, Any]:
+        """Catalog index shipped with the snapshot (empty if it is from another mintd version)."""
+        if self._index is None:
+            try:
+                with open(self.path / INDEX_NAME, "r") as f:
+                    index = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                index = None
+            if not index or index.get("version") != INDEX_VERSION:
+                index = {"entries": [], "name_sizes": [], "name_trigrams": {}, "text_trigrams": {}}
+            self._index = index
+        return self._index
+
+    def iter_data_products(self) -> Iterator[Dict[str, Any]]:
+        """Yield the data product summaries recorded in the snapshot index."""
+        yield from self.index()["entries"]
+
+    def suggest(self, product_name: str, limit: int = 5) -> List[str]:
+        """Names in the snapshot similar to ``product_name``."""
+        return suggest_names(self.index(), product_name, limit=limit)
+
+
+def _normalize_registry_url(url: str) -> str:
+    url = (url or "").strip().rstrip("/").lower()
+    if url.startswith("git@github.com:"):
+        url = "https://github.com/" + url[len("git@github.com:"):]
+    return url[:-len(".git")] if url.endswith(".git") else url
+
+
+def get_active_snapshot(snapshot_dir: Optional[Path] = None,
+                        registry_url: Optional[str] = None) -> Optional[CatalogSnapshot]:
+    """Return the imported snapshot, or None if registry reads should go online.
+
+    Args:
+        snapshot_dir: Snapshot directory (default: SNAPSHOT_DIR)
+        registry_url: Only return a snapshot exported from this registry
+    """
+    path = Path(snapshot_dir or SNAPSHOT_DIR)
+    manifest = _load_manifest(path)
+    if manifest is None or manifest.get("format") != SNAPSHOT_FORMAT:
+        return None
+    snapshot = CatalogSnapshot(path, manifest)
+    if registry_url and not snapshot.matches(registry_url):
+        return None
+    return snapshot
+
+
+def clear_snapshot(snapshot_dir: Optional[Path] = None) -> bool:
+    """Remove the imported snapshot. Returns True if there was one."""
+    path = Path(snapshot_dir or SNAPSHOT_DIR)
+    if not path.exists():
+        return False
+    shutil.rmtree(path)
+    return True
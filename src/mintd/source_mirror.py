@@ -0,0 +1,231 @@
+"""Cached clones of data product repositories.
+
+Each source repository is kept as a bare clone under
+``~/.mintd/cache/sources``, keyed by URL, and brought up to date with
+incremental fetches. Checking imported data against its source then reads
+the commit graph and ``.dvc`` files locally, and ``dvc import``, ``update``
+and ``ls`` work from a local copy of the mirror instead of cloning the source
+again in every process (see ``use_mirror_for_dvc``). The data itself still
+comes from the source's DVC remote; data repositories keep only code and DVC
+metadata in git, so a full clone of one stays small.
+"""
+
+import atexit
+import logging
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .config import CONFIG_DIR
+from .git_batch import GitObjectReader
+from .registry_cache import registry_cache_slug
+
+logger = logging.getLogger(__name__)
+
+SOURCE_CACHE_ROOT = CONFIG_DIR / "cache" / "sources"
+
+
+class SourceMirror:
+    """Bare clone of one data product repository.
+
+    Example:
+        mirror = get_source_mirror("git@github.com:org/data_claims.git")
+        mirror.sync()
+        head = mirror.resolve()
+        dvc_file = mirror.read(f"{head}:data/final.dvc")
+    """
+
+    def __init__(self, url: str, cache_root: Optional[Path] = None):
+        """
+        Initialize the mirror. Nothing is cloned until ``sync``.
+
+        Args:
+            url: Repository URL, as given to ``dvc import``
+            cache_root: Override the directory holding source mirrors
+        """
+        self.url = url
+        self.path = (cache_root or SOURCE_CACHE_ROOT) / f"{registry_cache_slug(url)}.git"
+        self._objects = GitObjectReader(self.path)
+        self._synced = False
+        # Why the last sync could not reach the source (None if it did)
+        self.sync_error: Optional[str] = None
+        # Dependencies on the same source are checked from several threads
+        self._lock = threading.Lock()
+
+    def _git(self, *args: str) -> str:
+        result = subprocess.run(['git', '--git-dir', str(self.path), *args],
+                                capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"git {args[0]} failed for {self.url}: {result.stderr.strip()}")
+        return result.stdout.strip()
+
+    def sync(self, force: bool = False) -> None:
+        """Clone the repository, or fetch new commits into it (once per mirror unless ``force``).
+
+        When the source cannot be reached, an existing clone is used as it is
+        and ``sync_error`` says why it may be out of date. A blob-less clone
+        left by an earlier mintd is replaced by a full one.
+
+        Raises:
+            RuntimeError: If there is no clone yet and the source cannot be cloned
+        """
+        with self._lock:
+            if self._synced and not force:
+                return
+            if (self.path / "HEAD").exists() and not self._partial():
+                cmd = ['git', '--git-dir', str(self.path), 'fetch', '--prune', '--quiet',
+                       'origin', '+refs/heads/*:refs/heads/*', '+refs/tags/*:refs/tags/*']
+                result = subprocess.run(cmd, capture_output=True, text=True)
+                self.sync_error = (result.stderr.strip() or "git fetch failed") if result.returncode else None
+            else:
+                self._clone()
+            self._synced = True
+
+    def _partial(self) -> bool:
+        result = subprocess.run(['git', '--git-dir', str(self.path), 'config', '--get', 'remote.origin.promisor'],
+                                capture_output=True, text=True)
+        return result.stdout.strip() == "true"
+
+    def _clone(self) -> None:
+        """Clone next to the mirror and swap the clone in, keeping any old one if cloning fails."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(dir=self.path.parent, prefix=f".{self.path.name}."))
+        try:
+            result = subprocess.run(['git', 'clone', '--bare', '--quiet', self.url, str(staging)],
+                                    capture_output=True, text=True)
+            if result.returncode != 0:
+                if (self.path / "HEAD").exists():
+                    self.sync_error = result.stderr.strip() or "git clone failed"
+                    return
+                raise RuntimeError(f"Failed to clone {self.url}: {result.stderr.strip()}")
+            self.sync_error = None
+            self._objects.close()
+            shutil.rmtree(self.path, ignore_errors=True)
+            os.replace(staging, self.path)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def resolve(self, rev: Optional[str] = None) -> str:
+        """Commit SHA of a branch, tag or commit (default: the source's HEAD)."""
+        return self._git('rev-parse', '--verify', f"{rev or 'HEAD'}^{{commit}}")
+
+    def commits_between(self, old: str, new: str) -> Optional[int]:
+        """Number of commits in ``new`` that are not in ``old`` (None if ``old`` is unknown)."""
+        try:
+            return int(self._git('rev-list', '--count', f"{old}..{new}"))
+        except RuntimeError:
+            return None
+
+    def read(self, spec: str) -> Optional[bytes]:
+        """Contents of ``<rev>:<path>`` (None if missing)."""
+        return self._objects.read(spec)
+
+    def close(self) -> None:
+        """Stop the mirror's object reader process, if running."""
+        self._objects.close()
+
+
+_mirrors: Dict[str, SourceMirror] = {}
+_mirrors_lock = threading.Lock()
+
+
+def get_source_mirror(url: str) -> SourceMirror:
+    """Return the shared mirror of a source repository, creating it on first use."""
+    with _mirrors_lock:
+        mirror = _mirrors.get(url)
+        if mirror is None:
+            mirror = _mirrors[url] = SourceMirror(url)
+        return mirror
+
+
+# Working copies handed to DVC, removed when the process exits
+_dvc_clones: List[str] = []
+_dvc_clones_lock = threading.Lock()
+
+# DVC releases whose private ``open_repo.CLONES`` maps a URL to a
+# (clone path, shallow) tuple, as use_mirror_for_dvc relies on
+DVC_CLONES_VERSIONS = ((3, 0), (4, 0))
+_dvc_clones_unsupported: Optional[str] = None
+
+
+def _dvc_clones_table() -> Optional[dict]:
+    """DVC's table of source clones, or None if this DVC's layout is not one mintd was tested with."""
+    global _dvc_clones_unsupported
+    import dvc
+    from dvc.repo import open_repo
+
+    version = tuple(int(part) for part in re.findall(r"\d+", dvc.__version__)[:2])
+    clones = getattr(open_repo, "CLONES", None)
+    low, high = DVC_CLONES_VERSIONS
+    if not low <= version < high:
+        reason = f"DVC {dvc.__version__} is not a tested release (>={low[0]}.{low[1]}, <{high[0]}.{high[1]})"
+    elif not isinstance(clones, dict) or any(not isinstance(entry, tuple) or len(entry) != 2
+                                             for entry in clones.values()):
+        reason = f"DVC {dvc.__version__} keeps its clones differently"
+    else:
+        return clones
+    if reason != _dvc_clones_unsupported:
+        logger.warning("Not using cached source mirrors for DVC: %s", reason)
+        _dvc_clones_unsupported = reason
+    return None
+
+
+def use_mirror_for_dvc(url: str, refresh: bool = False) -> Optional[str]:
+    """Have DVC read the source repository ``url`` through its mirror.
+
+    DVC clones the source of every ``import``, ``update`` and ``ls`` into a
+    temporary directory once per process, and pulls into that clone on later
+    uses. This registers a working copy of the mirror (a local clone,
+    hard-linking the mirror's objects) as DVC's clone of ``url`` instead, so
+    DVC pulls from the mirror. The mirror is fetched from the source once per
+    process, and again whenever ``refresh`` is set. The URL DVC records in
+    .dvc files is unchanged. Only affects DVC running in this process, and
+    only DVC releases in ``DVC_CLONES_VERSIONS``.
+
+    Args:
+        url: Repository URL, as given to ``dvc import``
+        refresh: Fetch new commits into the mirror first, as ``dvc update`` needs
+
+    Returns:
+        The working copy DVC uses, or None when DVC clones the source itself:
+        ``url`` is a local path (which DVC opens in place), the installed DVC
+        is not a tested release, or the mirror could not be cloned
+    """
+    if os.path.exists(url):
+        return None
+    clones = _dvc_clones_table()
+    if clones is None:
+        return None
+    with _dvc_clones_lock:
+        if url in clones:
+            clone_path = clones[url][0]
+            if clone_path in _dvc_clones:
+                get_source_mirror(url).sync(force=refresh)
+            return clone_path
+
+        clone_path = tempfile.mkdtemp(suffix="mintd-clone")
+        try:
+            mirror = get_source_mirror(url)
+            mirror.sync(force=refresh)
+            subprocess.run(['git', 'clone', '--quiet', str(mirror.path), clone_path],
+                           capture_output=True, text=True, check=True)
+        except (RuntimeError, subprocess.CalledProcessError) as e:
+            logger.debug("Not using the mirror of %s: %s", url, getattr(e, "stderr", None) or e)
+            shutil.rmtree(clone_path, ignore_errors=True)
+            return None
+        if not _dvc_clones:
+            atexit.register(_remove_dvc_clones)
+        _dvc_clones.append(clone_path)
+        # (path, shallow): DVC pulls into this clone from its origin, the mirror
+        clones[url] = (clone_path, False)
+        return clone_path
+
+
+def _remove_dvc_clones() -> None:
+    for path in _dvc_clones:
+        shutil.rmtree(path, ignore_errors=True)
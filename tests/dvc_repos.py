@@ -0,0 +1,42 @@
+"""Local git + DVC repositories for tests that run real DVC operations."""
+
+import os
+import subprocess
+from pathlib import Path
+from typing import Dict
+
+GIT_ENV = {
+    **os.environ,
+    "GIT_AUTHOR_NAME": "Test", "GIT_AUTHOR_EMAIL": "test@example.com",
+    "GIT_COMMITTER_NAME": "Test", "GIT_COMMITTER_EMAIL": "test@example.com",
+}
+
+
+def run(cmd, cwd: Path) -> None:
+    """Run a git or dvc command, failing the test on error."""
+    subprocess.run(cmd, cwd=cwd, check=True, capture_output=True, env=GIT_ENV)
+
+
+def make_source_repo(root: Path, files: Dict[str, str]) -> Path:
+    """Create a data product repository whose ``data/final`` is tracked by DVC.
+
+    Args:
+        root: Scratch directory; the repository is ``root/source`` and its
+            DVC remote ``root/remote``
+        files: Contents of ``data/final``, keyed by path relative to it
+
+    Returns:
+        Path to the repository
+    """
+    repo = root / "source"
+    for name, content in files.items():
+        (repo / "data" / "final" / name).parent.mkdir(parents=True, exist_ok=True)
+        (repo / "data" / "final" / name).write_text(content)
+    run(["git", "init", "-q"], repo)
+    run(["dvc", "init", "-q"], repo)
+    run(["dvc", "remote", "add", "-d", "store", str(root / "remote")], repo)
+    run(["dvc", "add", "-q", "data/final"], repo)
+    run(["dvc", "push", "-q"], repo)
+    run(["git", "add", "-A"], repo)
+    run(["git", "commit", "-q", "-m", "data"], repo)
+    return repo
@@ -0,0 +1,259 @@
+"""Offline stand-in for the data commons registry.
+
+Builds a local bare git repository holding N synthetic catalog entries and
+puts a fake ``gh`` executable first on PATH, so ``LocalRegistry`` operations
+(register, status, query, list, sync) run end to end without network access.
+Used by the registry tests and by ``benchmarks/bench_registry_ops.py``.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import yaml
+
+from mintd.registry import LocalRegistry
+from mintd.templates.data import DataTemplate
+from mintd.utils import format_project_name
+
+# Identity used for every commit the harness (or code under test) makes
+GIT_IDENTITY = {
+    "GIT_AUTHOR_NAME": "Registry Harness",
+    "GIT_AUTHOR_EMAIL": "harness@example.com",
+    "GIT_COMMITTER_NAME": "Registry Harness",
+    "GIT_COMMITTER_EMAIL": "harness@example.com",
+}
+
+FAKE_GH = textwrap.dedent('''\
+    #!{python}
+    """Minimal fake of the GitHub CLI: enough of ``gh pr`` for mintd's registry."""
+    import json
+    import os
+    import sys
+
+    STATE = os.environ["MINTD_FAKE_GH_STATE"]
+
+
+    def load():
+        try:
+            with open(STATE) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return []
+
+
+    def option(args, name, default=None):
+        return args[args.index(name) + 1] if name in args else default
+
+
+    args = sys.argv[1:]
+    with open(STATE + ".log", "a") as log:
+        log.write(json.dumps(args) + "\\n")
+
+    if args[:2] == ["pr", "create"]:
+        prs = load()
+        number = len(prs) + 1
+        pr = {{
+            "number": number,
+            "title": option(args, "--title", ""),
+            "body": option(args, "--body", ""),
+            "headRefName": option(args, "--head", ""),
+            "state": "OPEN",
+            "url": "https://github.com/{repo}/pull/%d" % number,
+        }}
+        prs.append(pr)
+        with open(STATE, "w") as f:
+            json.dump(prs, f)
+        print(pr["url"])
+    elif args[:2] == ["pr", "list"]:
+        fields = option(args, "--json", "number,title,url").split(",")
+        limit = int(option(args, "--limit", "30"))
+        prs = [pr for pr in load() if pr["state"] == "OPEN"][:limit]
+        print(json.dumps([{{k: pr.get(k) for k in fields}} for pr in prs]))
+    else:
+        sys.stderr.write("fake gh: unsupported command: %s\\n" % " ".join(args))
+        sys.exit(1)
+''')
+
+
+def synthetic_entry(i: int) -> Dict[str, Any]:
+    """A realistic catalog entry for synthetic data product number ``i``."""
+    name = f"synthetic-product-{i:05d}"
+    return {
+        "schema_version": "1.0",
+        "project": {
+            "name": name,
+            "type": "data",
+            "full_name": f"data_{name}",
+            "created_at": "2025-01-01T00:00:00Z",
+            "created_by": "harness",
+        },
+        "metadata": {
+            "description": f"Synthetic data product number {i}",
+            "tags": ["synthetic", f"group-{i % 50}"],
+        },
+        "ownership": {"team": "lab", "created_by": "harness"},
+        "access_control": {"teams": [{"name": "lab-admins", "permission": "admin"}]},
+        "storage": {
+            "provider": "s3",
+            "bucket": "lab-data",
+            "prefix": f"lab/{name}/",
+            "dvc": {"remote_name": f"data_{name}", "remote_url": f"s3://lab-data/lab/{name}/"},
+        },
+        "repository": {"github_url": f"https://github.com/test-org/data_{name}", "default_branch": "main"},
+        "status": {"state": "active", "last_updated": "2025-01-01T00:00:00Z"},
+    }
+
+
+def synthetic_metadata(name: str, project_type: str = "data") -> Dict[str, Any]:
+    """A metadata.json document rendered from ``mintd create``'s template, ready to register.
+
+    The template does not write the ``metadata``, ``access_control`` and
+    ``status`` sections that registration requires, so they are added, as
+    an owner does before registering.
+    """
+    full_name = format_project_name(project_type, name)
+    template = DataTemplate().jinja_env.get_template("metadata.json.j2")
+    metadata = json.loads(template.render(
+        project_name=name, project_type=project_type, full_project_name=full_name,
+        created_at="2025-01-01T00:00:00Z", author="harness", team="lab", classification="private",
+        storage_prefix=f"lab/{full_name}/", registry_org="test-org", mint_version="test", mint_hash="",
+    ))
+    metadata.update({
+        "metadata": {"description": f"Harness project {name}", "tags": []},
+        "access_control": {"teams": [{"name": "lab-admins", "permission": "admin"}]},
+        "status": {"state": "active", "last_updated": "2025-01-01T00:00:00Z"},
+    })
+    return metadata
+
+
+def _git(*args: str, cwd: Optional[Path] = None, input: Optional[bytes] = None) -> bytes:
+    return subprocess.run(["git", *args], cwd=cwd, input=input, check=True,
+                          capture_output=True, env={**os.environ, **GIT_IDENTITY}).stdout
+
+
+class RegistryHarness:
+    """A local bare registry repository plus a fake ``gh`` on PATH.
+
+    Example:
+        harness = RegistryHarness(tmp_path, entries=1000)
+        with harness.activate():
+            harness.registry().list_data_products()
+    """
+
+    def __init__(self, root: Path, entries: int = 100, org: str = "test-org", name: str = "registry"):
+        """
+        Create the registry repository and the fake ``gh``.
+
+        Args:
+            root: Scratch directory owned by the harness
+            entries: Number of synthetic data products in the catalog
+            org: Organization directory the repository lives under
+            name: Repository name
+        """
+        self.root = Path(root)
+        self.entries = entries
+        self.repo_path = self.root / "remote" / org / name
+        self.bin_dir = self.root / "bin"
+        self.home = self.root / "home"
+        self.gh_state = self.root / "gh_state.json"
+
+        self._create_repository(org, name)
+        self._install_fake_gh(f"{org}/{name}")
+        self.home.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def url(self) -> str:
+        """Registry URL to hand to ``LocalRegistry``."""
+        return str(self.repo_path)
+
+    def _create_repository(self, org: str, name: str) -> None:
+        """Initialise the bare repository and import the catalog in one commit.
+
+        ``git fast-import`` writes every blob in a single pass, which keeps
+        50k-entry registries quick to build.
+        """
+        self.repo_path.mkdir(parents=True)
+        _git("init", "--bare", "-q", "-b", "main", cwd=self.repo_path)
+
+        chunks = [b"commit refs/heads/main\n",
+                  b"committer Registry Harness <harness@example.com> 1735689600 +0000\n",
+                  b"data 22\nSeed synthetic catalog\n"]
+        for i in range(self.entries):
+            entry = synthetic_entry(i)
+            blob = yaml.dump(entry, default_flow_style=False, sort_keys=False).encode()
+            path = f"catalog/data/{entry['project']['full_name']}.yaml"
+            chunks.append(f"M 100644 inline {path}\ndata {len(blob)}\n".encode())
+            chunks.append(blob)
+            chunks.append(b"\n")
+        readme = b"# Synthetic registry\n"
+        chunks.append(f"M 100644 inline README.md\ndata {len(readme)}\n".encode() + readme + b"\n")
+
+        _git("fast-import", "--quiet", cwd=self.repo_path, input=b"".join(chunks))
+
+    def _install_fake_gh(self, repo: str) -> None:
+        """Write the fake ``gh`` script into the harness bin directory."""
+        self.bin_dir.mkdir(parents=True, exist_ok=True)
+        gh = self.bin_dir / "gh"
+        gh.write_text(FAKE_GH.format(python=sys.executable, repo=repo))
+        gh.chmod(0o755)
+
+    @contextmanager
+    def activate(self) -> Iterator["RegistryHarness"]:
+        """Put the fake ``gh`` on PATH and isolate HOME and git identity."""
+        overrides = {
+            "PATH": f"{self.bin_dir}{os.pathsep}{os.environ.get('PATH', '')}",
+            "HOME": str(self.home),
+            "MINTD_FAKE_GH_STATE": str(self.gh_state),
+            "MINTD_REGISTRY_URL": self.url,
+            **GIT_IDENTITY,
+        }
+        saved = {key: os.environ.get(key) for key in overrides}
+        os.environ.update(overrides)
+        try:
+            yield self
+        finally:
+            for key, value in saved.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
+    def registry(self, **kwargs: Any) -> LocalRegistry:
+        """A ``LocalRegistry`` pointed at the harness repository and cache."""
+        kwargs.setdefault("cache_root", self.root / "cache")
+        return LocalRegistry(self.url, **kwargs)
+
+    def open_prs(self) -> List[Dict[str, Any]]:
+        """Pull requests the fake ``gh`` has recorded as open."""
+        try:
+            with open(self.gh_state) as f:
+                return [pr for pr in json.load(f) if pr["state"] == "OPEN"]
+        except OSError:
+            return []
+
+    def merge(self, pr_number: int) -> None:
+        """Merge an open registration PR's branch into main, as a reviewer would."""
+        with open(self.gh_state) as f:
+            prs = json.load(f)
+        pr = next(pr for pr in prs if pr["number"] == pr_number)
+
+        branch_sha = _git("rev-parse", f"refs/heads/{pr['headRefName']}", cwd=self.repo_path).decode().strip()
+        _git("update-ref", "refs/heads/main", branch_sha, cwd=self.repo_path)
+
+        pr["state"] = "MERGED"
+        with open(self.gh_state, "w") as f:
+            json.dump(prs, f)
+
+    def gh_calls(self) -> List[List[str]]:
+        """Argument lists of every fake ``gh`` invocation so far."""
+        try:
+            with open(f"{self.gh_state}.log") as f:
+                return [json.loads(line) for line in f]
+        except OSError:
+            return []
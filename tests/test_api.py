@@ -99,3 +99,56 @@ def test_create_project_invalid_name():
 
 
 
+
+
+def test_create_project_queues_registration(tmp_path, monkeypatch):
+    """Test a project with valid metadata is queued and handed to a background worker."""
+    import json
+    from unittest.mock import patch
+    from mintd.api import _register_project
+
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    result = create_project(
+        project_type="data",
+        name="queued_api",
+        language="python",
+        path=str(tmp_path),
+        init_git=False,
+        init_dvc=False,
+    )
+    metadata_path = result.path / "metadata.json"
+    metadata = json.loads(metadata_path.read_text())
+    metadata.update(metadata={}, status={"lifecycle": "active"},
+                    access_control={"teams": [{"name": "lab", "permission": "admin"}]})
+    metadata_path.write_text(json.dumps(metadata))
+
+    with patch("mintd.registry.start_registration_worker") as start_worker:
+        assert _register_project(result.path) is True
+
+    from mintd.registry import get_pending_registrations
+    start_worker.assert_called_once()
+    assert [job["full_name"] for job in get_pending_registrations()] == ["data_queued_api"]
+
+
+def test_create_project_skips_registration_of_invalid_metadata(tmp_path, monkeypatch, capsys):
+    """Test metadata.json is validated before a registration is queued."""
+    from unittest.mock import patch
+
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    with patch("mintd.registry.start_registration_worker") as start_worker:
+        result = create_project(
+            project_type="data",
+            name="invalid_api",
+            language="python",
+            path=str(tmp_path),
+            init_git=False,
+            init_dvc=False,
+            register_project=True,
+        )
+
+    from mintd.registry import get_pending_registrations
+    assert result.registration_queued is False
+    assert result.registration_url is None
+    assert "Could not queue registration: Missing required field" in capsys.readouterr().out
+    start_worker.assert_not_called()
+    assert get_pending_registrations() == []
@@ -0,0 +1,51 @@
+"""Tests for the catalog search index."""
+
+from mintd.catalog_index import build_catalog_index, search_catalog_index, suggest_names, trigrams
+
+
+def _index():
+    return build_catalog_index([
+        {"name": "data_cms-provider-data-service", "description": "CMS provider directory",
+         "tags": ["medicare"]},
+        {"name": "data_hospital-claims", "description": "Inpatient claims by quarter", "tags": []},
+        {"name": "data_census-tracts", "description": "Tract shapes", "tags": ["geography"]},
+    ])
+
+
+def test_trigrams_pad_short_words():
+    """Test words are padded so prefixes produce trigrams."""
+    assert "  a" in trigrams("ab")
+    assert trigrams("Foo_Bar") == trigrams("foo bar")
+
+
+def test_search_ranks_names_first():
+    """Test a name match outranks a description match."""
+    results = search_catalog_index(_index(), "claims")
+    assert results[0]["name"] == "data_hospital-claims"
+    assert results[0]["score"] > 0
+
+
+def test_search_matches_tags_and_descriptions():
+    """Test tags and descriptions are searched."""
+    assert search_catalog_index(_index(), "medicare")[0]["name"] == "data_cms-provider-data-service"
+    assert search_catalog_index(_index(), "geography")[0]["name"] == "data_census-tracts"
+
+
+def test_search_empty_query():
+    """Test an empty query returns nothing."""
+    assert search_catalog_index(_index(), "  ") == []
+
+
+def test_suggest_names_ignores_type_prefix():
+    """Test suggestions rank misspellings and ignore the shared data_ prefix."""
+    index = _index()
+    assert suggest_names(index, "data_hosptal-claims")[0] == "data_hospital-claims"
+    assert suggest_names(index, "data_zzz") == []
+
+
+def test_suggest_names_ignores_project_prefix():
+    """Test the prj_ prefix mintd gives projects is not matched on."""
+    index = build_catalog_index([{"name": "prj_claims-model", "description": "", "tags": []},
+                                 {"name": "prj_jobs", "description": "", "tags": []}])
+    assert suggest_names(index, "prj_claim-model") == ["prj_claims-model"]
+    assert suggest_names(index, "prj_zzz") == []
@@ -0,0 +1,66 @@
+"""Tests for catalog schema validation."""
+
+import yaml
+
+from mintd.catalog_schema import compile_schema, validate_catalog_blobs, validate_catalog_entry
+
+
+def _entry(**overrides):
+    entry = {
+        "project": {"name": "x", "type": "data", "full_name": "data_x"},
+        "metadata": {"description": "d", "tags": ["a"]},
+        "ownership": {"team": "lab"},
+        "access_control": {"teams": [{"name": "admins", "permission": "admin"}]},
+        "status": {"state": "active"},
+    }
+    entry.update(overrides)
+    return entry
+
+
+def test_valid_entry():
+    """Test a complete entry has no errors."""
+    assert validate_catalog_entry(_entry()) == []
+
+
+def test_created_projects_validate():
+    """Test entries named as ``mintd create`` names each project type are valid."""
+    from .registry_harness import synthetic_metadata
+
+    for project_type in ("data", "project", "infra"):
+        assert validate_catalog_entry(synthetic_metadata("foo", project_type)) == []
+    assert validate_catalog_entry(_entry(project={"name": "foo", "type": "project", "full_name": "prj_foo"})) == []
+
+
+def test_errors_carry_paths():
+    """Test errors name the offending field."""
+    errors = validate_catalog_entry(_entry(project={"name": "x", "type": "dataset", "full_name": "x"}))
+    assert any(error.startswith("$.project.type:") for error in errors)
+    assert any(error.startswith("$.project.full_name:") for error in errors)
+
+
+def test_missing_fields_and_admin_team():
+    """Test required fields and the admin team rule."""
+    entry = _entry(access_control={"teams": [{"name": "readers", "permission": "read"}]})
+    del entry["status"]
+    errors = validate_catalog_entry(entry)
+    assert "$: missing required field 'status'" in errors
+    assert any("$.access_control.teams: no item matches" in error for error in errors)
+
+
+def test_compile_schema_type_checks():
+    """Test booleans are not accepted as integers."""
+    validate = compile_schema({"type": "integer"})
+    assert validate(3) == []
+    assert validate(True) == ["$: expected integer, got boolean"]
+
+
+def test_validate_blobs_with_pool():
+    """Test blob validation gives the same answers across a process pool."""
+    good = yaml.safe_dump(_entry()).encode()
+    bad = b"project: [unclosed"
+    blobs = [(f"{i:040x}", good if i % 2 else bad) for i in range(300)]
+
+    results = validate_catalog_blobs(blobs, max_workers=2)
+
+    assert results[f"{1:040x}"] == {"errors": [], "type": "data"}
+    assert "invalid YAML" in results[f"{0:040x}"]["errors"][0]
@@ -34,4 +34,70 @@ def test_create_infra_help():
     runner = CliRunner()
     result = runner.invoke(main, ["create", "infra", "--help"])
     assert result.exit_code == 0
-    assert "infra_{name}" in result.output
\ No newline at end of file
+    assert "infra_{name}" in result.output
+
+def test_registry_status_requires_names():
+    """Test registry status without names or --all-local aborts."""
+    runner = CliRunner()
+    result = runner.invoke(main, ["registry", "status"])
+    assert result.exit_code != 0
+    assert "--all-local" in result.output
+
+
+def test_registry_status_all_local(tmp_path):
+    """Test --all-local checks every discovered project in one batch."""
+    import json
+    from unittest.mock import patch
+
+    for name in ["alpha", "beta"]:
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "metadata.json").write_text(json.dumps({"project": {"name": name, "type": "data"}}))
+
+    statuses = {
+        "alpha": {"registered": True, "type": "data", "full_name": "data_alpha", "url": "u"},
+        "beta": {"registered": False, "status": "not_found"},
+    }
+    runner = CliRunner()
+    with patch("mintd.registry.get_registry_client") as mock_client:
+        mock_client.return_value.check_registration_statuses.return_value = statuses
+        result = runner.invoke(main, ["registry", "status", "--all-local", "--root", str(tmp_path)])
+
+    assert result.exit_code == 0
+    mock_client.return_value.check_registration_statuses.assert_called_once_with(["alpha", "beta"])
+    assert "1 registered" in result.output
+    assert "1 not registered" in result.output
+
+
+def test_registry_changes_output():
+    """Test registry changes prints each change and the next --since SHA."""
+    from unittest.mock import patch
+
+    delta = {"from": "a" * 40, "to": "b" * 40,
+             "added": [{"path": "catalog/data/data_x.yaml", "name": "data_x", "type": "data"}],
+             "modified": [], "removed": []}
+    runner = CliRunner()
+    with patch("mintd.registry.get_registry_client") as mock_client:
+        mock_client.return_value.catalog_changes.return_value = delta
+        result = runner.invoke(main, ["registry", "changes", "--since", "a" * 40])
+
+    assert result.exit_code == 0
+    assert "+ data" in result.output
+    assert "--since " + "b" * 40 in result.output
+
+
+def test_registry_impact_output():
+    """Test registry impact groups dependents by depth and counts projects."""
+    from unittest.mock import patch
+
+    report = {"product": "data_raw", "projects": ["prj_report"],
+              "dependents": [{"name": "data_derived", "depth": 1, "via": "data_raw"},
+                             {"name": "prj_report", "depth": 2, "via": "data_derived"}]}
+    runner = CliRunner()
+    with patch("mintd.registry.get_registry_client") as mock_client:
+        mock_client.return_value.impact.return_value = report
+        result = runner.invoke(main, ["registry", "impact", "data_raw"])
+
+    assert result.exit_code == 0
+    assert "direct (1)" in result.output
+    assert "2 hops (1)" in result.output
+    assert "1 project(s) to rerun" in result.output
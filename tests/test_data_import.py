@@ -2,6 +2,7 @@
 
 import pytest
 import json
+import shutil
 import subprocess
 import tempfile
 from pathlib import Path
@@ -13,9 +14,13 @@ from mintd.data_import import (
     RegistryError, DVCImportError, MetadataUpdateError,
     query_data_product, validate_project_directory,
     run_dvc_import, update_project_metadata,
-    import_data_product, pull_data_product, list_data_products
+    import_data_product, pull_data_product, list_data_products,
+    search_data_products, ImportSpec, import_data_products,
+    parse_import_requirements
 )
 
+from .dvc_repos import make_source_repo
+
 
 @pytest.fixture
 def temp_dir():
@@ -24,6 +29,12 @@ def temp_dir():
         yield Path(tmpdir)
 
 
+@pytest.fixture
+def dvc_cli_backend(monkeypatch):
+    """Route DVC operations through the dvc executable so subprocess.run can be mocked."""
+    monkeypatch.setenv("MINTD_DVC_BACKEND", "cli")
+
+
 @pytest.fixture
 def mock_project_dir(temp_dir):
     """Create a mock project directory with metadata.json."""
@@ -217,6 +228,7 @@ class TestProjectValidation:
 # DVC Import Tests
 # =============================================================================
 
+@pytest.mark.usefixtures("dvc_cli_backend")
 class TestDVCImport:
 
     @patch('subprocess.run')
@@ -233,6 +245,23 @@ class TestDVCImport:
 
         assert result == "data/import.dvc"
         mock_run.assert_called_once()
+        cmd = mock_run.call_args[0][0]
+        assert cmd[-2:] == ["-o", "data/import"]
+
+    @patch('subprocess.run')
+    def test_run_dvc_import_no_download(self, mock_run, temp_dir):
+        """Test import that only writes the .dvc file."""
+        mock_run.return_value = Mock(returncode=0, stdout="")
+
+        run_dvc_import(
+            project_path=temp_dir,
+            repo_url="https://github.com/test/repo",
+            source_path="data/final/",
+            dest_path="data/import/",
+            download=False
+        )
+
+        assert "--no-download" in mock_run.call_args[0][0]
 
     @patch('subprocess.run')
     def test_run_dvc_import_failure(self, mock_run, temp_dir):
@@ -350,6 +379,210 @@ class TestImportDataProduct:
         assert "Registry not found" in result.error_message
 
 
+@pytest.mark.usefixtures("dvc_cli_backend")
+class TestImportDataProducts:
+
+    def test_parse_import_requirements(self, temp_dir):
+        """Test reading a requirements file."""
+        requirements = temp_dir / "data-requirements.txt"
+        requirements.write_text(
+            "# Inputs for the analysis\n"
+            "data_a\n"
+            "\n"
+            "data_b@v2.1 --stage clean  # pinned\n"
+            "data_c --source-path data/final/c.csv --dest data/raw/c.csv\n"
+            "data_d --include 'year=2023/*' --include year=2024 --exclude '*.log'\n"
+        )
+
+        specs = parse_import_requirements(requirements)
+
+        assert specs == [
+            ImportSpec("data_a"),
+            ImportSpec("data_b", stage="clean", rev="v2.1"),
+            ImportSpec("data_c", path="data/final/c.csv", dest="data/raw/c.csv"),
+            ImportSpec("data_d", include=["year=2023/*", "year=2024"], exclude=["*.log"]),
+        ]
+
+    def test_parse_import_requirements_rejects_bad_line(self, temp_dir):
+        """Test unknown options are reported with their line number."""
+        requirements = temp_dir / "data-requirements.txt"
+        requirements.write_text("data_a\ndata_b --bogus x\n")
+
+        with pytest.raises(DataImportError, match=":2:"):
+            parse_import_requirements(requirements)
+
+    @patch('mintd.data_import.get_registry_client')
+    @patch('subprocess.run')
+    def test_import_many_products(self, mock_run, mock_client, mock_project_dir, mock_data_product):
+        """Test products are looked up once each and imported in order with parallel transfers."""
+        mock_client.return_value.query_data_product.side_effect = (
+            lambda name: dict(mock_data_product, repository={"github_url": f"https://github.com/test/{name}"})
+        )
+        mock_run.return_value = Mock(returncode=0, stdout="")
+        names = [f"data_product-{i}" for i in range(6)]
+
+        results = import_data_products([ImportSpec(name) for name in names], mock_project_dir,
+                                       max_workers=3, jobs=8)
+
+        assert [r.product_name for r in results] == names
+        assert all(r.success for r in results)
+        mock_client.assert_called_once()
+
+        commands = [c[0][0] for c in mock_run.call_args_list]
+        imports = [cmd for cmd in commands if cmd[1] == "import"]
+        assert [cmd[cmd.index("-o") + 1] for cmd in imports] == [f"data/imports/product-{i}" for i in range(6)]
+        assert all(cmd[-2:] == ["--jobs", "8"] and "--no-download" not in cmd for cmd in imports)
+        assert not [cmd for cmd in commands if cmd[1] == "pull"]
+
+        with open(mock_project_dir / "metadata.json") as f:
+            dependencies = json.load(f)["metadata"]["data_dependencies"]
+        assert [d["source"] for d in dependencies] == names
+        assert dependencies[2]["source_url"] == "https://github.com/test/data_product-2"
+        assert dependencies[2]["stage"] == "final"
+
+    @patch('mintd.data_import.get_registry_client')
+    @patch('subprocess.run')
+    def test_import_many_products_partial_failure(self, mock_run, mock_client, mock_project_dir,
+                                                  mock_data_product):
+        """Test a failed lookup or download only fails that product."""
+        def query(name):
+            if name == "data_missing":
+                raise Exception("not found")
+            return mock_data_product
+        mock_client.return_value.query_data_product.side_effect = query
+
+        def run(cmd, **kwargs):
+            if cmd[1] == "import" and "data/imports/broken" in cmd:
+                raise subprocess.CalledProcessError(1, cmd, stderr="missing cache")
+            return Mock(returncode=0, stdout="")
+        mock_run.side_effect = run
+
+        results = import_data_products(
+            [ImportSpec("data_ok"), ImportSpec("data_missing"), ImportSpec("data_broken")], mock_project_dir
+        )
+
+        assert [r.success for r in results] == [True, False, False]
+        assert "not found" in results[1].error_message
+        assert "missing cache" in results[2].error_message
+
+        with open(mock_project_dir / "metadata.json") as f:
+            dependencies = json.load(f)["metadata"]["data_dependencies"]
+        assert [d["source"] for d in dependencies] == ["data_ok"]
+
+    @staticmethod
+    def _fake_dvc(project_dir, fail_import=()):
+        """subprocess.run stand-in that writes .dvc files and fails the download of some products."""
+        calls = []
+
+        def run(cmd, **kwargs):
+            calls.append(cmd)
+            if cmd[1] == "import":
+                dest = cmd[cmd.index("-o") + 1]
+                (project_dir / f"{dest}.dvc").write_text("outs: []\n")
+                if any(name in dest for name in fail_import):
+                    raise subprocess.CalledProcessError(1, cmd, stderr="connection reset")
+            return Mock(returncode=0, stdout="")
+        return run, calls
+
+    @patch('mintd.data_import.get_registry_client')
+    @patch('subprocess.run')
+    def test_resume_skips_completed_products(self, mock_run, mock_client, mock_project_dir,
+                                             mock_data_product):
+        """Test a failed product is rolled back and --resume only retries it."""
+        mock_client.return_value.query_data_product.return_value = mock_data_product
+        specs = [ImportSpec("data_a"), ImportSpec("data_b"), ImportSpec("data_c")]
+        state_file = mock_project_dir / ".mintd" / "import_state.json"
+
+        mock_run.side_effect, calls = self._fake_dvc(mock_project_dir, fail_import=["imports/b"])
+        results = import_data_products(specs, mock_project_dir)
+
+        assert [r.success for r in results] == [True, False, True]
+        assert not (mock_project_dir / "data/imports/b.dvc").exists()
+        assert (mock_project_dir / "data/imports/a.dvc").exists()
+        with open(state_file) as f:
+            assert [r["product_name"] for r in json.load(f)["completed"]] == ["data_a", "data_c"]
+
+        mock_run.side_effect, calls = self._fake_dvc(mock_project_dir)
+        results = import_data_products(specs, mock_project_dir, resume=True)
+
+        assert all(r.success for r in results)
+        assert [cmd[cmd.index("-o") + 1] for cmd in calls if cmd[1] == "import"] == ["data/imports/b"]
+        assert not state_file.exists()
+
+    @patch('mintd.data_import.get_registry_client')
+    @patch('subprocess.run')
+    def test_checkpoint_follows_metadata_write(self, mock_run, mock_client, mock_project_dir,
+                                               mock_data_product):
+        """Test each product's dependency is in metadata.json before it is checkpointed."""
+        mock_client.return_value.query_data_product.return_value = mock_data_product
+        mock_run.side_effect, _ = self._fake_dvc(mock_project_dir)
+        recorded = []
+
+        def save_state(transaction):
+            with open(mock_project_dir / "metadata.json") as f:
+                dependencies = json.load(f)["metadata"].get("data_dependencies", [])
+            recorded.append(([d["source"] for d in dependencies],
+                             [r["product_name"] for r in transaction.completed]))
+
+        with patch.object(ImportTransaction, "save_state", save_state):
+            import_data_products([ImportSpec("data_a"), ImportSpec("data_b")], mock_project_dir)
+
+        assert recorded == [(["data_a"], ["data_a"]), (["data_a", "data_b"], ["data_a", "data_b"])]
+
+    @patch('mintd.data_import.get_registry_client')
+    @patch('subprocess.run')
+    def test_interrupted_import_rolls_back(self, mock_run, mock_client, mock_project_dir, mock_data_product):
+        """Test an interruption keeps finished products and removes the partial ones."""
+        mock_client.return_value.query_data_product.return_value = mock_data_product
+        fake, _ = self._fake_dvc(mock_project_dir)
+
+        def run(cmd, **kwargs):
+            result = fake(cmd, **kwargs)
+            if cmd[1] == "import" and "data/imports/p9" in cmd:
+                raise KeyboardInterrupt
+            return result
+        mock_run.side_effect = run
+        specs = [ImportSpec(f"data_p{i}") for i in range(10)]
+
+        with pytest.raises(KeyboardInterrupt):
+            import_data_products(specs, mock_project_dir)
+
+        imports = mock_project_dir / "data" / "imports"
+        assert sorted(p.name for p in imports.glob("*.dvc")) == [f"p{i}.dvc" for i in range(9)]
+        with open(mock_project_dir / ".mintd" / "import_state.json") as f:
+            assert len(json.load(f)["completed"]) == 9
+
+    @patch('mintd.data_import.import_data_products')
+    def test_cli_import_requirements(self, mock_import, mock_project_dir):
+        """Test the CLI combines named products with a requirements file."""
+        from mintd.cli import main
+        requirements = mock_project_dir / "data-requirements.txt"
+        requirements.write_text("data_b\ndata_c@v1\n")
+        mock_import.return_value = [ImportResult("data_a", True), ImportResult("data_b", True),
+                                    ImportResult("data_c", True)]
+
+        runner = CliRunner()
+        result = runner.invoke(main, ["data", "import", "data_a", "-r", str(requirements),
+                                      "-p", str(mock_project_dir), "-j", "4"])
+
+        assert result.exit_code == 0, result.output
+        specs = mock_import.call_args[0][0]
+        assert [s.product_name for s in specs] == ["data_a", "data_b", "data_c"]
+        assert specs[2].rev == "v1"
+        assert mock_import.call_args[1]["jobs"] == 4
+        assert "Imported 3 of 3" in result.output
+
+    def test_cli_import_dest_needs_single_product(self, mock_project_dir):
+        """Test --dest is refused for several products."""
+        from mintd.cli import main
+        runner = CliRunner()
+        result = runner.invoke(main, ["data", "import", "data_a", "data_b", "--dest", "data/x",
+                                      "-p", str(mock_project_dir)])
+
+        assert result.exit_code != 0
+        assert "--dest can only be used" in result.output
+
+
 # =============================================================================
 # Pull Data Product Tests
 # =============================================================================
@@ -357,21 +590,26 @@ class TestImportDataProduct:
 class TestPullDataProduct:
 
     @patch('mintd.data_import.query_data_product')
-    @patch('tempfile.mkdtemp')
+    @patch('mintd.data_import.DVCAdapter')
     @patch('git.Repo.clone_from')
-    @patch('shutil.copytree')
     def test_pull_data_product_success(
-        self, mock_copytree, mock_clone, mock_mkdtemp, mock_query,
+        self, mock_clone, mock_adapter, mock_query,
         temp_dir, mock_data_product
     ):
-        """Test successful data product pull."""
+        """Test the stage is fetched from a metadata-only clone and moved into place."""
         mock_query.return_value = mock_data_product
-        mock_mkdtemp.return_value = str(temp_dir / "temp_repo")
 
-        # Create mock repo structure
-        temp_repo_dir = temp_dir / "temp_repo"
-        temp_repo_dir.mkdir()
-        (temp_repo_dir / "data" / "final").mkdir(parents=True)
+        def clone(url, target, **kwargs):
+            (Path(target) / "data").mkdir(parents=True)
+            (Path(target) / "data" / "final.dvc").write_text("outs: []\n")
+            return MagicMock()
+        mock_clone.side_effect = clone
+
+        def pull(targets, jobs=None):
+            final = mock_adapter.call_args[0][0] / "data" / "final"
+            (final / "tables").mkdir(parents=True)
+            (final / "tables" / "providers.csv").write_text("id\n1\n")
+        mock_adapter.return_value.pull.side_effect = pull
 
         success = pull_data_product(
             product_name="data_cms-provider-data-service",
@@ -379,6 +617,37 @@ class TestPullDataProduct:
         )
 
         assert success == True
+        assert (temp_dir / "output" / "tables" / "providers.csv").read_text() == "id\n1\n"
+        assert mock_clone.call_args[1]["depth"] == 1
+        assert mock_clone.call_args[1]["filter"] == "blob:none"
+        mock_adapter.return_value.config.assert_called_once_with("cache.type", "reflink,hardlink,copy", level="local")
+        mock_adapter.return_value.pull.assert_called_once_with(["data/final.dvc"], jobs=None)
+        assert [p.name for p in temp_dir.iterdir()] == ["output"]
+
+    @pytest.mark.skipif(shutil.which("dvc") is None, reason="dvc is not installed")
+    @patch('mintd.data_import.query_data_product')
+    def test_pull_data_product_fetches_dvc_data(self, mock_query, temp_dir, mock_data_product):
+        """Test a real stage and a single file are pulled from DVC storage."""
+        source = make_source_repo(temp_dir, {"a.csv": "a\n", "sub/b.csv": "b\n"})
+        mock_query.return_value = dict(
+            mock_data_product,
+            repository={"github_url": f"file://{source}"},
+            storage={"dvc": {"remote_name": "store", "remote_url": str(temp_dir / "remote")}},
+        )
+
+        assert pull_data_product("data_source", destination=str(temp_dir / "all"))
+        assert (temp_dir / "all" / "a.csv").read_text() == "a\n"
+        assert (temp_dir / "all" / "sub" / "b.csv").read_text() == "b\n"
+        (temp_dir / "all" / "a.csv").write_text("edited\n")
+
+        assert pull_data_product("data_source", destination=str(temp_dir / "one"), path="data/final/sub/b.csv")
+        assert [p.name for p in (temp_dir / "one").iterdir()] == ["b.csv"]
+
+        assert pull_data_product("data_source", destination=str(temp_dir / "some"),
+                                 include=["sub/*", "a.csv"], exclude=["a.*"])
+        assert [str(p.relative_to(temp_dir / "some")) for p in (temp_dir / "some").rglob("*")] == ["sub", "sub/b.csv"]
+
+        assert sorted(p.name for p in temp_dir.iterdir()) == ["all", "one", "remote", "some", "source"]
 
 
 # =============================================================================
@@ -411,14 +680,39 @@ class TestListDataProducts:
     def test_list_available_products(self, mock_get_client):
         """Test listing available products from registry."""
         mock_client = Mock()
-        mock_client.list_data_products.return_value = [
+        mock_client.iter_data_products.return_value = iter([
             {"name": "data_product_1", "description": "Test product"}
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
         # This should not raise an exception
         list_data_products(show_imported=False)
 
+    @patch('mintd.data_import.get_registry_client')
+    def test_search_data_products(self, mock_get_client, capsys):
+        """Test searching products prints ranked matches."""
+        mock_client = Mock()
+        mock_client.search_data_products.return_value = [
+            {"name": "data_hospital-claims", "description": "Claims", "tags": ["medicare"], "score": 1.4}
+        ]
+        mock_get_client.return_value = mock_client
+
+        search_data_products("hospital", limit=3)
+
+        mock_client.search_data_products.assert_called_once_with("hospital", limit=3)
+        assert "data_hospital-claims" in capsys.readouterr().out
+
+    @patch('mintd.data_import.get_registry_client')
+    def test_cli_search_fails_when_registry_unreachable(self, mock_get_client):
+        """Test `mintd data search` exits non-zero when the registry cannot be searched."""
+        from mintd.cli import main
+        mock_get_client.return_value.search_data_products.side_effect = RuntimeError("clone failed")
+
+        result = CliRunner().invoke(main, ["data", "search", "hospital"])
+
+        assert result.exit_code != 0
+        assert "Failed to search the registry: clone failed" in result.output
+
 
 # =============================================================================
 # CLI Tests
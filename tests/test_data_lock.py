@@ -0,0 +1,333 @@
+"""Tests for tracking imported data: data.lock, `mintd data sync`, `outdated` and `prefetch`."""
+
+import json
+import os
+import shutil
+import subprocess
+from unittest.mock import patch
+
+import pytest
+import yaml
+from click.testing import CliRunner
+
+from mintd.data_import import (
+    ImportSpec, find_outdated_dependencies, import_data_products, sync_data_dependencies
+)
+from mintd.dvc_adapter import DVCAdapter, DVCError
+from mintd.data_lock import DATA_LOCK_FILE, is_pinned, load_data_lock, remote_commit, update_data_lock
+from mintd.prefetch import PREFETCH_PID, prefetch_data_dependencies, prefetch_running, start_prefetch
+
+from .dvc_repos import make_source_repo, run
+
+needs_dvc = pytest.mark.skipif(shutil.which("dvc") is None, reason="dvc is not installed")
+
+
+def git_rev(repo, ref="HEAD"):
+    return subprocess.run(["git", "rev-parse", ref], cwd=repo, capture_output=True, text=True,
+                          check=True).stdout.strip()
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A git + DVC mint project with no shared cache configured."""
+    path = tmp_path / "project"
+    path.mkdir()
+    (path / "metadata.json").write_text(json.dumps({
+        "project": {"name": "analysis", "type": "project", "full_name": "prj_analysis"},
+        "metadata": {},
+        "ownership": {"created_by": "test"},
+        "access_control": {"teams": [{"name": "test", "permission": "admin"}]},
+        "status": {"lifecycle": "active"},
+    }))
+    run(["git", "init", "-q"], path)
+    run(["dvc", "init", "-q"], path)
+    with patch("mintd.dvc_cache.get_config", return_value={}):
+        yield path
+
+
+def test_lock_entries_merge_and_sort(tmp_path):
+    """Test entries are replaced by product and local path and kept in path order."""
+    update_data_lock(tmp_path, [
+        {"source": "data_b", "local_path": "data/imports/b/", "source_commit": "1" * 40},
+        {"source": "data_a", "local_path": "data/imports/a/", "source_commit": "2" * 40},
+    ])
+    update_data_lock(tmp_path, [{"source": "data_b", "local_path": "data/imports/b/", "source_commit": "3" * 40}])
+
+    entries = load_data_lock(tmp_path)
+    assert [(e["source"], e["source_commit"]) for e in entries] == [("data_a", "2" * 40), ("data_b", "3" * 40)]
+    assert yaml.safe_load((tmp_path / DATA_LOCK_FILE).read_text())["version"] == 1
+    assert load_data_lock(tmp_path / "missing") == []
+
+
+def test_is_pinned():
+    """Test full and abbreviated commit SHAs count as pinned."""
+    assert is_pinned("a" * 40)
+    assert is_pinned("abc1234")
+    assert not is_pinned("main")
+    assert not is_pinned("abc123")
+    assert not is_pinned(None)
+
+
+def test_remote_commit(tmp_path):
+    """Test HEAD, branches and annotated tags resolve to commits."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    run(["git", "init", "-q", "-b", "main"], repo)
+    run(["git", "commit", "-q", "--allow-empty", "-m", "one"], repo)
+    run(["git", "tag", "-a", "v1", "-m", "v1"], repo)
+    run(["git", "commit", "-q", "--allow-empty", "-m", "two"], repo)
+
+    assert remote_commit(str(repo)) == git_rev(repo)
+    assert remote_commit(str(repo), "main") == git_rev(repo)
+    assert remote_commit(str(repo), "v1") == git_rev(repo, "v1^{commit}")
+    with pytest.raises(RuntimeError, match="not found"):
+        remote_commit(str(repo), "nope")
+
+    # ls-remote also lists refs/heads/release/dev for "dev"
+    run(["git", "branch", "release/dev"], repo)
+    with pytest.raises(RuntimeError, match="'dev' not found"):
+        remote_commit(str(repo), "dev")
+
+
+@needs_dvc
+def test_sync_leaves_abbreviated_pins_alone(project):
+    """Test a product pinned to an abbreviated SHA is up to date without asking its source."""
+    commit = "0123456789abcdef0123456789abcdef01234567"
+    update_data_lock(project, [{"source": "data_a", "local_path": "data/imports/a/", "rev": commit[:7],
+                                 "dvc_file": "data/imports/a.dvc", "source_commit": commit}])
+
+    with patch("mintd.data_import.remote_commit", side_effect=AssertionError("asked the source")):
+        statuses = sync_data_dependencies(project)
+
+    assert [(s["status"], s["upstream_commit"]) for s in statuses] == [("up-to-date", commit)]
+
+
+@pytest.fixture
+def imported(tmp_path, project):
+    """Source repositories for data_a and data_b, both imported into the project."""
+    sources = {name: make_source_repo(tmp_path / name, {"table.csv": f"{name},1\n"}) for name in ("a", "b")}
+    products = {f"data_{name}": {"repository": {"github_url": str(repo)}} for name, repo in sources.items()}
+
+    with patch("mintd.data_import.get_registry_client") as mock_client, \
+            patch("mintd.source_mirror.SOURCE_CACHE_ROOT", tmp_path / "sources"):
+        mock_client.return_value.query_data_product.side_effect = products.__getitem__
+        results = import_data_products([ImportSpec("data_a"), ImportSpec("data_b")], project)
+        assert all(result.success for result in results)
+        yield sources
+
+
+def publish(source, content):
+    """Commit a new version of a source's final stage."""
+    (source / "data" / "final" / "table.csv").write_text(content)
+    run(["dvc", "add", "-q", "data/final"], source)
+    run(["dvc", "push", "-q"], source)
+    run(["git", "commit", "-q", "-am", "new version"], source)
+
+
+@needs_dvc
+def test_sync_updates_only_changed_dependencies(project, imported):
+    """Test import locks the resolved commits and sync updates just what moved upstream."""
+    sources = imported
+    locked = {entry["source"]: entry for entry in load_data_lock(project)}
+    assert locked["data_a"]["source_commit"] == git_rev(sources["a"])
+    assert locked["data_a"]["dvc_hash"].endswith(".dir")
+    assert locked["data_b"]["local_path"] == "data/imports/b/"
+
+    publish(sources["a"], "a,2\n")
+
+    statuses = sync_data_dependencies(project, dry_run=True)
+    assert [s["status"] for s in statuses] == ["outdated", "up-to-date"]
+    assert load_data_lock(project) == list(locked.values())
+
+    with patch.object(DVCAdapter, "update", autospec=True, side_effect=DVCAdapter.update) as spy:
+        statuses = sync_data_dependencies(project)
+    assert [s["status"] for s in statuses] == ["updated", "up-to-date"]
+    assert spy.call_args[0][1] == ["data/imports/a.dvc"]
+    assert (project / "data" / "imports" / "a" / "table.csv").read_text() == "a,2\n"
+
+    relocked = {entry["source"]: entry for entry in load_data_lock(project)}
+    assert relocked["data_a"]["source_commit"] == git_rev(sources["a"])
+    assert relocked["data_a"]["dvc_hash"] != locked["data_a"]["dvc_hash"]
+    assert relocked["data_b"] == locked["data_b"]
+
+    dependencies = json.loads((project / "metadata.json").read_text())["metadata"]["data_dependencies"]
+    assert {d["source"]: d["source_commit"] for d in dependencies} == {
+        "data_a": git_rev(sources["a"]), "data_b": git_rev(sources["b"])
+    }
+
+    assert [s["status"] for s in sync_data_dependencies(project)] == ["up-to-date", "up-to-date"]
+
+
+@needs_dvc
+def test_outdated_reports_commits_behind_and_data_changes(project, imported):
+    """Test stale data and commits that leave the data alone are told apart."""
+    sources = imported
+    publish(sources["a"], "a,2\n")
+    publish(sources["a"], "a,3\n")
+    (sources["b"] / "README.md").write_text("docs only\n")
+    run(["git", "add", "README.md"], sources["b"])
+    run(["git", "commit", "-q", "-m", "docs"], sources["b"])
+
+    reports = {report["source"]: report for report in find_outdated_dependencies(project)}
+
+    assert reports["data_a"]["status"] == "stale"
+    assert reports["data_a"]["commits_behind"] == 2
+    assert reports["data_a"]["data_changed"] is True
+    assert reports["data_a"]["upstream_commit"] == git_rev(sources["a"])
+    assert reports["data_b"]["status"] == "moved"
+    assert reports["data_b"]["commits_behind"] == 1
+    assert reports["data_b"]["data_changed"] is False
+
+    sync_data_dependencies(project)
+    statuses = [report["status"] for report in find_outdated_dependencies(project)]
+    assert statuses == ["up-to-date", "up-to-date"]
+
+
+@needs_dvc
+def test_outdated_flags_unreachable_sources(project, imported):
+    """Test a source that cannot be fetched is reported as unverified, not up to date."""
+    assert {report["status"] for report in find_outdated_dependencies(project)} == {"up-to-date"}
+    imported["b"].rename(imported["b"].with_name("moved"))
+
+    with patch("mintd.source_mirror._mirrors", {}):
+        reports = {report["source"]: report for report in find_outdated_dependencies(project)}
+
+    assert reports["data_a"]["status"] == "up-to-date"
+    assert reports["data_b"]["status"] == "unverified"
+    assert reports["data_b"]["upstream_commit"] == reports["data_b"]["locked_commit"]
+    assert "could not fetch" in reports["data_b"]["error"]
+
+
+def test_sync_command(tmp_path):
+    """Test `mintd data sync` tabulates statuses and fails if any dependency failed."""
+    from mintd.cli import main
+    statuses = [
+        {"source": "data_a", "local_path": "data/imports/a/", "locked_commit": "1" * 40,
+         "upstream_commit": "2" * 40, "status": "updated", "error": None},
+        {"source": "data_b", "local_path": "data/imports/b/", "locked_commit": "3" * 40,
+         "upstream_commit": None, "status": "failed", "error": "repository not found"},
+    ]
+
+    runner = CliRunner()
+    with patch("mintd.data_import.sync_data_dependencies", return_value=statuses) as mock_sync:
+        result = runner.invoke(main, ["data", "sync", "--dry-run", "-p", str(tmp_path)])
+
+    assert result.exit_code != 0
+    assert "updated" in result.output
+    assert "data_b: repository not found" in result.output
+    assert mock_sync.call_args[1]["dry_run"] is True
+
+
+@needs_dvc
+def test_filtered_imports_download_matching_files(tmp_path, project):
+    """Test --include/--exclude imports fetch only matching files, per product, and stay filtered on sync."""
+    files = {"year=2023/t.csv": "{},2023\n", "year=2023/run.log": "log\n", "year=2024/t.csv": "{},2024\n"}
+    sources = {name: make_source_repo(tmp_path / name, {path: text.format(name) for path, text in files.items()})
+               for name in ("a", "b")}
+    products = {f"data_{name}": {"repository": {"github_url": str(repo)}} for name, repo in sources.items()}
+    specs = [ImportSpec(name, include=["year=2023"], exclude=["*.log"]) for name in products]
+
+    with patch("mintd.data_import.get_registry_client") as mock_client:
+        mock_client.return_value.query_data_product.side_effect = products.__getitem__
+        results = import_data_products(specs, project)
+    assert all(result.success for result in results)
+
+    def checked_out(name):
+        root = project / "data" / "imports" / name
+        return {str(p.relative_to(root)): p.read_text() for p in root.rglob("*") if p.is_file()}
+
+    # Both products export data/final; each must get its own data
+    assert checked_out("a") == {"year=2023/t.csv": "a,2023\n"}
+    assert checked_out("b") == {"year=2023/t.csv": "b,2023\n"}
+    locked = {entry["source"]: entry for entry in load_data_lock(project)}
+    assert locked["data_a"]["include"] == ["year=2023"]
+    assert locked["data_a"]["dvc_hash"].endswith(".dir")
+    assert locked["data_a"]["dvc_hash"] != locked["data_b"]["dvc_hash"]
+
+    (sources["a"] / "data" / "final" / "year=2023" / "extra.csv").write_text("new\n")
+    publish(sources["a"], "unused\n")
+    assert [s["status"] for s in sync_data_dependencies(project)] == ["updated", "up-to-date"]
+    assert checked_out("a") == {"year=2023/t.csv": "a,2023\n", "year=2023/extra.csv": "new\n"}
+    dependencies = json.loads((project / "metadata.json").read_text())["metadata"]["data_dependencies"]
+    assert all(d["exclude"] == ["*.log"] for d in dependencies)
+
+
+@pytest.fixture
+def filtered(tmp_path, project):
+    """A product imported with --include, so its .dvc file carries the recorded source hash."""
+    source = make_source_repo(tmp_path / "a", {"year=2023/t.csv": "a,2023\n", "year=2024/t.csv": "a,2024\n"})
+    with patch("mintd.data_import.get_registry_client") as mock_client:
+        mock_client.return_value.query_data_product.return_value = {"repository": {"github_url": str(source)}}
+        results = import_data_products([ImportSpec("data_a", include=["year=2023"])], project)
+    assert results[0].success
+    return source
+
+
+@needs_dvc
+def test_recorded_source_hash_is_valid_dvc(project, filtered):
+    """Test dvc itself still reads and updates a .dvc file carrying the recorded source hash."""
+    dvc_file = "data/imports/a.dvc"
+    assert yaml.safe_load((project / dvc_file).read_text())["deps"][0]["md5"].endswith(".dir")
+
+    status = subprocess.run(["dvc", "status", dvc_file], cwd=project, capture_output=True, text=True)
+    assert status.returncode == 0, status.stderr
+
+    publish(filtered, "unused\n")
+    run(["dvc", "update", "-q", "--no-download", dvc_file], project)
+    assert yaml.safe_load((project / dvc_file).read_text())["deps"][0]["repo"]["rev_lock"] == git_rev(filtered)
+
+
+@needs_dvc
+def test_failed_filtered_sync_keeps_checkout(project, filtered):
+    """Test a filtered sync whose download fails leaves the data and .dvc file as they were."""
+    imports = project / "data" / "imports"
+    stage = (imports / "a.dvc").read_text()
+    (filtered / "data" / "final" / "year=2023" / "t.csv").write_text("a,2023 revised\n")
+    publish(filtered, "unused\n")
+
+    with patch.object(DVCAdapter, "pull", side_effect=DVCError("remote unreachable")):
+        statuses = sync_data_dependencies(project)
+
+    assert [(s["status"], s["error"]) for s in statuses] == [("failed", "remote unreachable")]
+    assert (imports / "a" / "year=2023" / "t.csv").read_text() == "a,2023\n"
+    assert (imports / "a.dvc").read_text() == stage
+    assert sorted(p.name for p in imports.iterdir()) == [".gitignore", "a", "a.dvc"]
+
+
+@needs_dvc
+def test_prefetch_fills_cache_for_fresh_checkout(tmp_path, project, imported):
+    """Test prefetch downloads every dependency so checkout needs no remote."""
+    for name in ("a", "b"):
+        shutil.rmtree(project / "data" / "imports" / name)
+    shutil.rmtree(project / ".dvc" / "cache")
+
+    reports = prefetch_data_dependencies(project, jobs=2)
+
+    assert [(r["source"], r["status"]) for r in reports] == [("data_a", "fetched"), ("data_b", "fetched")]
+    assert all(r["objects"] for r in reports)
+    assert not (project / "data" / "imports" / "a").exists()
+
+    for name in ("a", "b"):
+        shutil.rmtree(tmp_path / name / "remote")
+    run(["dvc", "checkout", "-q"], project)
+    assert (project / "data" / "imports" / "a" / "table.csv").read_text() == "a,1\n"
+
+
+@needs_dvc
+def test_start_prefetch_runs_detached_once(project):
+    """Test the background prefetch is started in its own session and not twice at once."""
+    with patch("mintd.prefetch.subprocess.Popen") as mock_popen:
+        mock_popen.return_value.pid = os.getpid()
+        pid, log_path = start_prefetch(project, jobs=4)
+
+    cmd = mock_popen.call_args[0][0]
+    assert cmd[-6:] == ["prefetch", "--foreground", "-p", str(project.resolve()), "--jobs", "4"]
+    assert mock_popen.call_args[1]["start_new_session"] is True
+    assert log_path == project.resolve() / ".mintd" / "prefetch.log"
+    assert prefetch_running(project) == os.getpid()
+
+    with pytest.raises(Exception, match="already running"):
+        start_prefetch(project)
+
+    (project / PREFETCH_PID).write_text("999999999\n")
+    assert prefetch_running(project) is None
@@ -0,0 +1,45 @@
+"""Tests for the catalog data-dependency graph."""
+
+from mintd.dependency_graph import build_dependency_graph, extract_dependencies, walk
+
+
+def _graph():
+    return build_dependency_graph({
+        "data_derived": ["data_raw"],
+        "prj_model": ["data_derived", "data_raw"],
+        "prj_report": ["prj_model"],
+        "data_raw": [],
+    })
+
+
+def test_extract_dependencies():
+    """Test sources are read from dict and string records, de-duplicated and sorted."""
+    entry = {"metadata": {"data_dependencies": [{"source": "data_b"}, "data_a", {"source": "data_b"}, {}]}}
+    assert extract_dependencies(entry) == ["data_a", "data_b"]
+    assert extract_dependencies({"metadata": {}}) == []
+    assert extract_dependencies({}) == []
+
+
+def test_build_dependency_graph():
+    """Test reverse adjacency is built and empty forward lists are dropped."""
+    graph = _graph()
+    assert "data_raw" not in graph["forward"]
+    assert graph["reverse"]["data_raw"] == ["data_derived", "prj_model"]
+    assert graph["reverse"]["prj_model"] == ["prj_report"]
+
+
+def test_walk_depth_and_via():
+    """Test the walk visits each node once at its shortest depth."""
+    reached = walk(_graph()["reverse"], "data_raw")
+    assert reached == [
+        {"name": "data_derived", "depth": 1, "via": "data_raw"},
+        {"name": "prj_model", "depth": 1, "via": "data_raw"},
+        {"name": "prj_report", "depth": 2, "via": "prj_model"},
+    ]
+    assert [r["name"] for r in walk(_graph()["reverse"], "data_raw", max_depth=1)] == ["data_derived", "prj_model"]
+
+
+def test_walk_handles_cycles():
+    """Test a dependency cycle terminates."""
+    graph = build_dependency_graph({"a": ["b"], "b": ["a"]})
+    assert walk(graph["reverse"], "a") == [{"name": "b", "depth": 1, "via": "a"}]
@@ -0,0 +1,142 @@
+"""Tests for the shared DVC adapter."""
+
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mintd.dvc_adapter import DVCAdapter, DVCError, _api_incompatibility, get_dvc_adapter, match_paths
+from .dvc_repos import make_source_repo, run
+
+pytestmark = pytest.mark.skipif(shutil.which("dvc") is None, reason="dvc is not installed")
+
+
+@pytest.fixture
+def source_repo(tmp_path):
+    """A git + DVC repository whose data/final is pushed to a local remote."""
+    return make_source_repo(tmp_path, {"table.csv": "id,value\n1,2\n"})
+
+
+@pytest.fixture
+def project(tmp_path):
+    """An empty git repository to import into."""
+    path = tmp_path / "project"
+    (path / "data" / "imports").mkdir(parents=True)
+    run(["git", "init", "-q"], path)
+    return path
+
+
+def test_operations_run_in_process(project, source_repo, tmp_path):
+    """Test init, remote config, import and pull go through the Python API."""
+    dvc = DVCAdapter(project, backend="api")
+
+    with patch("mintd.dvc_adapter.subprocess.run", side_effect=AssertionError("spawned dvc")):
+        dvc.init()
+        dvc.remote_add("Lab", str(tmp_path / "project-remote"), default=True)
+        dvc.remote_modify("lab", "version_aware", "true")
+        dvc.imp(str(source_repo), "data/final", "data/imports/source", no_download=True)
+        assert (project / "data" / "imports" / "source.dvc").exists()
+        assert not (project / "data" / "imports" / "source").exists()
+        dvc.pull(["data/imports/source.dvc"], jobs=2)
+
+    assert (project / "data" / "imports" / "source" / "table.csv").read_text() == "id,value\n1,2\n"
+    config = (project / ".dvc" / "config").read_text()
+    assert "remote = lab" in config
+    assert "version_aware = true" in config
+
+    assert [t["operation"] for t in dvc.timings] == [
+        "init", "remote add", "remote modify", "import", "pull"
+    ]
+    assert all(t["backend"] == "api" for t in dvc.timings)
+    assert dvc.timing_summary(since=3) == {
+        "import": {"calls": 1, "seconds": dvc.timings[3]["seconds"]},
+        "pull": {"calls": 1, "seconds": dvc.timings[4]["seconds"]},
+    }
+
+
+def test_cli_backend(project):
+    """Test the dvc executable is used when the CLI backend is selected."""
+    dvc = DVCAdapter(project, backend="cli")
+    dvc.init()
+    dvc.remote_add("lab", "s3://bucket/lab/")
+
+    assert (project / ".dvc").is_dir()
+    assert "s3://bucket/lab/" in (project / ".dvc" / "config").read_text()
+    assert all(t["backend"] == "cli" for t in dvc.timings)
+
+
+def test_errors_are_reported(project):
+    """Test DVC failures surface as DVCError."""
+    dvc = DVCAdapter(project, backend="api")
+    dvc.init()
+    dvc.remote_add("lab", "s3://bucket/lab/")
+
+    with pytest.raises(DVCError, match="already exists"):
+        dvc.remote_add("lab", "s3://bucket/other/")
+    dvc.remote_add("lab", "s3://bucket/other/", force=True)
+
+    with pytest.raises(DVCError):
+        dvc.pull(["data/imports/missing.dvc"])
+
+
+def test_falls_back_to_cli_when_api_is_incompatible(project, caplog):
+    """Test a DVC whose Repo lacks an argument mintd passes is driven through the CLI."""
+    def imp_url(self, url, out=None, no_download=False):
+        pass
+
+    _api_incompatibility.cache_clear()
+    try:
+        with patch("dvc.repo.Repo.imp_url", imp_url):
+            dvc = DVCAdapter(project)
+    finally:
+        _api_incompatibility.cache_clear()
+
+    assert dvc.backend == "cli"
+    assert "imp_url() takes no jobs" in caplog.text
+
+
+def test_api_errors_are_not_retried_on_cli(project):
+    """Test an error raised inside the API is reported, not re-run through the CLI."""
+    dvc = DVCAdapter(project, backend="api")
+    dvc.init()
+
+    with patch("dvc.repo.Repo.pull", side_effect=TypeError("'NoneType' object is not iterable")), \
+            patch("mintd.dvc_adapter.subprocess.run") as mock_run:
+        with pytest.raises(DVCError, match="not iterable"):
+            dvc.pull(["data/imports/source.dvc"], jobs=4)
+
+    mock_run.assert_not_called()
+    assert dvc.backend == "api"
+
+
+def test_one_adapter_per_project(project, monkeypatch):
+    """Test the adapter, and so its Repo, is shared per project directory."""
+    monkeypatch.chdir(project.parent)
+
+    assert get_dvc_adapter(project) is get_dvc_adapter(Path("project"))
+    assert get_dvc_adapter(project) is not get_dvc_adapter(project.parent)
+
+
+def test_match_paths():
+    """Test globs match a path or any of its parent directories."""
+    paths = ["year=2023/a.csv", "year=2023/logs/run.log", "year=2024/b.csv", "README.md"]
+
+    assert match_paths(paths, ["year=2023/*"]) == ["year=2023/a.csv", "year=2023/logs/run.log"]
+    assert match_paths(paths, ["year=2023"], ["*.log"]) == ["year=2023/a.csv"]
+    assert match_paths(paths, ["year=*/"], ["year=2023/logs"]) == ["year=2023/a.csv", "year=2024/b.csv"]
+    assert match_paths(paths, exclude=["year=*"]) == ["README.md"]
+    assert match_paths(paths) == paths
+
+
+@pytest.mark.parametrize("backend", ["api", "cli"])
+def test_glob_lists_dir_manifest(tmp_path, project, backend):
+    """Test a tracked directory is listed from its manifest, fetched from the remote."""
+    source = make_source_repo(tmp_path, {"year=2023/a.csv": "a\n", "year=2024/b.csv": "b\n"})
+    shutil.rmtree(source / ".dvc" / "cache")
+    dvc = DVCAdapter(project, backend=backend)
+
+    assert dvc.glob(str(source), "data/final", ["year=2023/*"]) == ["year=2023/a.csv"]
+    assert [entry["path"] for entry in dvc.ls(str(source), "data")] == ["final"]
+    with pytest.raises(DVCError, match="No files under data/final match"):
+        dvc.glob(str(source), "data/final", ["year=2022"])
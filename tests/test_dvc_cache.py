@@ -0,0 +1,95 @@
+"""Tests for the lab-wide shared DVC cache."""
+
+import json
+import shutil
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from mintd.dvc_adapter import DVCAdapter
+from mintd.dvc_cache import (
+    cache_report, configure_shared_cache, format_size, get_shared_cache_settings
+)
+
+from .dvc_repos import make_source_repo, run
+
+
+@pytest.fixture
+def shared_cache(tmp_path):
+    """Configure a shared cache and an isolated project record."""
+    config = {"dvc_cache": {"dir": str(tmp_path / "shared-cache"), "shared": "group",
+                            "type": "reflink,hardlink,symlink"}}
+    with patch("mintd.dvc_cache.get_config", return_value=config), \
+            patch("mintd.dvc_cache.PROJECTS_FILE", tmp_path / "projects.json"):
+        yield tmp_path / "shared-cache"
+
+
+def test_settings_absent_without_dir():
+    """Test no shared cache is used unless a directory is configured."""
+    assert get_shared_cache_settings({}) is None
+    assert get_shared_cache_settings({"dvc_cache": {"dir": ""}}) is None
+    settings = get_shared_cache_settings({"dvc_cache": {"dir": "/srv/cache"}})
+    assert settings == {"dir": "/srv/cache", "shared": "group", "type": "reflink,hardlink,symlink"}
+
+
+def test_configure_without_shared_cache_is_a_no_op(tmp_path):
+    """Test projects keep their own cache when none is configured."""
+    dvc = DVCAdapter(tmp_path, backend="cli")
+    with patch("mintd.dvc_cache.get_config", return_value={}), \
+            patch.object(DVCAdapter, "config") as mock_config:
+        assert not configure_shared_cache(dvc)
+    mock_config.assert_not_called()
+
+
+@pytest.mark.skipif(shutil.which("dvc") is None, reason="dvc is not installed")
+def test_projects_share_one_copy(tmp_path, shared_cache):
+    """Test two projects importing the same data store it once and report the saving."""
+    source = make_source_repo(tmp_path, {"big.csv": "x" * 10000})
+
+    for name in ("one", "two"):
+        project = tmp_path / name
+        (project / "data" / "imports").mkdir(parents=True)
+        run(["git", "init", "-q"], project)
+        dvc = DVCAdapter(project, backend="api")
+        dvc.init()
+        assert configure_shared_cache(dvc)
+        dvc.imp(str(source), "data/final", "data/imports/source")
+
+        local_config = (project / ".dvc" / "config.local").read_text()
+        assert str(shared_cache) in local_config
+        assert "reflink,hardlink,symlink" in local_config
+        assert not (project / ".dvc" / "cache").exists()
+        assert (project / "data" / "imports" / "source" / "big.csv").read_text() == "x" * 10000
+
+    report = cache_report()
+    assert [p["path"] for p in report["projects"]] == [str(tmp_path / "one"), str(tmp_path / "two")]
+    assert report["tracked_bytes"] == 20000
+    assert 10000 <= report["stored_bytes"] < 11000
+    assert report["saved_bytes"] == report["tracked_bytes"] - report["stored_bytes"]
+
+
+def test_cache_command(tmp_path, shared_cache):
+    """Test `mintd cache` reports usage from the cache report."""
+    from mintd.cli import main
+    report = {"dir": str(shared_cache), "shared": "group", "type": "hardlink", "objects": 3,
+              "stored_bytes": 1024, "tracked_bytes": 4096, "saved_bytes": 3072,
+              "projects": [{"path": "/work/a", "outputs": 2, "tracked_bytes": 4096}]}
+
+    runner = CliRunner()
+    with patch("mintd.dvc_cache.cache_report", return_value=report):
+        result = runner.invoke(main, ["cache"])
+        as_json = runner.invoke(main, ["cache", "--json"])
+
+    assert result.exit_code == 0, result.output
+    assert "3 objects, 1.0 KB stored" in result.output
+    assert "Saved by sharing: 3.0 KB (75%)" in result.output
+    assert json.loads(as_json.output)["saved_bytes"] == 3072
+
+
+def test_format_size():
+    """Test byte counts are shown in readable units."""
+    assert format_size(512) == "512 B"
+    assert format_size(1536) == "1.5 KB"
+    assert format_size(3 * 1024 ** 3) == "3.0 GB"
+    assert format_size(2 * 1024 ** 4) == "2.0 TB"
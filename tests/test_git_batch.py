@@ -0,0 +1,48 @@
+"""Tests for the persistent git object reader."""
+
+import subprocess
+
+import pytest
+
+from mintd.git_batch import GitObjectReader, ls_tree
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A repository with a small catalog committed."""
+    def git(*args):
+        return subprocess.run(["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+                              cwd=tmp_path, check=True, capture_output=True, text=True).stdout
+
+    git("init", "-b", "main")
+    (tmp_path / "catalog" / "data").mkdir(parents=True)
+    (tmp_path / "catalog" / "data" / "a.yaml").write_text("name: a\n")
+    (tmp_path / "catalog" / "data" / "b.yaml").write_bytes(b"name: b\n" + b"\x00binary\n" * 1000)
+    (tmp_path / "README.md").write_text("readme\n")
+    git("add", ".")
+    git("commit", "-m", "catalog")
+    return tmp_path / ".git"
+
+
+def test_read_by_path_and_sha(repo):
+    """Test blobs are readable by rev:path and by SHA."""
+    tree = ls_tree(repo, "HEAD", "catalog/")
+    assert sorted(tree) == ["catalog/data/a.yaml", "catalog/data/b.yaml"]
+
+    with GitObjectReader(repo) as reader:
+        assert reader.read("HEAD:catalog/data/a.yaml") == b"name: a\n"
+        assert reader.read(tree["catalog/data/a.yaml"]) == b"name: a\n"
+        assert reader.read("HEAD:catalog/data/missing.yaml") is None
+
+
+def test_read_many_keeps_stream_aligned(repo):
+    """Test large and missing objects in one batch do not desynchronise the pipe."""
+    tree = ls_tree(repo, "HEAD", "catalog/")
+    specs = [tree["catalog/data/b.yaml"], "HEAD:nope", tree["catalog/data/a.yaml"]] * 300
+
+    with GitObjectReader(repo) as reader:
+        results = reader.read_many(specs)
+        assert results["HEAD:nope"] is None
+        assert results[tree["catalog/data/a.yaml"]] == b"name: a\n"
+        assert len(results[tree["catalog/data/b.yaml"]]) == 8 + 8 * 1000
+        assert reader.read("HEAD:README.md") == b"readme\n"
@@ -0,0 +1,203 @@
+"""Tests for the GitHub transports against a local HTTP stub server."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mintd.github_transport import (
+    FallbackTransport,
+    GhCliTransport,
+    GitHubTransportError,
+    HttpGitHubTransport,
+    get_github_transport,
+)
+
+
+def _pull(number):
+    return {"number": number, "title": f"Register data project: p{number}", "state": "open",
+            "html_url": f"https://github.com/org/registry/pull/{number}",
+            "head": {"ref": f"register-p{number}"}}
+
+
+class StubGitHub(BaseHTTPRequestHandler):
+    """Serves /repos/org/registry/pulls with pagination and ETags."""
+
+    protocol_version = "HTTP/1.1"
+    pulls = []
+    requests = []
+    connections = set()
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body=None, headers=None):
+        payload = json.dumps(body).encode() if body is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("Content-Type", "application/json")
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        StubGitHub.requests.append(("GET", self.path, self.headers.get("If-None-Match")))
+        StubGitHub.connections.add(self.client_address)
+        page = int(parse_qs(urlparse(self.path).query).get("page", ["1"])[0])
+        per_page = 2
+        items = StubGitHub.pulls[(page - 1) * per_page:page * per_page]
+        etag = f'"pulls-{len(StubGitHub.pulls)}-{page}"'
+
+        if self.headers.get("If-None-Match") == etag:
+            self._send(304, headers={"ETag": etag})
+            return
+
+        headers = {"ETag": etag}
+        if page * per_page < len(StubGitHub.pulls):
+            base = f"http://{self.headers['Host']}/repos/org/registry/pulls?state=open&page={page + 1}"
+            headers["Link"] = f'<{base}>; rel="next"'
+        self._send(200, items, headers)
+
+    def do_POST(self):
+        StubGitHub.connections.add(self.client_address)
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        StubGitHub.requests.append(("POST", self.path, body))
+        if self.headers.get("Authorization") != "Bearer secret":
+            self._send(401, {"message": "Bad credentials"})
+            return
+        pull = _pull(len(StubGitHub.pulls) + 1)
+        pull["head"]["ref"] = body["head"]
+        StubGitHub.pulls.append(pull)
+        self._send(201, pull)
+
+
+@pytest.fixture
+def stub_api():
+    """Run the stub GitHub API on a local port."""
+    StubGitHub.pulls = [_pull(i) for i in range(1, 6)]
+    StubGitHub.requests = []
+    StubGitHub.connections = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubGitHub)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestHttpGitHubTransport:
+    """Test the pooled REST transport."""
+
+    def test_list_follows_pagination_on_one_connection(self, stub_api):
+        """Test every page is fetched over a single kept-alive connection."""
+        transport = HttpGitHubTransport(token="secret", api_url=stub_api)
+
+        pulls = transport.list_pull_requests("org/registry")
+
+        assert [pr["number"] for pr in pulls] == [1, 2, 3, 4, 5]
+        assert pulls[0]["headRefName"] == "register-p1"
+        assert pulls[0]["state"] == "OPEN"
+        assert len(StubGitHub.requests) == 3
+        assert len(StubGitHub.connections) == 1
+
+    def test_list_respects_limit(self, stub_api):
+        """Test pagination stops once the limit is reached."""
+        transport = HttpGitHubTransport(api_url=stub_api)
+        assert len(transport.list_pull_requests("org/registry", limit=2)) == 2
+        assert len(StubGitHub.requests) == 1
+
+    def test_conditional_requests_reuse_etags(self, stub_api, tmp_path):
+        """Test unchanged pages come back as 304s, including from a persisted cache."""
+        etags = tmp_path / "etags.json"
+        first = HttpGitHubTransport(api_url=stub_api, etag_cache_path=etags).list_pull_requests("org/registry")
+
+        StubGitHub.requests = []
+        second = HttpGitHubTransport(api_url=stub_api, etag_cache_path=etags).list_pull_requests("org/registry")
+
+        assert first == second
+        assert all(if_none_match for _, _, if_none_match in StubGitHub.requests)
+
+    def test_create_pull_request(self, stub_api):
+        """Test PR creation posts to the API and returns the PR URL."""
+        transport = HttpGitHubTransport(token="secret", api_url=stub_api)
+
+        url = transport.create_pull_request("org/registry", "Register x", "body", head="register-x")
+
+        assert url == "https://github.com/org/registry/pull/6"
+        assert StubGitHub.requests[-1][2] == {"title": "Register x", "body": "body",
+                                              "head": "register-x", "base": "main"}
+
+    def test_http_error_raises(self, stub_api):
+        """Test API errors surface as GitHubTransportError."""
+        transport = HttpGitHubTransport(token="wrong", api_url=stub_api)
+        with pytest.raises(GitHubTransportError, match="Bad credentials"):
+            transport.create_pull_request("org/registry", "t", "b", head="h")
+
+
+class TestTransportSelection:
+    """Test fallback and transport selection."""
+
+    def test_fallback_used_after_failure(self, stub_api):
+        """Test the fallback transport is used when the primary fails."""
+        fallback = Mock(spec=GhCliTransport)
+        fallback.create_pull_request.return_value = "https://github.com/org/registry/pull/99"
+        transport = FallbackTransport(HttpGitHubTransport(token="wrong", api_url=stub_api), fallback)
+
+        assert transport.create_pull_request("org/registry", "t", "b", head="h").endswith("/99")
+
+    def test_connection_refused_is_retry_safe(self):
+        """Test a request that never reached the server may be repeated elsewhere."""
+        transport = HttpGitHubTransport(token="secret", api_url="http://127.0.0.1:1")
+        with pytest.raises(GitHubTransportError) as excinfo:
+            transport.create_pull_request("org/registry", "t", "b", head="h")
+        assert excinfo.value.retry_safe
+
+    def test_failed_create_reuses_existing_pull_request(self):
+        """Test a create that may have reached GitHub is not repeated when its PR exists."""
+        primary = Mock(spec=HttpGitHubTransport)
+        primary.create_pull_request.side_effect = GitHubTransportError("Read timed out")
+        primary.list_pull_requests.return_value = [
+            {"number": 7, "headRefName": "register-x", "url": "https://github.com/org/registry/pull/7"}
+        ]
+        fallback = Mock(spec=GhCliTransport)
+        transport = FallbackTransport(primary, fallback)
+
+        assert transport.create_pull_request("org/registry", "t", "b", head="register-x").endswith("/7")
+        fallback.create_pull_request.assert_not_called()
+
+        primary.list_pull_requests.return_value = []
+        fallback.create_pull_request.return_value = "https://github.com/org/registry/pull/8"
+        assert transport.create_pull_request("org/registry", "t", "b", head="register-x").endswith("/8")
+
+    def test_reads_fall_back_after_any_failure(self):
+        """Test listings are repeated through the fallback whatever the primary's error."""
+        primary = Mock(spec=HttpGitHubTransport)
+        primary.list_pull_requests.side_effect = GitHubTransportError("502 Bad Gateway")
+        fallback = Mock(spec=GhCliTransport)
+        fallback.list_pull_requests.return_value = []
+
+        assert FallbackTransport(primary, fallback).list_pull_requests("org/registry") == []
+        fallback.list_pull_requests.assert_called_once_with("org/registry", state="open", limit=1000)
+
+    def test_auto_without_token_uses_gh(self, monkeypatch):
+        """Test auto mode falls back to the CLI when no token can be found."""
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.delenv("GH_TOKEN", raising=False)
+        with patch("mintd.github_transport.subprocess.run", side_effect=FileNotFoundError):
+            assert isinstance(get_github_transport("auto"), GhCliTransport)
+
+    def test_auto_with_token_prefers_http(self, monkeypatch):
+        """Test auto mode uses the REST API with the CLI behind it."""
+        monkeypatch.setenv("GITHUB_TOKEN", "secret")
+        transport = get_github_transport("auto")
+        assert isinstance(transport, FallbackTransport)
+        assert isinstance(transport.primary, HttpGitHubTransport)
+
+    def test_unknown_mode(self):
+        """Test an unknown transport name is rejected."""
+        with pytest.raises(ValueError, match="Unknown GitHub transport"):
+            get_github_transport("carrier-pigeon")
@@ -5,6 +5,7 @@ from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 from mintd.initializers.git import init_git, is_git_repo
+from mintd.dvc_adapter import DVCError
 from mintd.initializers.storage import init_dvc, is_dvc_repo
 
 
@@ -59,27 +60,24 @@ def test_git_initialization(mock_cmd_available, mock_run_git):
         assert "commit" in str(call_args[2])  # commit has more complex args
 
 
-@patch('mintd.initializers.storage._run_dvc_command')
+@patch('mintd.initializers.storage.get_dvc_adapter')
 @patch('mintd.initializers.storage._is_command_available')
 @patch('mintd.config.get_config')
-def test_dvc_initialization(mock_get_config, mock_cmd_available, mock_run_dvc):
+def test_dvc_initialization(mock_get_config, mock_cmd_available, mock_get_adapter):
     """Test DVC initialization."""
     mock_cmd_available.return_value = True
-    mock_run_dvc.return_value = ""
     mock_get_config.return_value = {"storage": {}}  # No endpoint/region
+    dvc = mock_get_adapter.return_value
 
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_path = Path(temp_dir)
 
         init_dvc(temp_path, "test-bucket")
 
-        # Should have called at least dvc init and remote add
-        assert mock_run_dvc.call_count >= 2
-
-        # Check that init and remote add were called
-        call_args = [call[0][1] for call in mock_run_dvc.call_args_list]  # Get the command list
-        assert ["init"] in call_args
-        assert ["remote", "add", "--global", "-d", "storage", "s3://test-bucket/lab/"] in call_args
+        # Should have called dvc init and remote add
+        mock_get_adapter.assert_called_once_with(temp_path)
+        dvc.init.assert_called_once_with()
+        dvc.remote_add.assert_called_once_with("storage", "s3://test-bucket/lab/", default=True, level="global")
 
 
 @patch('mintd.initializers.git._run_git_command')
@@ -97,10 +95,10 @@ def test_git_command_error_handling(mock_run_git):
         mock_run_git.assert_called()
 
 
-@patch('mintd.initializers.storage._run_dvc_command')
-def test_dvc_command_error_handling(mock_run_dvc):
+@patch('mintd.initializers.storage.get_dvc_adapter')
+def test_dvc_command_error_handling(mock_get_adapter):
     """Test DVC command error handling."""
-    mock_run_dvc.side_effect = FileNotFoundError("dvc command not found")
+    mock_get_adapter.return_value.init.side_effect = DVCError("dvc command not found")
 
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_path = Path(temp_dir)
@@ -109,7 +107,4 @@ def test_dvc_command_error_handling(mock_run_dvc):
         init_dvc(temp_path, "test-bucket")
 
         # Should have tried to run dvc command
-        mock_run_dvc.assert_called()
-
-
-
+        mock_get_adapter.return_value.init.assert_called()
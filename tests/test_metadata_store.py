@@ -0,0 +1,114 @@
+"""Tests for locked, atomic metadata.json updates."""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from mintd.metadata_store import MetadataStore, MetadataStoreError, get_metadata_store
+
+
+@pytest.fixture
+def store(tmp_path):
+    """A store over a minimal metadata.json."""
+    (tmp_path / "metadata.json").write_text(json.dumps({"project": {"name": "analysis"}, "items": []}))
+    return MetadataStore(tmp_path)
+
+
+def append(value):
+    return lambda metadata: metadata["items"].append(value)
+
+
+def test_edit_writes_atomically(store):
+    """Test edits are written whole and leave no temp files behind."""
+    with store.edit() as metadata:
+        metadata["items"].append(1)
+
+    assert store.read()["items"] == [1]
+    assert store.path.read_text().endswith("}\n")
+    assert sorted(p.name for p in store.project_path.iterdir()) == [".mintd", "metadata.json"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX file modes")
+def test_edit_keeps_file_mode(store):
+    """Test replacing metadata.json keeps its permissions."""
+    os.chmod(store.path, 0o664)
+    store.update(append(1))
+    assert os.stat(store.path).st_mode & 0o777 == 0o664
+
+
+def test_failed_edit_writes_nothing(store):
+    """Test an edit that raises leaves the file untouched."""
+    before = store.path.read_text()
+    with pytest.raises(RuntimeError):
+        with store.edit() as metadata:
+            metadata["items"].append(1)
+            raise RuntimeError("interrupted")
+
+    assert store.path.read_text() == before
+
+
+def test_batch_writes_once(store):
+    """Test updates inside a batch are queued and written together."""
+    with patch("mintd.metadata_store.os.replace", wraps=os.replace) as mock_replace:
+        with store.batch():
+            for i in range(5):
+                store.update(append(i))
+            with store.batch():
+                store.update(append(5))
+            assert store.read()["items"] == []
+
+    assert store.read()["items"] == [0, 1, 2, 3, 4, 5]
+    assert mock_replace.call_count == 1
+
+
+def test_batch_flushes_on_error(store):
+    """Test queued updates describe finished work and survive an error in the batch."""
+    with pytest.raises(KeyboardInterrupt):
+        with store.batch():
+            store.update(append("done"))
+            raise KeyboardInterrupt
+
+    assert store.read()["items"] == ["done"]
+
+
+def test_missing_metadata(tmp_path):
+    """Test a missing metadata.json is reported as a store error."""
+    with pytest.raises(MetadataStoreError, match="not found"):
+        MetadataStore(tmp_path).update(append(1))
+
+
+def test_concurrent_threads_lose_nothing(store):
+    """Test updates from many threads are all kept."""
+    threads = [threading.Thread(target=lambda i=i: store.update(append(i))) for i in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(store.read()["items"]) == list(range(20))
+
+
+def test_concurrent_processes_lose_nothing(store):
+    """Test the file lock serialises updates from separate processes."""
+    script = (
+        "import sys\n"
+        "from mintd.metadata_store import MetadataStore\n"
+        "store = MetadataStore(sys.argv[1])\n"
+        "for i in range(25):\n"
+        "    store.update(lambda m, i=i: m['items'].append(f'{sys.argv[2]}-{i}'))\n"
+    )
+    procs = [subprocess.Popen([sys.executable, "-c", script, str(store.project_path), str(n)]) for n in range(4)]
+    assert all(proc.wait(timeout=60) == 0 for proc in procs)
+
+    assert len(store.read()["items"]) == 100
+
+
+def test_store_shared_per_project(tmp_path):
+    """Test one store, and so one batch, is shared per project directory."""
+    assert get_metadata_store(tmp_path) is get_metadata_store(tmp_path / ".")
+    assert get_metadata_store(tmp_path) is not get_metadata_store(tmp_path / "other")
@@ -0,0 +1,137 @@
+"""Tests for streaming product files through the block cache."""
+
+import io
+import os
+import shutil
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from mintd.product_stream import BlockCache, ProductFile, get_block_cache, open_product_file
+
+from .dvc_repos import make_source_repo
+
+needs_dvc = pytest.mark.skipif(shutil.which("dvc") is None, reason="dvc is not installed")
+
+CONTENT = bytes(range(256)) * 40  # 10240 bytes
+
+
+def counting_opener(data, seekable=True):
+    """An opener over ``data`` that records how often it was opened."""
+    opens = []
+
+    @contextmanager
+    def opener():
+        opens.append(1)
+        stream = io.BytesIO(data)
+        if not seekable:
+            stream.seekable = lambda: False
+        yield stream
+
+    return opener, opens
+
+
+def test_block_cache_evicts_least_recently_used(tmp_path):
+    """Test the cache stays under its limit by dropping the blocks read longest ago."""
+    cache = BlockCache(tmp_path, max_size=300, block_size=100)
+    for index in range(3):
+        cache.put("abcd", index, b"x" * 100)
+        os.utime(cache._block_path("abcd", index), (index, index))
+    assert cache.get("abcd", 0) == b"x" * 100  # now the most recently used
+
+    cache.put("abcd", 3, b"y" * 100)
+
+    assert cache.size() == 300
+    assert cache.get("abcd", 1) is None
+    assert cache.get("abcd", 0) is not None
+    assert cache.get("abcd", 3) == b"y" * 100
+
+
+def test_block_size_change_does_not_reuse_blocks(tmp_path):
+    """Test a cache with another block size never returns blocks cut at different offsets."""
+    opener, _ = counting_opener(CONTENT)
+    with ProductFile(opener, len(CONTENT), "abcd", BlockCache(tmp_path, 10 ** 6, block_size=1000)) as f:
+        f.read()
+
+    with io.BufferedReader(ProductFile(opener, len(CONTENT), "abcd", BlockCache(tmp_path, 10 ** 6, 4096))) as f:
+        f.seek(5000)
+        assert f.read(100) == CONTENT[5000:5100]
+
+
+def test_get_block_cache_reads_config(tmp_path):
+    """Test the block_cache config section sets location and sizes."""
+    cache = get_block_cache({"block_cache": {"dir": str(tmp_path), "max_size_gb": 1, "block_size_mb": 0.5}})
+    assert cache.root == tmp_path
+    assert cache.max_size == 1024 ** 3
+    assert cache.block_size == 512 * 1024
+
+
+@pytest.mark.parametrize("seekable", [True, False])
+def test_product_file_reads_through_cache(tmp_path, seekable):
+    """Test random reads fetch each block once and later reads come from the cache."""
+    cache = BlockCache(tmp_path, max_size=10 ** 6, block_size=1000)
+    opener, opens = counting_opener(CONTENT, seekable)
+
+    with io.BufferedReader(ProductFile(opener, len(CONTENT), "abcd", cache)) as f:
+        f.seek(9500)
+        assert f.read() == CONTENT[9500:]
+        f.seek(1234)
+        assert f.read(100) == CONTENT[1234:1334]
+        f.seek(-10, io.SEEK_END)
+        assert f.read() == CONTENT[-10:]
+
+    with io.BufferedReader(ProductFile(opener, len(CONTENT), "abcd", cache)) as f:
+        assert f.read() == CONTENT
+    assert len(opens) == (2 if seekable else 3)
+
+    opens.clear()
+    with io.BufferedReader(ProductFile(opener, len(CONTENT), "abcd", cache)) as f:
+        assert f.read() == CONTENT
+    assert opens == []
+
+
+def test_product_file_without_key_bypasses_cache(tmp_path):
+    """Test files with no DVC hash are streamed but never cached."""
+    cache = BlockCache(tmp_path, max_size=10 ** 6, block_size=1000)
+    opener, _ = counting_opener(CONTENT)
+
+    with io.BufferedReader(ProductFile(opener, None, None, cache)) as f:
+        assert f.read() == CONTENT
+    assert cache.size() == 0
+
+
+@needs_dvc
+def test_open_product_file_streams_from_remote(tmp_path):
+    """Test a product file is read from the DVC remote and then served from the cache."""
+    source = make_source_repo(tmp_path, {"table.csv": "id,value\n" + "1,2\n" * 500})
+    shutil.rmtree(source / ".dvc" / "cache")
+    product = {"repository": {"github_url": str(source)}}
+    cache = BlockCache(tmp_path / "blocks", max_size=10 ** 6, block_size=512)
+
+    with patch("mintd.data_import.query_data_product", return_value=product):
+        with open_product_file("data_claims", "data/final/table.csv", mode="r", cache=cache) as f:
+            assert f.readline() == "id,value\n"
+            f.seek(0)
+            assert len(f.read()) == 9 + 4 * 500
+
+        shutil.rmtree(tmp_path / "remote")
+        with open_product_file("data_claims", "data/final/table.csv", cache=cache) as f:
+            assert f.read().startswith(b"id,value\n1,2\n")
+
+        with pytest.raises(IsADirectoryError):
+            open_product_file("data_claims", "data/final", cache=cache)
+
+
+def test_open_command_writes_output(tmp_path):
+    """Test `mintd data open -o` copies the streamed file."""
+    from mintd.cli import main
+
+    with patch("mintd.product_stream.open_product_file", return_value=io.BytesIO(CONTENT)) as mock_open:
+        result = CliRunner().invoke(main, ["data", "open", "data_claims", "data/final/t.bin",
+                                           "--rev", "v2", "-o", str(tmp_path / "t.bin")])
+
+    assert result.exit_code == 0, result.output
+    assert (tmp_path / "t.bin").read_bytes() == CONTENT
+    mock_open.assert_called_once_with("data_claims", "data/final/t.bin", rev="v2")
@@ -0,0 +1,107 @@
+"""Tests for the durable pending-registration queue."""
+
+import json
+import threading
+
+import pytest
+
+from mintd.registration_queue import (
+    BASE_RETRY_DELAY, MAX_RETRY_DELAY, RegistrationQueue, drain_queue, retry_delay,
+)
+
+
+def _metadata(name):
+    return {"project": {"name": name, "type": "data", "full_name": f"data_{name}"}}
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return RegistrationQueue(tmp_path / "queue.db")
+
+
+def test_enqueue_deduplicates_by_project(queue, tmp_path):
+    """Test re-queuing a project replaces its entry and resets its attempts."""
+    queue.enqueue(tmp_path / "a", _metadata("alpha"), now=100)
+    job = queue.claim(now=100)[0]
+    queue.fail(job, "network down", now=100)
+
+    queue.enqueue(tmp_path / "a2", _metadata("alpha"), now=200)
+    pending = queue.pending()
+
+    assert len(pending) == 1
+    assert pending[0]["project_path"] == str(tmp_path / "a2")
+    assert pending[0]["attempts"] == 0
+    assert pending[0]["last_error"] is None
+
+
+def test_failures_back_off_exponentially(queue, tmp_path):
+    """Test failed registrations are not due again until their backoff expires."""
+    queue.enqueue(tmp_path, _metadata("alpha"), now=0)
+
+    now = 0
+    for attempt in range(1, 4):
+        job = queue.claim(now=now)[0]
+        next_attempt = queue.fail(job, "boom", now=now)
+        assert next_attempt - now == BASE_RETRY_DELAY * 2 ** (attempt - 1)
+        assert queue.claim(now=next_attempt - 1) == []
+        now = next_attempt
+
+    assert queue.pending()[0]["attempts"] == 3
+    assert retry_delay(50) == MAX_RETRY_DELAY
+    assert queue.claim(force=True, now=0)[0]["full_name"] == "data_alpha"
+
+
+def test_claims_are_exclusive(queue, tmp_path):
+    """Test a claimed registration is not handed to a second worker."""
+    queue.enqueue(tmp_path, _metadata("alpha"), now=0)
+    assert len(queue.claim(now=1)) == 1
+    assert queue.claim(now=2) == []
+
+
+def test_complete_keeps_newer_submission(queue, tmp_path):
+    """Test finishing a job does not drop a version enqueued while it ran."""
+    queue.enqueue(tmp_path, _metadata("alpha"), now=0)
+    job = queue.claim(now=0)[0]
+    queue.enqueue(tmp_path, dict(_metadata("alpha"), note="updated"), now=5)
+    queue.complete(job)
+
+    pending = queue.pending()
+    assert len(pending) == 1
+    assert pending[0]["metadata"]["note"] == "updated"
+    assert queue.claim(now=6)
+
+
+def test_drain_runs_registrations_concurrently(queue, tmp_path):
+    """Test the worker submits due registrations in parallel and requeues failures."""
+    for name in ("alpha", "beta", "gamma"):
+        queue.enqueue(tmp_path, _metadata(name))
+
+    started = threading.Barrier(2, timeout=5)
+
+    def register(metadata):
+        if metadata["project"]["name"] == "gamma":
+            raise RuntimeError("gh not authenticated")
+        started.wait()  # both successful registrations must be in flight together
+        return f"https://example.com/pr/{metadata['project']['name']}"
+
+    results = []
+    counts = drain_queue(queue, register, max_workers=3,
+                         on_result=lambda job, url, error: results.append((job["full_name"], url, error)))
+
+    assert counts == {"submitted": 2, "failed": 1}
+    assert sorted(r[0] for r in results) == ["data_alpha", "data_beta", "data_gamma"]
+    pending = queue.pending()
+    assert [job["full_name"] for job in pending] == ["data_gamma"]
+    assert pending[0]["last_error"] == "gh not authenticated"
+
+
+def test_import_legacy_files(queue, tmp_path):
+    """Test JSON files from the old pending directory are moved into the queue."""
+    legacy = tmp_path / "pending_registrations"
+    legacy.mkdir()
+    with open(legacy / "data_alpha.json", "w") as f:
+        json.dump({"project_path": str(tmp_path), "metadata": _metadata("alpha")}, f)
+
+    assert queue.import_legacy(legacy) == 1
+    assert not (legacy / "data_alpha.json").exists()
+    assert queue.pending()[0]["full_name"] == "data_alpha"
@@ -8,14 +8,19 @@ from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
 import pytest
+import yaml
 
 from mintd.registry import (
     LocalRegistry,
+    iter_catalog_summaries,
+    load_catalog_yaml,
     get_registry_client,
     load_project_metadata,
     save_pending_registration,
     get_pending_registrations,
     clear_pending_registration,
+    discover_local_projects,
+    prepare_registrations,
 )
 
 
@@ -197,67 +202,171 @@ class TestLocalRegistryIntegration:
         mock_push.assert_called_once()
         mock_pr.assert_called_once()
 
-    @patch("mintd.registry.LocalRegistry._run_git_command")
-    @patch("mintd.registry.LocalRegistry._run_gh_command")
-    def test_check_registration_status_registered(self, mock_gh, mock_git):
-        """Test checking status of registered project."""
-        # Mock git clone
-        mock_git.return_value = Mock(returncode=0, stdout="", stderr="")
-        # Mock gh pr list (no open PRs)
-        mock_gh.return_value = Mock(returncode=0, stdout='[]', stderr="")
+    @staticmethod
+    def _fake_async_commands(catalog_paths):
+        """Build a stand-in for _run_async_command serving a catalog tree."""
+        async def fake(self, *cmd):
+            if "ls-tree" in cmd:
+                return subprocess.CompletedProcess(cmd, 0, "\n".join(catalog_paths), "")
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+        return fake
 
-        registry = LocalRegistry("https://github.com/test-org/registry")
+    def test_check_registration_status_registered(self, tmp_path):
+        """Test checking status of registered project."""
+        registry = LocalRegistry("https://github.com/test-org/registry", cache_root=tmp_path)
+        fake = self._fake_async_commands(["catalog/data/test_project.yaml"])
 
-        # Mock the catalog file existing
-        with patch.object(Path, 'exists', return_value=True):
+        with patch.object(LocalRegistry, "_run_async_command", fake), \
+                patch.object(LocalRegistry, "_list_open_prs", return_value=[]):
             status = registry.check_registration_status("test_project")
 
         assert status["registered"] is True
         assert status["type"] == "data"
         assert "test_project" in status["full_name"]
+        assert status["url"].endswith("catalog/data/test_project.yaml")
 
-    @patch("mintd.registry.LocalRegistry._run_git_command")
-    @patch("mintd.registry.LocalRegistry._run_gh_command")
-    def test_check_registration_status_pending_pr(self, mock_gh, mock_git):
+    def test_check_registration_status_pending_pr(self, tmp_path):
         """Test checking status of project with pending PR."""
-        # Mock git clone
-        mock_git.return_value = Mock(returncode=0, stdout="", stderr="")
-        # Mock gh pr list (with pending PR)
-        mock_gh.return_value = Mock(returncode=0, stdout=json.dumps([
+        registry = LocalRegistry("https://github.com/test-org/registry", cache_root=tmp_path)
+        fake = self._fake_async_commands([])
+        open_prs = [
             {
                 "title": "Register data project: test_project",
                 "url": "https://github.com/test-org/registry/pull/123",
                 "headRefName": "register-test_project"
             }
-        ]), stderr="")
-
-        registry = LocalRegistry("https://github.com/test-org/registry")
+        ]
 
-        # Mock the catalog file not existing
-        with patch.object(Path, 'exists', return_value=False):
+        with patch.object(LocalRegistry, "_run_async_command", fake), \
+                patch.object(LocalRegistry, "_list_open_prs", return_value=open_prs):
             status = registry.check_registration_status("test_project")
 
         assert status["registered"] is False
         assert status["pending_pr"] == "https://github.com/test-org/registry/pull/123"
 
-    @patch("mintd.registry.LocalRegistry._run_git_command")
-    @patch("mintd.registry.LocalRegistry._run_gh_command")
-    def test_check_registration_status_not_found(self, mock_gh, mock_git):
+    def test_check_registration_status_not_found(self, tmp_path):
         """Test checking status of non-existent project."""
-        # Mock git clone
-        mock_git.return_value = Mock(returncode=0, stdout="", stderr="")
-        # Mock gh pr list (no PRs)
-        mock_gh.return_value = Mock(returncode=0, stdout='[]', stderr="")
-
-        registry = LocalRegistry("https://github.com/test-org/registry")
+        registry = LocalRegistry("https://github.com/test-org/registry", cache_root=tmp_path)
+        fake = self._fake_async_commands(["catalog/data/test_project.yaml"])
 
-        # Mock the catalog file not existing
-        with patch.object(Path, 'exists', return_value=False):
+        with patch.object(LocalRegistry, "_run_async_command", fake), \
+                patch.object(LocalRegistry, "_list_open_prs", return_value=[]):
             status = registry.check_registration_status("nonexistent_project")
 
         assert status["registered"] is False
         assert status["status"] == "not_found"
 
+    def test_check_registration_statuses_batch(self, tmp_path):
+        """Test many projects are resolved with one mirror update and one PR listing."""
+        registry = LocalRegistry("https://github.com/test-org/registry", cache_root=tmp_path)
+        calls = []
+        fake = self._fake_async_commands(["catalog/data/alpha.yaml", "catalog/projects/beta.yaml"])
+        open_prs = [{"title": "Register data project: gamma",
+                     "url": "https://github.com/test-org/registry/pull/7",
+                     "headRefName": "register-gamma"}]
+
+        async def recording(self, *cmd):
+            calls.append(cmd)
+            return await fake(self, *cmd)
+
+        with patch.object(LocalRegistry, "_run_async_command", recording), \
+                patch.object(LocalRegistry, "_list_open_prs", return_value=open_prs) as list_prs:
+            statuses = registry.check_registration_statuses(["alpha", "beta", "gamma", "delta"])
+
+        assert statuses["alpha"]["type"] == "data"
+        assert statuses["beta"]["full_name"] == "project_beta"
+        assert statuses["gamma"]["status"] == "pending_review"
+        assert statuses["delta"]["status"] == "not_found"
+        list_prs.assert_called_once()
+        assert len(calls) == 2
+
+    def test_pr_title_match_is_whole_word(self, tmp_path):
+        """Test a PR for one project is not reported for a project with a longer name."""
+        registry = LocalRegistry("https://github.com/test-org/registry", cache_root=tmp_path)
+        fake = self._fake_async_commands([])
+        open_prs = [{"title": "Register data project: alpha", "url": "u", "headRefName": "register-alpha"}]
+
+        with patch.object(LocalRegistry, "_run_async_command", fake), \
+                patch.object(LocalRegistry, "_list_open_prs", return_value=open_prs):
+            statuses = registry.check_registration_statuses(["alpha", "alpha_v2"])
+
+        assert statuses["alpha"]["status"] == "pending_review"
+        assert statuses["alpha_v2"]["status"] == "not_found"
+
+    def test_discover_local_projects(self, tmp_path):
+        """Test local projects are found by metadata.json and not searched for nested projects."""
+        for rel, name in [("one", "one"), ("group/two", "two"), ("one/nested", "nested")]:
+            project = tmp_path / rel
+            project.mkdir(parents=True)
+            (project / "metadata.json").write_text(json.dumps({"project": {"name": name, "type": "data"}}))
+        (tmp_path / "junk").mkdir()
+        (tmp_path / "junk" / "metadata.json").write_text("not json")
+
+        found = discover_local_projects(tmp_path)
+
+        assert [metadata["project"]["name"] for _, metadata in found] == ["two", "one"]
+
+    def test_prepare_registrations_in_parallel(self, tmp_path):
+        """Test bulk preparation validates entries across a process pool, keeping input order."""
+        from .registry_harness import synthetic_metadata
+
+        types = ("data", "project", "infra")
+        projects = [(tmp_path / f"p{i:03d}", synthetic_metadata(f"p{i:03d}", types[i % 3])) for i in range(300)]
+        projects[5][1]["access_control"]["teams"] = []
+
+        prepared = prepare_registrations(projects, max_workers=2)
+
+        assert [p["name"] for p in prepared] == [f"p{i:03d}" for i in range(300)]
+        assert prepared[5]["errors"] and prepared[5]["entry"] is None
+        assert not prepared[6]["errors"]
+        assert prepared[6]["entry"]["status"]["last_updated"].endswith("Z")
+        assert projects[6][1]["status"]["last_updated"] == "2025-01-01T00:00:00Z"
+
+
+class TestCatalogParsing:
+    """Test catalog YAML parsing."""
+
+    @staticmethod
+    def _write_catalog(catalog_dir, count):
+        catalog_dir.mkdir(parents=True, exist_ok=True)
+        for i in range(count):
+            (catalog_dir / f"product_{i:04d}.yaml").write_text(
+                f"project:\n  type: data\n  full_name: data_product_{i:04d}\n"
+                f"metadata:\n  description: Product {i}\n"
+            )
+
+    def test_load_catalog_yaml_is_safe(self):
+        """Test the catalog loader refuses arbitrary Python objects."""
+        with pytest.raises(yaml.YAMLError):
+            load_catalog_yaml("!!python/object/apply:os.system ['true']")
+
+    def test_iter_catalog_summaries_inline(self, tmp_path):
+        """Test small catalogs are parsed in order and malformed entries skipped."""
+        catalog_dir = tmp_path / "catalog" / "data"
+        self._write_catalog(catalog_dir, 3)
+        (catalog_dir / "broken.yaml").write_text("project: [unclosed\n")
+
+        summaries = list(iter_catalog_summaries(catalog_dir))
+
+        assert [s["name"] for s in summaries] == ["product_0000", "product_0001", "product_0002"]
+        assert summaries[1]["full_name"] == "data_product_0001"
+        assert summaries[2]["description"] == "Product 2"
+
+    def test_iter_catalog_summaries_process_pool(self, tmp_path):
+        """Test large catalogs are parsed in a pool and streamed in file order."""
+        catalog_dir = tmp_path / "catalog" / "data"
+        self._write_catalog(catalog_dir, 300)
+
+        summaries = iter_catalog_summaries(catalog_dir, max_workers=2)
+        first = next(summaries)
+
+        assert first["name"] == "product_0000"
+        assert len(list(summaries)) == 299
+
+    def test_iter_catalog_summaries_missing_dir(self, tmp_path):
+        """Test a missing catalog directory yields nothing."""
+        assert list(iter_catalog_summaries(tmp_path / "missing")) == []
+
 
 class TestRegistryClientFactory:
     """Test registry client factory functions."""
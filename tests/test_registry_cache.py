@@ -0,0 +1,322 @@
+"""Tests for the registry lookup cache."""
+
+import subprocess
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from mintd.registry import LocalRegistry
+from mintd.catalog_schema import validate_catalog_blobs
+from mintd.registry_cache import RegistryCache
+
+
+def _git(cwd, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=cwd, check=True, capture_output=True, text=True
+    )
+
+
+def _commit_entry(repo, name, description):
+    catalog_dir = repo / "catalog" / "data"
+    catalog_dir.mkdir(parents=True, exist_ok=True)
+    with open(catalog_dir / f"{name}.yaml", "w") as f:
+        yaml.dump({"project": {"name": name, "type": "data"},
+                   "metadata": {"description": description}}, f)
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-m", f"Add {name}")
+
+
+@pytest.fixture
+def registry_repo(tmp_path):
+    """A local git repository standing in for the registry."""
+    repo = tmp_path / "remote" / "test-org" / "registry"
+    repo.mkdir(parents=True)
+    _git(repo, "init", "-b", "main")
+    _commit_entry(repo, "data_alpha", "First product")
+    return repo
+
+
+class TestRegistryCache:
+    """Test RegistryCache storage and freshness checks."""
+
+    def test_head_sha_uses_ls_remote_once_within_ttl(self, registry_repo, tmp_path):
+        """Test the HEAD SHA is re-used until the TTL expires."""
+        cache = RegistryCache(str(registry_repo), str(registry_repo), ttl=60, cache_root=tmp_path / "cache")
+
+        with patch("mintd.registry_cache.subprocess.run", wraps=subprocess.run) as spy:
+            first = cache.head_sha()
+            second = cache.head_sha()
+
+        assert first == second
+        assert len(first) == 40
+        assert spy.call_count == 1
+
+    def test_head_sha_unreachable_remote(self, tmp_path):
+        """Test an unreachable remote disables cached reads."""
+        cache = RegistryCache("file:///nonexistent/registry", str(tmp_path / "missing"),
+                              ttl=0, cache_root=tmp_path / "cache")
+        assert cache.head_sha() is None
+
+    def test_put_get_and_prune(self, tmp_path):
+        """Test entries round-trip and are dropped when HEAD moves."""
+        cache = RegistryCache("https://github.com/org/registry", "unused", cache_root=tmp_path)
+        cache.record_head("a" * 40)
+        cache.put("a" * 40, "catalog/data/x.yaml", {"project": {"name": "x"}})
+        cache.put_missing("a" * 40, "catalog/data/y.yaml", "not found")
+
+        assert cache.get("a" * 40, "catalog/data/x.yaml") == {"found": True, "entry": {"project": {"name": "x"}}}
+        assert cache.get("a" * 40, "catalog/data/y.yaml")["found"] is False
+        assert cache.get("a" * 40, "catalog/data/z.yaml") is None
+
+        cache.record_head("b" * 40)
+        assert cache.get("a" * 40, "catalog/data/x.yaml") is None
+
+
+class TestCachedQueries:
+    """Test LocalRegistry lookups through the cache."""
+
+    def test_repeated_query_skips_mirror(self, registry_repo, tmp_path):
+        """Test a second lookup at the same HEAD is served from disk."""
+        registry = LocalRegistry(str(registry_repo), cache_ttl=60, cache_root=tmp_path / "cache")
+
+        with patch.object(LocalRegistry, "read_catalog_entry", autospec=True,
+                          side_effect=LocalRegistry.read_catalog_entry) as read:
+            first = registry.query_data_product("data_alpha")
+            second = LocalRegistry(str(registry_repo), cache_ttl=60,
+                                   cache_root=tmp_path / "cache").query_data_product("data_alpha")
+
+        assert first == second
+        assert first["metadata"]["description"] == "First product"
+        assert read.call_count == 1
+
+    def test_missing_product_is_cached(self, registry_repo, tmp_path):
+        """Test not-found answers are cached too."""
+        registry = LocalRegistry(str(registry_repo), cache_ttl=60, cache_root=tmp_path / "cache")
+
+        with pytest.raises(FileNotFoundError, match="Did you mean: data_alpha"):
+            registry.query_data_product("data_alpah")
+
+        with patch.object(LocalRegistry, "_mirror_head") as mirror_head:
+            with pytest.raises(FileNotFoundError, match="not found"):
+                registry.query_data_product("data_alpah")
+        mirror_head.assert_not_called()
+
+    def test_new_registry_commit_invalidates(self, registry_repo, tmp_path):
+        """Test a moved HEAD is noticed once the TTL has expired."""
+        registry = LocalRegistry(str(registry_repo), cache_ttl=0, cache_root=tmp_path / "cache")
+        assert registry.query_data_product("data_alpha")["metadata"]["description"] == "First product"
+
+        _commit_entry(registry_repo, "data_alpha", "Updated product")
+
+        assert registry.query_data_product("data_alpha")["metadata"]["description"] == "Updated product"
+
+    def test_cache_disabled_by_default(self):
+        """Test LocalRegistry does not cache unless a TTL is given."""
+        assert LocalRegistry("https://github.com/org/registry").cache is None
+
+
+class TestRegistryMirror:
+    """Test status checks against the persistent registry mirror."""
+
+    def test_statuses_from_mirror(self, registry_repo, tmp_path):
+        """Test the mirror is created once and fetched on later checks."""
+        registry = LocalRegistry(str(registry_repo), cache_root=tmp_path / "cache")
+
+        with patch.object(LocalRegistry, "_list_open_prs", return_value=[]):
+            first = registry.check_registration_statuses(["data_alpha", "data_beta"])
+            assert registry.mirror_path.exists()
+
+            _commit_entry(registry_repo, "data_beta", "Second product")
+            second = registry.check_registration_statuses(["data_alpha", "data_beta"])
+
+        assert first["data_alpha"]["registered"] is True
+        assert first["data_beta"]["status"] == "not_found"
+        assert second["data_beta"]["registered"] is True
+        assert registry.list_catalog_paths() == ["catalog/data/data_alpha.yaml", "catalog/data/data_beta.yaml"]
+
+
+class TestCatalogSearch:
+    """Test search against the catalog index stored with the cache."""
+
+    def test_search_builds_index_once_per_head(self, registry_repo, tmp_path):
+        """Test the index is stored by HEAD SHA and rebuilt after a new commit."""
+        _commit_entry(registry_repo, "data_hospital-claims", "Hospital claims by quarter")
+        registry = LocalRegistry(str(registry_repo), cache_root=tmp_path / "cache")
+
+        results = registry.search_data_products("hospital")
+        assert results[0]["name"] == "data_hospital-claims"
+
+        with patch("mintd.registry.build_catalog_index") as build:
+            registry.search_data_products("claims")
+        build.assert_not_called()
+
+        _commit_entry(registry_repo, "data_hospitals", "Hospital directory")
+        registry = LocalRegistry(str(registry_repo), cache_root=tmp_path / "cache")
+        names = [r["name"] for r in registry.search_data_products("hospital")]
+        assert set(names[:2]) == {"data_hospital-claims", "data_hospitals"}
+        assert len(list((registry.cache_dir / "index").glob("*.json"))) == 1
+
+    def test_search_empty_registry(self, tmp_path):
+        """Test a registry with no data catalog yields no results."""
+        repo = tmp_path / "remote" / "org" / "empty"
+        repo.mkdir(parents=True)
+        _git(repo, "init", "-b", "main")
+        (repo / "README.md").write_text("registry")
+        _git(repo, "add", ".")
+        _git(repo, "commit", "-m", "init")
+
+        registry = LocalRegistry(str(repo), cache_root=tmp_path / "cache")
+        assert registry.search_data_products("anything") == []
+
+
+class TestMirrorReads:
+    """Test catalog reads straight from the mirror's object database."""
+
+    def test_many_queries_share_one_git_process(self, registry_repo, tmp_path):
+        """Test lookups in one registry instance reuse a single cat-file process."""
+        _commit_entry(registry_repo, "data_beta", "Second product")
+        registry = LocalRegistry(str(registry_repo), cache_root=tmp_path / "cache")
+
+        with patch("mintd.git_batch.subprocess.Popen", wraps=subprocess.Popen) as popen:
+            assert registry.query_data_product("data_alpha")["project"]["name"] == "data_alpha"
+            assert registry.query_data_product("data_beta")["project"]["name"] == "data_beta"
+            assert [p["name"] for p in registry.list_data_products()] == ["data_alpha", "data_beta"]
+
+        cat_file_starts = [call for call in popen.call_args_list if "cat-file" in call.args[0]]
+        assert len(cat_file_starts) == 1
+        assert registry.temp_dir is None
+        registry.close()
+
+
+class TestCatalogChanges:
+    """Test the registry changefeed computed from the mirror."""
+
+    @staticmethod
+    def _head(repo):
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=repo, check=True,
+                              capture_output=True, text=True).stdout.strip()
+
+    def test_added_modified_removed(self, registry_repo, tmp_path):
+        """Test each kind of catalog change is reported with its entry."""
+        since = self._head(registry_repo)
+        _commit_entry(registry_repo, "data_beta", "Second product")
+        _commit_entry(registry_repo, "data_alpha", "Revised product")
+        (registry_repo / "README.md").write_text("not a catalog change")
+        _git(registry_repo, "add", ".")
+        _git(registry_repo, "commit", "-m", "readme")
+
+        registry = LocalRegistry(str(registry_repo), cache_root=tmp_path / "cache")
+        delta = registry.catalog_changes(since)
+
+        assert delta["from"] == since
+        assert delta["to"] == self._head(registry_repo)
+        assert [item["name"] for item in delta["added"]] == ["data_beta"]
+        assert delta["modified"][0]["entry"]["metadata"]["description"] == "Revised product"
+        assert delta["removed"] == []
+
+        _git(registry_repo, "rm", "-q", "catalog/data/data_beta.yaml")
+        _git(registry_repo, "commit", "-m", "remove beta")
+        later = LocalRegistry(str(registry_repo), cache_root=tmp_path / "cache").catalog_changes(delta["to"])
+        assert later["removed"] == [{"path": "catalog/data/data_beta.yaml", "name": "data_beta", "type": "data"}]
+
+    def test_unknown_commit(self, registry_repo, tmp_path):
+        """Test an unknown starting commit is rejected."""
+        registry = LocalRegistry(str(registry_repo), cache_root=tmp_path / "cache")
+        with pytest.raises(ValueError, match="Unknown registry commit"):
+            registry.catalog_changes("0" * 40)
+
+    def test_index_updated_incrementally(self, registry_repo, tmp_path):
+        """Test a newer index is built from the stored one plus the delta."""
+        LocalRegistry(str(registry_repo), cache_root=tmp_path / "cache").catalog_index()
+        _commit_entry(registry_repo, "data_beta", "Second product")
+
+        registry = LocalRegistry(str(registry_repo), cache_root=tmp_path / "cache")
+        with patch.object(LocalRegistry, "_scan_catalog") as full_build:
+            index = registry.catalog_index()
+
+        full_build.assert_not_called()
+        assert [entry["name"] for entry in index["entries"]] == ["data_alpha", "data_beta"]
+
+
+class TestCatalogValidation:
+    """Test catalog-wide validation against the mirror."""
+
+    def test_validate_reports_and_caches_by_blob(self, registry_repo, tmp_path):
+        """Test invalid entries are reported and unchanged blobs are not revalidated."""
+        registry = LocalRegistry(str(registry_repo), cache_root=tmp_path / "cache")
+
+        results = registry.validate_catalog()
+        assert any("missing required field 'access_control'" in error
+                   for error in results["catalog/data/data_alpha.yaml"])
+
+        _commit_entry(registry_repo, "data_beta", "Second product")
+        registry = LocalRegistry(str(registry_repo), cache_root=tmp_path / "cache")
+        with patch("mintd.registry.validate_catalog_blobs", wraps=validate_catalog_blobs) as validate:
+            results = registry.validate_catalog()
+
+        assert sorted(results) == ["catalog/data/data_alpha.yaml", "catalog/data/data_beta.yaml"]
+        assert [blob for blob, _ in validate.call_args.args[0]] == [
+            registry.catalog_tree()["catalog/data/data_beta.yaml"]
+        ]
+
+    def test_type_directory_mismatch(self, registry_repo, tmp_path):
+        """Test an entry filed under the wrong type directory is flagged."""
+        projects = registry_repo / "catalog" / "projects"
+        projects.mkdir()
+        (projects / "misfiled.yaml").write_text(yaml.dump({"project": {"name": "m", "type": "data"}}))
+        _git(registry_repo, "add", ".")
+        _git(registry_repo, "commit", "-m", "misfiled")
+
+        results = LocalRegistry(str(registry_repo), cache_root=tmp_path / "cache").validate_catalog()
+        assert any("belong in catalog/data/" in error for error in results["catalog/projects/misfiled.yaml"])
+
+
+def _commit_project(repo, name, sources):
+    catalog_dir = repo / "catalog" / "projects"
+    catalog_dir.mkdir(parents=True, exist_ok=True)
+    with open(catalog_dir / f"{name}.yaml", "w") as f:
+        yaml.dump({"project": {"name": name, "type": "project", "full_name": f"prj_{name}"},
+                   "metadata": {"data_dependencies": [{"source": source} for source in sources]}}, f)
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-m", f"Add {name}")
+
+
+class TestDependencyQueries:
+    """Test dependents and impact answered from the catalog index."""
+
+    def test_direct_and_transitive_dependents(self, registry_repo, tmp_path):
+        """Test data and project entries both contribute dependency edges."""
+        _commit_project(registry_repo, "claims-model", ["data_alpha"])
+        catalog_dir = registry_repo / "catalog" / "data"
+        with open(catalog_dir / "data_derived.yaml", "w") as f:
+            yaml.dump({"project": {"name": "data_derived", "type": "data"},
+                       "metadata": {"data_dependencies": [{"source": "data_alpha"}]}}, f)
+        _git(registry_repo, "add", ".")
+        _git(registry_repo, "commit", "-m", "Add data_derived")
+        _commit_project(registry_repo, "report", ["data_derived"])
+
+        registry = LocalRegistry(str(registry_repo), cache_root=tmp_path / "cache")
+        direct = registry.dependents("data_alpha")
+        assert [d["name"] for d in direct] == ["data_derived", "prj_claims-model"]
+
+        report = registry.impact("data_alpha")
+        assert [(d["name"], d["depth"]) for d in report["dependents"]] == [
+            ("data_derived", 1), ("prj_claims-model", 1), ("prj_report", 2)]
+        assert report["projects"] == ["prj_claims-model", "prj_report"]
+        assert registry.dependents("data_unused") == []
+
+    def test_graph_updated_incrementally(self, registry_repo, tmp_path):
+        """Test a new commit patches the stored graph instead of re-reading the catalog."""
+        _commit_project(registry_repo, "claims-model", ["data_alpha"])
+        registry = LocalRegistry(str(registry_repo), cache_root=tmp_path / "cache")
+        assert [d["name"] for d in registry.dependents("data_alpha")] == ["prj_claims-model"]
+
+        _commit_project(registry_repo, "claims-model", [])
+        _commit_project(registry_repo, "forecast", ["data_alpha"])
+        registry = LocalRegistry(str(registry_repo), cache_root=tmp_path / "cache")
+        with patch.object(LocalRegistry, "_scan_catalog") as full_build:
+            names = [d["name"] for d in registry.dependents("data_alpha")]
+        full_build.assert_not_called()
+        assert names == ["prj_forecast"]
@@ -0,0 +1,111 @@
+"""End-to-end registry tests against the offline registry harness."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from mintd.cli import main
+from mintd.registry import save_pending_registration
+
+from .registry_harness import RegistryHarness, synthetic_metadata
+
+
+@pytest.fixture
+def harness(tmp_path):
+    """A 50-entry local registry with the fake gh on PATH."""
+    harness = RegistryHarness(tmp_path, entries=50)
+    with harness.activate():
+        yield harness
+
+
+def test_list_and_query(harness):
+    """Test listing and querying the synthetic catalog."""
+    registry = harness.registry()
+
+    products = registry.list_data_products()
+    assert len(products) == 50
+    assert products[0]["name"] == "data_synthetic-product-00000"
+
+    entry = registry.query_data_product("data_synthetic-product-00007")
+    assert entry["metadata"]["description"] == "Synthetic data product number 7"
+
+
+def test_register_then_status(harness):
+    """Test a registration opens a PR and is reported registered once merged."""
+    registry = harness.registry()
+
+    pr_url = registry.register_project(synthetic_metadata("harness_new"))
+    assert pr_url.endswith("/pull/1")
+    assert harness.open_prs()[0]["headRefName"] == "register-harness_new"
+
+    assert registry.check_registration_status("harness_new")["status"] == "pending_review"
+
+    harness.merge(1)
+    status = registry.check_registration_status("harness_new")
+    assert status["registered"] is True
+    assert status["full_name"] == "data_harness_new"
+
+
+def test_status_batch_uses_one_pr_listing(harness):
+    """Test a batch status check lists PRs once regardless of project count."""
+    names = [f"synthetic-product-{i:05d}" for i in range(20)]
+    statuses = harness.registry().check_registration_statuses(names)
+
+    assert all(not status["registered"] for status in statuses.values())
+    assert sum(1 for call in harness.gh_calls() if call[:2] == ["pr", "list"]) == 1
+
+
+def test_sync_processes_pending_registrations(harness, tmp_path):
+    """Test 'mintd registry sync' registers queued projects."""
+    save_pending_registration(tmp_path, synthetic_metadata("queued"))
+
+    result = CliRunner().invoke(main, ["registry", "sync"])
+
+    assert result.exit_code == 0, result.output
+    assert "1 successful, 0 failed" in result.output
+    assert harness.open_prs()[0]["headRefName"] == "register-queued"
+
+
+def test_worker_drains_queue(harness, tmp_path):
+    """Test 'mintd registry worker' submits due registrations and empties the queue."""
+    save_pending_registration(tmp_path, synthetic_metadata("worker_queued"))
+
+    listed = CliRunner().invoke(main, ["registry", "worker", "--list"])
+    result = CliRunner().invoke(main, ["registry", "worker"])
+
+    assert "data_worker_queued" in listed.output
+    assert result.exit_code == 0, result.output
+    assert "1 submitted, 0 failed, 0 still queued" in result.output
+    assert harness.open_prs()[0]["headRefName"] == "register-worker_queued"
+
+
+def test_recursive_register_submits_one_pr(harness, tmp_path):
+    """Test 'register --recursive' validates every project and opens a single PR for the new ones."""
+    root = tmp_path / "lab"
+    for name in ("alpha", "beta", "gamma"):
+        (root / name).mkdir(parents=True)
+        with open(root / name / "metadata.json", "w") as f:
+            json.dump(synthetic_metadata(name), f)
+    broken = synthetic_metadata("broken")
+    broken["access_control"]["teams"] = []
+    (root / "nested" / "broken").mkdir(parents=True)
+    with open(root / "nested" / "broken" / "metadata.json", "w") as f:
+        json.dump(broken, f)
+
+    harness.registry().register_project(synthetic_metadata("gamma"))
+    harness.merge(1)
+
+    result = CliRunner().invoke(main, ["registry", "register", "--recursive", str(root)])
+
+    assert result.exit_code == 0, result.output
+    assert "1 registered, 0 pending, 1 invalid, 2 to register" in result.output
+    prs = harness.open_prs()
+    assert len(prs) == 1
+    assert prs[0]["title"] == "Register 2 projects"
+    assert sum(1 for call in harness.gh_calls() if call[:2] == ["pr", "create"]) == 2
+
+    statuses = harness.registry().check_registration_statuses(["alpha", "beta", "broken"])
+    assert statuses["alpha"]["pending_pr"] == prs[0]["url"]
+    assert statuses["beta"]["status"] == "pending_review"
+    assert statuses["broken"]["status"] == "not_found"
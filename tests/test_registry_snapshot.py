@@ -0,0 +1,194 @@
+"""Tests for offline registry snapshot bundles."""
+
+import importlib.util
+import os
+import subprocess
+import tarfile
+from pathlib import Path
+from unittest.mock import patch
+
+import jinja2
+import pytest
+import yaml
+
+from mintd.registry import LocalRegistry, query_registry_for_product
+from mintd.registry_snapshot import (
+    clear_snapshot, get_active_snapshot, import_snapshot_bundle,
+)
+
+
+def _git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True,
+                   env={**os.environ, "GIT_AUTHOR_NAME": "t", "GIT_AUTHOR_EMAIL": "t@example.com",
+                        "GIT_COMMITTER_NAME": "t", "GIT_COMMITTER_EMAIL": "t@example.com"})
+
+
+@pytest.fixture
+def bundle(tmp_path):
+    """A snapshot bundle exported from a two-entry registry."""
+    repo = tmp_path / "remote" / "test-org" / "registry"
+    (repo / "catalog" / "data").mkdir(parents=True)
+    (repo / "catalog" / "projects").mkdir(parents=True)
+    for name in ("data_hospital-claims", "data_census-tracts"):
+        with open(repo / "catalog" / "data" / f"{name}.yaml", "w") as f:
+            yaml.dump({"project": {"name": name, "type": "data"},
+                       "metadata": {"description": f"{name} description"},
+                       "repository": {"github_url": f"https://github.com/test-org/{name}"},
+                       "storage": {"dvc": {"remote_name": name, "remote_url": f"s3://lab/{name}/"}}}, f)
+    with open(repo / "catalog" / "projects" / "model.yaml", "w") as f:
+        yaml.dump({"project": {"name": "model", "type": "project", "full_name": "prj_model"}}, f)
+    _git(repo, "init", "-b", "main")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-m", "init")
+
+    registry = LocalRegistry(str(repo), cache_root=tmp_path / "cache")
+    manifest = registry.export_snapshot(tmp_path / "snapshot.tar.gz")
+    registry.close()
+    assert manifest["entries"] == 3
+    return tmp_path / "snapshot.tar.gz"
+
+
+def test_export_contains_catalog_and_index(bundle):
+    """Test the bundle holds the manifest, the index and every catalog file."""
+    with tarfile.open(bundle, "r:gz") as tar:
+        names = set(tar.getnames())
+    assert {"manifest.json", "index.json", "catalog/data/data_hospital-claims.yaml",
+            "catalog/projects/model.yaml"} <= names
+
+
+def test_import_and_read(bundle, tmp_path):
+    """Test an imported snapshot answers lookups and suggestions."""
+    target = tmp_path / "snapshot"
+    manifest = import_snapshot_bundle(bundle, target)
+    snapshot = get_active_snapshot(target)
+
+    assert snapshot.sha == manifest["sha"]
+    assert snapshot.query_data_product("data_census-tracts")["metadata"]["description"] == \
+        "data_census-tracts description"
+    assert snapshot.query_data_product("data_missing") is None
+    assert snapshot.suggest("data_hospital-claim") == ["data_hospital-claims"]
+    assert [p["name"] for p in snapshot.iter_data_products()] == ["data_census-tracts", "data_hospital-claims"]
+
+    assert clear_snapshot(target) is True
+    assert get_active_snapshot(target) is None
+
+
+def test_import_rejects_unsafe_members(tmp_path):
+    """Test bundles with paths outside the snapshot are refused."""
+    evil = tmp_path / "evil.tar.gz"
+    payload = tmp_path / "payload"
+    payload.write_text("x")
+    with tarfile.open(evil, "w:gz") as tar:
+        tar.add(payload, arcname="../escape.txt")
+
+    with pytest.raises(ValueError, match="Unexpected entry"):
+        import_snapshot_bundle(evil, tmp_path / "snapshot")
+    assert not (tmp_path / "escape.txt").exists()
+    assert not (tmp_path / "snapshot").exists()
+
+
+def test_query_registry_for_product_uses_snapshot(bundle, tmp_path):
+    """Test registry and enclave lookups never build a client when a snapshot is imported."""
+    from mintd.enclave_commands import get_repo_info
+
+    target = tmp_path / "snapshot"
+    manifest = import_snapshot_bundle(bundle, target)
+
+    with patch("mintd.registry_snapshot.SNAPSHOT_DIR", target), \
+            patch("mintd.config.get_registry_url", return_value=manifest["registry_url"] + ".git"), \
+            patch("mintd.registry.get_registry_client") as client:
+        found = query_registry_for_product("data_hospital-claims")
+        missing = query_registry_for_product("data_hospital-claim")
+        info = get_repo_info("data_census-tracts")
+
+    client.assert_not_called()
+    assert found["exists"] is True
+    assert missing == {"exists": False}
+    assert info["dvc_remote_url"] == "s3://lab/data_census-tracts/"
+
+
+def test_snapshot_of_another_registry_is_ignored(bundle, tmp_path, capsys):
+    """Test a snapshot is only used for the registry it was exported from, and announced."""
+    target = tmp_path / "snapshot"
+    manifest = import_snapshot_bundle(bundle, target)
+    live = {"project": {"name": "data_hospital-claims"}}
+
+    with patch("mintd.registry_snapshot.SNAPSHOT_DIR", target), \
+            patch("mintd.registry._snapshot_notices", set()), \
+            patch("mintd.registry.get_registry_client") as client:
+        client.return_value.query_data_product.return_value = live
+        with patch("mintd.config.get_registry_url", return_value="https://github.com/other-org/registry"):
+            assert query_registry_for_product("data_hospital-claims") == {"exists": True, "catalog_data": live}
+        assert "Ignoring registry snapshot" in capsys.readouterr().err
+
+        with patch("mintd.config.get_registry_url", return_value=manifest["registry_url"]):
+            assert query_registry_for_product("data_hospital-claims")["snapshot"] == manifest["sha"]
+            query_registry_for_product("data_census-tracts")
+        notice = capsys.readouterr().err
+        assert notice.count(manifest["sha"][:12]) == 1
+        assert "exported less than a minute ago" in notice
+
+
+def _enclave_registry(tmp_path):
+    """Render the enclave registry.py into a scratch enclave and import it."""
+    files_dir = Path(__file__).parent.parent / "src" / "mintd" / "files"
+    source = jinja2.Environment(loader=jinja2.FileSystemLoader(str(files_dir))) \
+        .get_template("registry.py.j2").render(full_project_name="enclave_test")
+    enclave = tmp_path / "enclave"
+    (enclave / "src").mkdir(parents=True)
+    (enclave / "src" / "registry.py").write_text(source)
+
+    spec = importlib.util.spec_from_file_location("enclave_registry", enclave / "src" / "registry.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_enclave_registry_script_reads_snapshot(bundle, tmp_path):
+    """Test the generated enclave registry.py imports a bundle and reads from it."""
+    module = _enclave_registry(tmp_path)
+
+    module.import_registry_snapshot(bundle)
+    with patch.object(module, "clone_or_update_registry") as clone:
+        info = module.query_registry_for_product("data_hospital-claims")
+        products = [p["repo"] for p in module.iter_available_products()]
+
+    clone.assert_not_called()
+    assert info["catalog_data"]["project"]["name"] == "data_hospital-claims"
+    assert len(products) == 2
+
+
+def test_enclave_registry_script_checks_snapshot(bundle, tmp_path, capsys):
+    """Test the enclave registry.py only reads a snapshot of its registry, says how old it is, and clears it."""
+    module = _enclave_registry(tmp_path)
+    module.import_registry_snapshot(bundle)
+    registry_url = module._load_snapshot_manifest(module.REGISTRY_SNAPSHOT_DIR)["registry_url"]
+
+    with patch("mintd.registry_snapshot.SNAPSHOT_DIR", tmp_path / "no-snapshot"):
+        module.save_manifest({"registry_url": "https://github.com/other-org/registry"})
+        assert module.get_registry_snapshot_path() is None
+        assert "Ignoring registry snapshot" in capsys.readouterr().err
+
+        module.save_manifest({"registry_url": registry_url})
+        assert module.get_registry_snapshot_path() == module.REGISTRY_SNAPSHOT_DIR
+        assert "exported less than a minute ago" in capsys.readouterr().err
+
+        assert module.clear_registry_snapshot() is True
+        assert module.get_registry_snapshot_path() is None
+
+
+def test_snapshot_cli_import_and_clear(bundle, tmp_path):
+    """Test the snapshot import and clear commands."""
+    from click.testing import CliRunner
+    from mintd.cli import main
+
+    target = tmp_path / "snapshot"
+    runner = CliRunner()
+    with patch("mintd.registry_snapshot.SNAPSHOT_DIR", target):
+        imported = runner.invoke(main, ["registry", "snapshot", "import", str(bundle)])
+        cleared = runner.invoke(main, ["registry", "snapshot", "clear"])
+
+    assert imported.exit_code == 0
+    assert "3 catalog files" in imported.output
+    assert cleared.exit_code == 0
+    assert not target.exists()
@@ -0,0 +1,117 @@
+"""Tests for cached source repository mirrors and DVC's use of them."""
+
+import shutil
+import subprocess
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from mintd.dvc_adapter import DVCAdapter
+from mintd.source_mirror import SourceMirror, _dvc_clones, use_mirror_for_dvc
+
+from .dvc_repos import make_source_repo, run
+
+needs_dvc = pytest.mark.skipif(shutil.which("dvc") is None, reason="dvc is not installed")
+
+
+@pytest.fixture
+def clones():
+    """DVC's per-process clone table, restored after the test."""
+    from dvc.repo import open_repo
+
+    saved = dict(open_repo.CLONES)
+    yield open_repo.CLONES
+    open_repo.CLONES.clear()
+    open_repo.CLONES.update(saved)
+
+
+@pytest.fixture
+def mirrors(tmp_path):
+    """Mirrors cached under the test's directory, one per URL."""
+    with patch("mintd.source_mirror.SOURCE_CACHE_ROOT", tmp_path / "sources"), \
+            patch("mintd.source_mirror._mirrors", {}):
+        yield tmp_path / "sources"
+
+
+def test_sync_replaces_blobless_clone(tmp_path):
+    """Test a blob-less mirror left by an older mintd is replaced by a full clone."""
+    source = tmp_path / "source"
+    source.mkdir()
+    run(["git", "init", "-q"], source)
+    (source / "table.dvc").write_text("outs: []\n")
+    run(["git", "add", "-A"], source)
+    run(["git", "commit", "-q", "-m", "one"], source)
+
+    url = source.as_uri()
+    mirror = SourceMirror(url, cache_root=tmp_path / "sources")
+    mirror.path.parent.mkdir(parents=True)
+    run(["git", "clone", "-q", "--bare", "--filter=blob:none", url, str(mirror.path)], tmp_path)
+    assert mirror._partial()
+
+    mirror.sync()
+    assert not mirror._partial()
+    assert mirror.read(f"{mirror.resolve()}:table.dvc") == b"outs: []\n"
+    assert [p.name for p in mirror.path.parent.iterdir()] == [mirror.path.name]
+
+
+def test_local_paths_are_left_to_dvc(tmp_path, clones):
+    """Test DVC keeps opening local repositories in place."""
+    assert use_mirror_for_dvc(str(tmp_path)) is None
+    assert str(tmp_path) not in clones
+
+
+def test_untested_dvc_clones_the_source_itself(tmp_path, clones, mirrors, caplog):
+    """Test DVC's private clone table is left alone, with a warning, on an untested DVC release."""
+    url = make_source_repo(tmp_path / "a", {"table.csv": "a,1\n"}).as_uri()
+
+    with patch("dvc.__version__", "4.0.0"), patch("mintd.source_mirror._dvc_clones_unsupported", None):
+        assert use_mirror_for_dvc(url) is None
+
+    assert url not in clones
+    assert "DVC 4.0.0 is not a tested release" in caplog.text
+
+
+def test_mirror_is_fetched_once_unless_refreshed(tmp_path, clones, mirrors):
+    """Test repeated DVC operations on a source fetch it once, and updates fetch it again."""
+    url = make_source_repo(tmp_path / "a", {"table.csv": "a,1\n"}).as_uri()
+
+    with patch.object(SourceMirror, "sync", autospec=True, side_effect=SourceMirror.sync) as sync:
+        clone_path = use_mirror_for_dvc(url)
+        assert use_mirror_for_dvc(url) == clone_path
+        assert use_mirror_for_dvc(url, refresh=True) == clone_path
+
+    assert [c[1]["force"] for c in sync.call_args_list] == [False, False, True]
+
+
+@needs_dvc
+def test_imports_clone_from_mirror(tmp_path, clones, mirrors):
+    """Test import and update read the source through its mirror and record the source URL."""
+    source = make_source_repo(tmp_path / "a", {"table.csv": "a,1\n"})
+    url = source.as_uri()
+    project = tmp_path / "project"
+    project.mkdir()
+    run(["git", "init", "-q"], project)
+    run(["dvc", "init", "-q"], project)
+    (project / "data" / "imports").mkdir(parents=True)
+    dvc = DVCAdapter(project, backend="api")
+
+    with patch("dvc.scm.clone", side_effect=AssertionError("cloned the source")):
+        dvc.imp(url, "data/final", "data/imports/a")
+        clone_path = clones[url][0]
+        assert clone_path in _dvc_clones
+        assert (project / "data/imports/a/table.csv").read_text() == "a,1\n"
+        stage = yaml.safe_load((project / "data/imports/a.dvc").read_text())
+        assert stage["deps"][0]["repo"]["url"] == url
+
+        (source / "data" / "final" / "table.csv").write_text("a,2\n")
+        run(["dvc", "add", "-q", "data/final"], source)
+        run(["dvc", "push", "-q"], source)
+        run(["git", "commit", "-q", "-am", "new version"], source)
+        dvc.update(["data/imports/a.dvc"])
+
+    assert (project / "data/imports/a/table.csv").read_text() == "a,2\n"
+    assert clones[url][0] == clone_path
+    origin = subprocess.run(["git", "remote", "get-url", "origin"], cwd=clone_path, capture_output=True,
+                            text=True, check=True).stdout.strip()
+    assert origin == str(mirrors / next(p.name for p in mirrors.iterdir()))